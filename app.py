@@ -20,20 +20,30 @@ sys.path.append(os.path.dirname(os.path.abspath(__file__)))
 
 # Importar módulos do projeto
 try:
-    from .excel_utils import ler_planilha_colaboradores, ler_planilha_feriados, criar_template_colaboradores
+    from .excel_utils import (ler_planilha_colaboradores, ler_planilha_excecoes, ler_planilha_feriados,
+                              criar_template_colaboradores)
     from .escala_generator import GeradorEscala
     from .pdf_exporter import PDFExporter
+    from .diagnosticos import ColetorDiagnosticos
 except ImportError as e:
     # Tentar import absoluto como fallback
     try:
-        from excel_utils import ler_planilha_colaboradores, ler_planilha_feriados, criar_template_colaboradores
+        from excel_utils import (ler_planilha_colaboradores, ler_planilha_excecoes, ler_planilha_feriados,
+                                 criar_template_colaboradores)
         from escala_generator import GeradorEscala
         from pdf_exporter import PDFExporter
+        from diagnosticos import ColetorDiagnosticos
     except ImportError as e2:
         st.error(f"Erro ao importar módulos: {str(e2)}")
         st.error("Verifique se todos os arquivos estão presentes no diretório app/")
         st.stop()
 
+def exibir_diagnosticos(diagnosticos):
+    """Exibe os avisos registrados pela leitura das planilhas e pela geração das escalas."""
+    exibir = {'info': st.info, 'aviso': st.warning, 'erro': st.error}
+    for diagnostico in diagnosticos:
+        exibir[diagnostico.nivel](diagnostico.mensagem)
+
 def main():
     """Função principal da aplicação Streamlit."""
     
@@ -107,15 +117,20 @@ def main():
             - **Turno**: Turno de trabalho (Manhã, Tarde, Noite, Dia)
             
             **Colunas opcionais:**
-            - **Atestados**: Datas de atestados (separadas por vírgula)
-            - **Ferias**: Período de férias (DD/MM/YYYY-DD/MM/YYYY)
-            - **Escalas_Manuais**: Datas de escalas manuais (separadas por vírgula)
+            - **Atestados**: Datas ou períodos de atestados (separados por vírgula)
+            - **Ferias**: Períodos de férias (DD/MM/YYYY-DD/MM/YYYY, separados por vírgula)
+            - **Escalas_Manuais**: Datas ou períodos de escalas manuais (separados por vírgula)
             - **Ultimo_Plantao_Mes_Anterior**: Último plantão do mês anterior (DD/MM/YYYY) - para plantões
             - **Ultimo_Domingo_Folga**: Último domingo de folga (DD/MM/YYYY) - para escalas 6x1
             
             **Observações importantes:**
             - Para plantões (P_D, P_N, I_D, I_N): O sistema determina automaticamente se deve ser par ou ímpar baseado no último plantão
             - Para escalas 6x1: O sistema calcula corretamente as semanas sem domingo baseado no último domingo informado
+            
+            **Aba opcional "Excecoes"** (uma linha por exceção, em vez de listas nas colunas acima):
+            - **Nome** (ou **Id**): Colaborador da exceção
+            - **Tipo**: Atestado, Ferias ou Escala_Manual
+            - **Inicio** / **Fim**: Período da exceção (Fim vazio para um único dia)
             """)
         
         # Upload da planilha de feriados
@@ -170,8 +185,13 @@ def main():
         try:
             # Ler dados
             with st.spinner("Lendo planilha de colaboradores..."):
-                df_colaboradores = ler_planilha_colaboradores(arquivo_colaboradores)
+                diagnosticos_leitura = ColetorDiagnosticos()
+                df_colaboradores = ler_planilha_colaboradores(arquivo_colaboradores, diagnosticos_leitura)
+                df_excecoes = ler_planilha_excecoes(arquivo_colaboradores, diagnosticos_leitura)
+                exibir_diagnosticos(diagnosticos_leitura)
                 st.success(f"✅ {len(df_colaboradores)} colaboradores carregados")
+                if df_excecoes is not None:
+                    st.success(f"✅ {len(df_excecoes)} exceções carregadas da aba Excecoes")
             
             with st.spinner("Lendo planilha de feriados..."):
                 df_feriados = ler_planilha_feriados(arquivo_feriados)
@@ -181,7 +201,8 @@ def main():
             if st.button("🚀 Gerar Escala", type="primary"):
                 with st.spinner("Gerando escala..."):
                     gerador = GeradorEscala(data_inicio, data_fim, df_feriados)
-                    escala_completa = gerador.gerar_escala_completa(df_colaboradores)
+                    escala_completa = gerador.gerar_escala_completa(df_colaboradores, excecoes=df_excecoes)
+                    exibir_diagnosticos(gerador.diagnosticos)
                     
                     st.success("✅ Escala gerada com sucesso!")
                     
@@ -224,7 +245,7 @@ def main():
                     
                     with col2:
                         # Relatório Plantões
-                        relatorio_plantoes = gerador.gerar_relatorio_plantoes(escala_completa)
+                        relatorio_plantoes = gerador.gerar_relatorio_plantoes(gerador.matriz_escala)
                         if not relatorio_plantoes.empty:
                             st.subheader("🏥 Controle Plantões")
                             
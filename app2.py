@@ -20,22 +20,32 @@ sys.path.append(os.path.dirname(os.path.abspath(__file__)))
 
 # Importar módulos do projeto
 try:
-    from .excel_utils import ler_planilha_colaboradores, ler_planilha_feriados, criar_template_colaboradores
+    from .excel_utils import (ler_planilha_colaboradores, ler_planilha_excecoes, ler_planilha_feriados,
+                              criar_template_colaboradores)
     from .escala_generator import GeradorEscala
     from .pdf_exporter import PDFExporter
     from .colaborador_form import FormularioColaboradores
+    from .diagnosticos import ColetorDiagnosticos
 except ImportError as e:
     # Tentar import absoluto como fallback
     try:
-        from excel_utils import ler_planilha_colaboradores, ler_planilha_feriados, criar_template_colaboradores
+        from excel_utils import (ler_planilha_colaboradores, ler_planilha_excecoes, ler_planilha_feriados,
+                                 criar_template_colaboradores)
         from escala_generator import GeradorEscala
         from pdf_exporter import PDFExporter
         from colaborador_form import FormularioColaboradores
+        from diagnosticos import ColetorDiagnosticos
     except ImportError as e2:
         st.error(f"Erro ao importar módulos: {str(e2)}")
         st.error("Verifique se todos os arquivos estão presentes no diretório app/")
         st.stop()
 
+def exibir_diagnosticos(diagnosticos):
+    """Exibe os avisos registrados pela leitura das planilhas e pela geração das escalas."""
+    exibir = {'info': st.info, 'aviso': st.warning, 'erro': st.error}
+    for diagnostico in diagnosticos:
+        exibir[diagnostico.nivel](diagnostico.mensagem)
+
 def main():
     """Função principal da aplicação Streamlit."""
     
@@ -176,15 +186,20 @@ def renderizar_gerador_escalas():
             - **Turno**: Turno de trabalho (Manhã, Tarde, Noite, Dia)
             
             **Colunas opcionais:**
-            - **Atestados**: Datas de atestados (separadas por vírgula)
-            - **Ferias**: Período de férias (DD/MM/YYYY-DD/MM/YYYY)
-            - **Escalas_Manuais**: Datas de escalas manuais (separadas por vírgula)
+            - **Atestados**: Datas ou períodos de atestados (separados por vírgula)
+            - **Ferias**: Períodos de férias (DD/MM/YYYY-DD/MM/YYYY, separados por vírgula)
+            - **Escalas_Manuais**: Datas ou períodos de escalas manuais (separados por vírgula)
             - **Ultimo_Plantao_Mes_Anterior**: Último plantão do mês anterior (DD/MM/YYYY) - para plantões
             - **Ultimo_Domingo_Folga**: Último domingo de folga (DD/MM/YYYY) - para escalas 6x1
             
             **Observações importantes:**
             - Para plantões (P_D, P_N, I_D, I_N): O sistema determina automaticamente se deve ser par ou ímpar baseado no último plantão
             - Para escalas 6x1: O sistema calcula corretamente as semanas sem domingo baseado no último domingo informado
+            
+            **Aba opcional "Excecoes"** (uma linha por exceção, em vez de listas nas colunas acima):
+            - **Nome** (ou **Id**): Colaborador da exceção
+            - **Tipo**: Atestado, Ferias ou Escala_Manual
+            - **Inicio** / **Fim**: Período da exceção (Fim vazio para um único dia)
             """)
         
         # Upload da planilha de feriados
@@ -229,6 +244,12 @@ def renderizar_gerador_escalas():
             - **P_N**: Plantão Par - Noite (dias pares do mês)
             - **I_D**: Plantão Ímpar - Dia (dias ímpares do mês)
             - **I_N**: Plantão Ímpar - Noite (dias ímpares do mês)
+
+            **Escalas rotativas** (ciclo contado a partir do Ultimo_Plantao_Mes_Anterior):
+            - **D12X36** / **N12X36**: 12x36 - Dia / Noite
+            - **24X72**: 24x72 - Dia
+            - **M5X2**, **T5X2**, **N5X2**: 5x2 rotativo
+            - **M4X2**, **T4X2**, **N4X2**: 4x2
             """)
     
     # Processamento dos dados
@@ -247,6 +268,7 @@ def renderizar_gerador_escalas():
         
         try:
             # Ler dados de colaboradores
+            df_excecoes = None
             if st.session_state.get('df_colaboradores_formulario') is not None:
                 df_colaboradores = st.session_state.df_colaboradores_formulario
                 st.success(f"✅ {len(df_colaboradores)} colaboradores carregados do formulário")
@@ -256,8 +278,13 @@ def renderizar_gerador_escalas():
                     st.dataframe(df_colaboradores[['Nome', 'Cargo', 'Tipo_Escala', 'Turno']], use_container_width=True)
             else:
                 with st.spinner("Lendo planilha de colaboradores..."):
-                    df_colaboradores = ler_planilha_colaboradores(arquivo_colaboradores)
+                    diagnosticos_leitura = ColetorDiagnosticos()
+                    df_colaboradores = ler_planilha_colaboradores(arquivo_colaboradores, diagnosticos_leitura)
+                    df_excecoes = ler_planilha_excecoes(arquivo_colaboradores, diagnosticos_leitura)
+                    exibir_diagnosticos(diagnosticos_leitura)
                     st.success(f"✅ {len(df_colaboradores)} colaboradores carregados do arquivo")
+                    if df_excecoes is not None:
+                        st.success(f"✅ {len(df_excecoes)} exceções carregadas da aba Excecoes")
             
             # Ler dados de feriados
             with st.spinner("Lendo planilha de feriados..."):
@@ -267,15 +294,26 @@ def renderizar_gerador_escalas():
             # Gerar escala
             if st.button("🚀 Gerar Escala", type="primary"):
                 with st.spinner("Gerando escala..."):
-                    gerador = GeradorEscala(data_inicio, data_fim, df_feriados)
-                    escala_completa = gerador.gerar_escala_completa(df_colaboradores)
+                    # Mesmo período e feriados: reaproveitar o gerador e recalcular só os colaboradores alterados
+                    gerador = st.session_state.get('gerador')
+                    feriados_anteriores = st.session_state.get('feriados_gerador')
+                    if gerador is None or (gerador.data_inicio, gerador.data_fim) != (data_inicio, data_fim) \
+                            or feriados_anteriores is None or not feriados_anteriores.equals(df_feriados):
+                        gerador = GeradorEscala(data_inicio, data_fim, df_feriados)
+                    escala_completa = gerador.atualizar(df_colaboradores, excecoes=df_excecoes)
+                    exibir_diagnosticos(gerador.diagnosticos)
                     
                     # Salvar escala no session_state para evitar perda
                     st.session_state.escala_completa = escala_completa
-                    st.session_state.escala_formatada = gerador.exportar_escala_formatada(escala_completa)
+                    st.session_state.escala_formatada = gerador.exportar_escala_formatada(gerador.matriz_escala)
                     st.session_state.gerador = gerador
+                    st.session_state.feriados_gerador = df_feriados
                     
                     st.success("✅ Escala gerada com sucesso!")
+                    
+                    estatisticas = gerador.estatisticas_execucao
+                    if estatisticas:
+                        st.caption(f"⚡ {estatisticas['colaboradores']} colaboradores ({estatisticas['recalculados']} recalculados) | {estatisticas['escalas_base_distintas']} escalas base distintas | reaproveitamento {estatisticas['razao_deduplicacao']}x | cache: {estatisticas['cache']['taxa_acerto']}% de acertos")
             
             # Verificar se há escala salva no session_state
             if hasattr(st.session_state, 'escala_completa') and st.session_state.escala_completa is not None:
@@ -333,7 +371,7 @@ def renderizar_gerador_escalas():
                 
                 with col2:
                     # Relatório Plantões
-                    relatorio_plantoes = gerador.gerar_relatorio_plantoes(escala_completa)
+                    relatorio_plantoes = gerador.gerar_relatorio_plantoes(gerador.matriz_escala)
                     if not relatorio_plantoes.empty:
                         st.subheader("🏥 Controle Plantões")
                         
@@ -0,0 +1,357 @@
+"""
+Calendário do Período
+=====================
+
+Tabela de calendário montada uma única vez por período, com uma coluna
+(array NumPy) por atributo do dia. As regras de escala e os relatórios
+leem desta tabela em vez de refazer a aritmética de datas por colaborador.
+
+Também contém o calendário de feriados indexado, organizado em camadas
+(nacional, estadual, municipal e por unidade), e a leitura única da tabela de
+feriados (tabela_feriados) usada pela planilha de feriados e pelo gerador.
+"""
+
+import copy
+from datetime import date, timedelta
+from typing import Dict, FrozenSet, List, Iterable, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+
+from conversao_datas import converter_datas, textos_data
+from diagnosticos import ColetorDiagnosticos
+
+# Colunas da tabela de feriados normalizada
+COLUNAS_FERIADOS = ['Data', 'Descricao', 'Camada', 'Unidade']
+
+def tabela_feriados(df_feriados: pd.DataFrame,
+                    diagnosticos: ColetorDiagnosticos = None) -> Tuple[pd.DataFrame, pd.Series]:
+    """
+    Normaliza a tabela de feriados com operações sobre as colunas inteiras.
+
+    A coluna 'Data' é convertida uma única vez (textos em um formato de
+    conversao_datas, o mesmo para a coluna inteira, ou datas do Excel); camada vazia vale 'nacional' e feriado com
+    unidade sem camada vale 'unidade'. Linhas sem data são descartadas e feriados
+    repetidos (mesma data, camada e unidade) são mantidos uma única vez. Uma tabela
+    já normalizada é aceita de novo sem reconversão das datas.
+
+    Args:
+        df_feriados: DataFrame com colunas 'Data' e, opcionalmente, 'Descricao',
+            'Camada' e 'Unidade'
+        diagnosticos: Coletor onde as datas fora do formato da coluna são registradas (opcional)
+
+    Returns:
+        Tupla (DataFrame com as colunas COLUNAS_FERIADOS, 'Data' em datetime64 e
+        'Unidade' vazia para os feriados gerais; máscara das linhas de entrada com
+        data preenchida mas não reconhecida)
+
+    Raises:
+        ValueError: Se a coluna 'Data' não existir
+    """
+    if 'Data' not in df_feriados.columns:
+        raise ValueError("Coluna 'Data' não encontrada na planilha de feriados")
+
+    if pd.api.types.is_datetime64_any_dtype(df_feriados['Data']):
+        datas = df_feriados['Data'].astype('datetime64[s]').dt.normalize()
+        invalidas = pd.Series(False, index=df_feriados.index)
+    else:
+        textos = textos_data(df_feriados['Data'])
+        datas = converter_datas(textos, diagnosticos=diagnosticos, campo='Data')
+        invalidas = datas.isna() & textos.ne('')
+
+    def coluna(nome: str) -> pd.Series:
+        if nome in df_feriados.columns:
+            return textos_data(df_feriados[nome])
+        return pd.Series('', index=df_feriados.index, dtype=object)
+
+    camadas = coluna('Camada').str.lower()
+    unidades = coluna('Unidade')
+    camadas = camadas.mask(camadas.eq(''), 'nacional')
+    camadas = camadas.mask(unidades.ne('') & camadas.eq('nacional'), 'unidade')
+    descricoes = coluna('Descricao')
+
+    tabela = pd.DataFrame({'Data': datas, 'Descricao': descricoes.mask(descricoes.eq(''), 'Feriado'),
+                           'Camada': camadas, 'Unidade': unidades})
+    tabela = tabela[datas.notna()].drop_duplicates(['Data', 'Camada', 'Unidade']).reset_index(drop=True)
+    return tabela, invalidas
+
+class CalendarioFeriados:
+    """Feriados indexados em camadas, com consulta O(1) e máscara por período."""
+
+    CAMADAS = ('nacional', 'estadual', 'municipal', 'unidade')
+
+    def __init__(self, feriados: Iterable[date] = None, camada: str = 'nacional'):
+        """
+        Inicializa o calendário de feriados.
+
+        Args:
+            feriados: Datas dos feriados da camada inicial (opcional)
+            camada: Camada das datas iniciais (nacional, estadual, municipal ou unidade)
+        """
+        self._camadas: Dict[Tuple[str, Optional[str]], set] = {}
+        self._cache_datas: Dict[Optional[str], FrozenSet[date]] = {}
+        self._cache_mascaras: Dict[Tuple[Optional[str], date, date], np.ndarray] = {}
+        if feriados:
+            self.adicionar(feriados, camada)
+
+    def adicionar(self, feriados: Iterable[date], camada: str = 'nacional',
+                  unidade: str = None) -> 'CalendarioFeriados':
+        """
+        Adiciona feriados a uma camada.
+
+        Args:
+            feriados: Datas dos feriados
+            camada: Camada dos feriados (nacional, estadual, municipal ou unidade)
+            unidade: Unidade à qual os feriados se restringem (None vale para todas)
+
+        Returns:
+            O próprio calendário, para encadear chamadas
+        """
+        if camada not in self.CAMADAS:
+            raise ValueError(f"Camada de feriados '{camada}' não suportada")
+
+        self._camadas.setdefault((camada, unidade), set()).update(feriados)
+        self._cache_datas.clear()
+        self._cache_mascaras.clear()
+        return self
+
+    @classmethod
+    def de_tabela(cls, tabela: pd.DataFrame, data_inicio: date = None,
+                  data_fim: date = None) -> 'CalendarioFeriados':
+        """
+        Monta o calendário a partir da tabela de feriados normalizada.
+
+        Args:
+            tabela: Tabela de feriados (ver tabela_feriados)
+            data_inicio: Primeiro dia considerado (opcional; feriados anteriores são descartados)
+            data_fim: Último dia considerado (opcional; feriados posteriores são descartados)
+
+        Returns:
+            Calendário de feriados com uma camada por combinação de camada e unidade
+
+        Raises:
+            ValueError: Se a tabela tiver camada não suportada
+        """
+        datas = tabela['Data'].to_numpy(dtype='datetime64[D]')
+        manter = np.ones(len(tabela), dtype=bool)
+        if data_inicio is not None:
+            manter &= datas >= np.datetime64(data_inicio, 'D')
+        if data_fim is not None:
+            manter &= datas <= np.datetime64(data_fim, 'D')
+
+        feriados = cls()
+        recorte = pd.DataFrame({'Data': datas[manter], 'Camada': tabela['Camada'].to_numpy()[manter],
+                                'Unidade': tabela['Unidade'].to_numpy()[manter]})
+        for (camada, unidade), grupo in recorte.groupby(['Camada', 'Unidade'], sort=False):
+            feriados.adicionar(grupo['Data'].to_numpy(dtype='datetime64[D]').tolist(), camada, unidade or None)
+        return feriados
+
+    def unidades(self) -> List[str]:
+        """Lista as unidades que possuem feriados próprios."""
+        return sorted({unidade for _, unidade in self._camadas if unidade is not None})
+
+    def datas(self, unidade: str = None) -> FrozenSet[date]:
+        """
+        Retorna o conjunto de feriados válidos para uma unidade.
+
+        Args:
+            unidade: Unidade consultada (None considera apenas as camadas gerais)
+
+        Returns:
+            Conjunto imutável com as datas dos feriados
+        """
+        if unidade not in self._cache_datas:
+            datas = set()
+            for (_, unidade_camada), feriados in self._camadas.items():
+                if unidade_camada is None or unidade_camada == unidade:
+                    datas.update(feriados)
+            self._cache_datas[unidade] = frozenset(datas)
+        return self._cache_datas[unidade]
+
+    def contem(self, data: date, unidade: str = None) -> bool:
+        """Verifica se a data é feriado para a unidade."""
+        return data in self.datas(unidade)
+
+    def __contains__(self, data: date) -> bool:
+        return data in self.datas()
+
+    def __iter__(self):
+        return iter(sorted(self.datas()))
+
+    def __len__(self) -> int:
+        return len(self.datas())
+
+    def mascara(self, calendario: 'Calendario', unidade: str = None) -> np.ndarray:
+        """
+        Retorna a máscara de feriados alinhada aos dias de um calendário.
+
+        A máscara é calculada uma vez por unidade e período e reaproveitada.
+
+        Args:
+            calendario: Calendário do período
+            unidade: Unidade consultada
+
+        Returns:
+            Array booleano (somente leitura) com True nos dias de feriado
+        """
+        chave = (unidade, calendario.data_inicio, calendario.data_fim)
+        if chave not in self._cache_mascaras:
+            datas = self.datas(unidade)
+            if datas:
+                mascara = np.isin(calendario.datas, np.array(list(datas), dtype='datetime64[D]'))
+            else:
+                mascara = np.zeros(len(calendario.datas), dtype=bool)
+            mascara.flags.writeable = False
+            self._cache_mascaras[chave] = mascara
+        return self._cache_mascaras[chave]
+
+class Calendario:
+    """Tabela de calendário do período com colunas alinhadas por dia."""
+
+    def __init__(self, data_inicio: date, data_fim: date, feriados: Iterable[date] = None,
+                 unidade: str = None):
+        """
+        Monta a tabela de calendário do período.
+
+        Args:
+            data_inicio: Data de início do período
+            data_fim: Data de fim do período
+            feriados: CalendarioFeriados ou datas dos feriados (opcional)
+            unidade: Unidade cujos feriados próprios devem ser considerados
+        """
+        self.data_inicio = data_inicio
+        self.data_fim = data_fim
+        if not isinstance(feriados, CalendarioFeriados):
+            feriados = CalendarioFeriados(feriados)
+        self.feriados = feriados.datas(unidade)
+
+        datas = np.arange(np.datetime64(data_inicio, 'D'), np.datetime64(data_fim, 'D') + 1)
+        meses = datas.astype('datetime64[M]')
+        inicio_mes = meses.astype('datetime64[D]')
+
+        self.datas = datas
+        # 01/01/1970 foi uma quinta-feira (weekday 3)
+        self.dia_semana = ((datas.astype('int64') + 3) % 7).astype(np.int8)
+        self.dia_mes = ((datas - inicio_mes).astype('int64') + 1).astype(np.int8)
+        self.paridade = (self.dia_mes % 2).astype(np.int8)
+        self.mes_id = (meses - meses[0]).astype(np.int32) if len(datas) else np.zeros(0, dtype=np.int32)
+        self.dias_no_mes = ((meses + 1).astype('datetime64[D]') - inicio_mes).astype(np.int8)
+        self.ultimo_dia_mes = self.dia_mes == self.dias_no_mes
+
+        # Viradas de meses com 31 dias acumuladas desde o início do período
+        # (regra de alternância de paridade dos plantões)
+        termina_em_31 = (self.ultimo_dia_mes & (self.dias_no_mes == 31)).astype(np.int32)
+        self.viradas_31 = (np.cumsum(termina_em_31) - termina_em_31).astype(np.int32)
+
+        self.feriado = feriados.mascara(self, unidade)
+
+        # Datas como objetos date, para montar as colunas 'Data' sem conversão
+        self.datas_python = datas.tolist()
+
+        # Dias do mês anterior ao início do período (regra de alternância dos plantões)
+        self.dias_mes_anterior = (data_inicio.replace(day=1) - timedelta(days=1)).day
+
+    def com_feriados(self, feriados: Iterable[date] = None, unidade: str = None) -> 'Calendario':
+        """
+        Retorna o mesmo período com outros feriados, sem recalcular as demais colunas.
+
+        Usado para compartilhar um único calendário do período entre várias unidades.
+
+        Args:
+            feriados: CalendarioFeriados ou datas dos feriados (opcional)
+            unidade: Unidade cujos feriados próprios devem ser considerados
+
+        Returns:
+            Novo Calendario (as colunas de datas são compartilhadas)
+        """
+        if not isinstance(feriados, CalendarioFeriados):
+            feriados = CalendarioFeriados(feriados)
+        calendario = copy.copy(self)
+        calendario.feriados = feriados.datas(unidade)
+        calendario.feriado = feriados.mascara(calendario, unidade)
+        return calendario
+
+    def __len__(self) -> int:
+        """Quantidade de dias do período."""
+        return len(self.datas)
+
+    def indice(self, data: date) -> int:
+        """
+        Retorna o índice de uma data no período.
+
+        Args:
+            data: Data a localizar
+
+        Returns:
+            Índice da data, ou -1 se estiver fora do período
+        """
+        indice = (np.datetime64(data, 'D') - self.datas[0]).astype('int64') if len(self.datas) else -1
+        return int(indice) if 0 <= indice < len(self.datas) else -1
+
+    def indices(self, datas: List[date]) -> np.ndarray:
+        """
+        Retorna os índices das datas que caem dentro do período.
+
+        Args:
+            datas: Lista de datas
+
+        Returns:
+            Array com os índices das datas contidas no período
+        """
+        if not datas or not len(self.datas):
+            return np.zeros(0, dtype=np.int64)
+        indices = (np.array(datas, dtype='datetime64[D]') - self.datas[0]).astype('int64')
+        return indices[(indices >= 0) & (indices < len(self.datas))]
+
+    def intervalo(self, inicio: date, fim: date) -> slice:
+        """
+        Retorna a fatia de índices de um intervalo de datas, recortado ao período.
+
+        Args:
+            inicio: Data inicial do intervalo
+            fim: Data final do intervalo (inclusiva)
+
+        Returns:
+            Fatia de índices (vazia se o intervalo não cruza o período)
+        """
+        if not len(self.datas):
+            return slice(0, 0)
+        primeiro = int((np.datetime64(inicio, 'D') - self.datas[0]).astype('int64'))
+        ultimo = int((np.datetime64(fim, 'D') - self.datas[0]).astype('int64'))
+        primeiro = min(max(primeiro, 0), len(self.datas))
+        return slice(primeiro, max(primeiro, min(ultimo + 1, len(self.datas))))
+
+    def meses(self) -> List[Tuple[int, int]]:
+        """
+        Divide o período em trechos de mês civil.
+
+        Returns:
+            Lista de tuplas (início, fim) de índices, com fim exclusivo
+        """
+        inicios = np.flatnonzero(np.diff(self.mes_id, prepend=-1))
+        fins = np.append(inicios[1:], len(self.datas))
+        return list(zip(inicios.tolist(), fins.tolist()))
+
+    def fatiar(self, inicio: int, fim: int) -> 'Calendario':
+        """
+        Retorna a tabela de calendário de um trecho do período, sem recalcular colunas.
+
+        Args:
+            inicio: Índice inicial do trecho
+            fim: Índice final do trecho (exclusivo)
+
+        Returns:
+            Calendario restrito ao trecho
+        """
+        trecho = Calendario.__new__(Calendario)
+        trecho.data_inicio = self.datas_python[inicio]
+        trecho.data_fim = self.datas_python[fim - 1]
+        trecho.feriados = self.feriados
+        for coluna in ('datas', 'dia_semana', 'dia_mes', 'paridade', 'mes_id', 'dias_no_mes',
+                       'ultimo_dia_mes', 'viradas_31', 'feriado', 'datas_python'):
+            setattr(trecho, coluna, getattr(self, coluna)[inicio:fim])
+        # Contagens relativas ao início do trecho
+        trecho.mes_id = trecho.mes_id - trecho.mes_id[0]
+        trecho.viradas_31 = trecho.viradas_31 - trecho.viradas_31[0]
+        trecho.dias_mes_anterior = (trecho.data_inicio.replace(day=1) - timedelta(days=1)).day
+        return trecho
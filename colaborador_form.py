@@ -14,26 +14,13 @@ import pandas as pd
 from datetime import datetime, date, timedelta
 import io
 from typing import List, Dict, Optional
+from padroes_escala import PADROES_ESCALA
 
 class FormularioColaboradores:
     """Classe para gerenciar o formulário de colaboradores."""
     
     def __init__(self):
-        self.tipos_escala = {
-            "M44": "44H - Manhã (Segunda a sexta, 8h/dia)",
-            "T44": "44H - Tarde (Segunda a sexta, 8h/dia)", 
-            "N44": "44H - Noite (Segunda a sexta, 8h/dia)",
-            "M40": "40H - Manhã (Segunda a sexta, 8h/dia)",
-            "T40": "40H - Tarde (Segunda a sexta, 8h/dia)",
-            "N40": "40H - Noite (Segunda a sexta, 8h/dia)",
-            "M6X1": "6x1 - Manhã (6 dias trabalho, 1 dia folga)",
-            "T6X1": "6x1 - Tarde (6 dias trabalho, 1 dia folga)",
-            "N6X1": "6x1 - Noite (6 dias trabalho, 1 dia folga)",
-            "P_D": "Plantão Par - Dia (dias pares do mês)",
-            "P_N": "Plantão Par - Noite (dias pares do mês)",
-            "I_D": "Plantão Ímpar - Dia (dias ímpares do mês)",
-            "I_N": "Plantão Ímpar - Noite (dias ímpares do mês)"
-        }
+        self.tipos_escala = {codigo: padrao.descricao for codigo, padrao in PADROES_ESCALA.items()}
         
         self.turnos = ["Manhã", "Tarde", "Noite", "Dia"]
         
@@ -7,9 +7,10 @@ Script para identificar diferenças entre os dois aplicativos
 
 import streamlit as st
 import pandas as pd
-from datetime import datetime, date
+from datetime import date
 from escala_generator import GeradorEscala
 from regras_clt import RegrasCLT
+from conversao_datas import converter_data
 
 def comparar_apps():
     """Compara o comportamento do app.py vs app2.py."""
@@ -75,18 +76,7 @@ def comparar_apps():
                 
                 # Processar último plantão manualmente (como o código faz)
                 ultimo_plantao_mes_anterior = colaborador['Ultimo_Plantao_Mes_Anterior']
-                ultimo_plantao = None
-                
-                if ultimo_plantao_mes_anterior and ultimo_plantao_mes_anterior.strip():
-                    try:
-                        for formato in ['%d/%m/%Y', '%d-%m-%Y', '%Y-%m-%d']:
-                            try:
-                                ultimo_plantao = datetime.strptime(ultimo_plantao_mes_anterior.strip(), formato).date()
-                                break
-                            except ValueError:
-                                continue
-                    except:
-                        pass
+                ultimo_plantao = converter_data(ultimo_plantao_mes_anterior)
                 
                 st.write(f"**Último Plantão Processado:** {ultimo_plantao}")
                 
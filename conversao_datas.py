@@ -0,0 +1,155 @@
+"""
+Conversão de Datas
+==================
+
+Conversão única de datas em texto para todo o sistema, aceitando os formatos
+usados nas planilhas (DD/MM/AAAA, DD-MM-AAAA e AAAA-MM-DD).
+
+O formato de cada texto é identificado pelo seu padrão (dígitos e
+separadores) antes da conversão, sem tentativa e erro com exceções:
+
+- converter_data: valor isolado, com cache limitado dos textos já convertidos
+  (as mesmas poucas centenas de datas se repetem milhões de vezes por execução)
+- converter_datas: coluna inteira (pd.Series), em um único formato por coluna
+  (o que reconhece mais valores); cada texto distinto é convertido uma única
+  vez, e as datas em outro formato que o da coluna podem ser registradas em
+  um coletor de diagnósticos
+"""
+
+import re
+from datetime import date, datetime
+from functools import lru_cache
+from typing import Optional, Sequence, Tuple
+
+import numpy as np
+import pandas as pd
+
+from diagnosticos import ColetorDiagnosticos
+
+# Formatos de data aceitos, na ordem em que são tentados
+FORMATOS_DATA = ('%d/%m/%Y', '%d-%m-%Y', '%Y-%m-%d', '%Y-%m-%d %H:%M:%S')
+FORMATOS_EXCECAO = ('%d/%m/%Y', '%d-%m-%Y', '%Y-%m-%d')
+
+# Texto de uma célula de data do Excel (Timestamp em texto): aceito em qualquer coluna,
+# sem disputar o formato da coluna com as datas digitadas
+FORMATO_CELULA_DATA = '%Y-%m-%d %H:%M:%S'
+
+# Quantidade de textos distintos mantidos no cache de converter_data
+TAMANHO_CACHE = 4096
+
+_DIRETIVAS = {'%d': r'\d{1,2}', '%m': r'\d{1,2}', '%Y': r'\d{4}', '%H': r'\d{1,2}', '%M': r'\d{1,2}', '%S': r'\d{1,2}'}
+
+@lru_cache(maxsize=None)
+def padrao_formato(formato: str) -> str:
+    """Expressão regular que reconhece a forma (dígitos e separadores) de um formato de data."""
+    return re.sub('%[dmYHMS]', lambda diretiva: _DIRETIVAS[diretiva.group()], re.escape(formato))
+
+@lru_cache(maxsize=None)
+def _regex_formato(formato: str) -> re.Pattern:
+    return re.compile(padrao_formato(formato))
+
+@lru_cache(maxsize=TAMANHO_CACHE)
+def _interpretar(texto: str, formatos: Tuple[str, ...]) -> Tuple[Optional[date], Optional[str]]:
+    """Converte um texto sem espaços nas pontas; retorna (data, formato) ou (None, None)."""
+    for formato in formatos:
+        if _regex_formato(formato).fullmatch(texto):
+            try:
+                return datetime.strptime(texto, formato).date(), formato
+            except ValueError:
+                # Forma reconhecida, mas data inexistente (ex.: 31/02/2025)
+                continue
+    return None, None
+
+def converter_data(valor, formatos: Sequence[str] = FORMATOS_DATA) -> Optional[date]:
+    """
+    Converte um valor de data (texto, date, datetime ou Timestamp) em date.
+
+    Args:
+        valor: Valor a converter
+        formatos: Formatos aceitos para textos, na ordem de preferência
+
+    Returns:
+        Data convertida, ou None se o valor estiver vazio ou não for reconhecido
+    """
+    if isinstance(valor, datetime):
+        return None if pd.isna(valor) else valor.date()
+    if isinstance(valor, date):
+        return valor
+    if isinstance(valor, str):
+        texto = valor.strip()
+        return _interpretar(texto, tuple(formatos))[0] if texto else None
+    return None
+
+def formato_data(texto: str, formatos: Sequence[str] = FORMATOS_DATA) -> Optional[str]:
+    """Formato em que o texto de data foi reconhecido (None se nenhum)."""
+    return _interpretar(texto.strip(), tuple(formatos))[1]
+
+def textos_data(valores: pd.Series) -> pd.Series:
+    """
+    Converte os valores de uma coluna em texto sem espaços nas pontas ('' para vazios).
+
+    Datas (date, datetime ou Timestamp) viram texto em FORMATO_CELULA_DATA, aceito
+    por converter_datas em qualquer coluna.
+    """
+    objetos = valores.astype(object).where(valores.notna(), '')
+    if valores.dtype == object or pd.api.types.is_datetime64_any_dtype(valores):
+        nativas = objetos.map(lambda valor: isinstance(valor, date)).to_numpy(dtype=bool)
+        if nativas.any():
+            objetos[nativas] = pd.to_datetime(objetos[nativas]).dt.strftime(FORMATO_CELULA_DATA)
+    return objetos.astype(str).str.strip()
+
+def converter_datas(textos: pd.Series, formatos: Sequence[str] = FORMATOS_DATA,
+                    diagnosticos: ColetorDiagnosticos = None, campo: str = None) -> pd.Series:
+    """
+    Converte uma coluna de textos de data em um único formato, identificado pela coluna.
+
+    O formato da coluna é o que reconhece mais valores (em empate, o primeiro de
+    formatos); textos de células de data do Excel (FORMATO_CELULA_DATA) são aceitos
+    em qualquer coluna. Os demais valores preenchidos ficam NaT; com um coletor, as
+    datas válidas em outro formato são registradas em um aviso 'data_fora_do_formato'
+    (valores que não são datas em nenhum formato ficam para quem chama).
+
+    Args:
+        textos: Série com as datas em texto (sem espaços nas pontas, '' para vazios)
+        formatos: Formatos aceitos, na ordem de preferência
+        diagnosticos: Coletor onde as datas fora do formato da coluna são registradas (opcional)
+        campo: Nome da coluna, usado no aviso (opcional)
+
+    Returns:
+        Série datetime64 alinhada à entrada (NaT onde o valor está vazio ou fora do formato da coluna)
+    """
+    codigos, unicos = pd.factorize(textos)
+    unicos = pd.Series(unicos, dtype=object)
+    valores = unicos.to_numpy()
+    ocorrencias = np.bincount(codigos[codigos >= 0], minlength=len(unicos))
+
+    # Cada formato convertido sobre os textos que têm a sua forma
+    candidatas = {}
+    for formato in formatos:
+        posicoes = np.flatnonzero(unicos.str.fullmatch(padrao_formato(formato)).to_numpy(dtype=bool))
+        datas = pd.to_datetime(valores[posicoes], format=formato, errors='coerce').to_numpy().astype('datetime64[s]')
+        validas = ~np.isnat(datas)
+        candidatas[formato] = (posicoes[validas], datas[validas])
+
+    convertidas = np.full(len(unicos) + 1, np.datetime64('NaT'), dtype='datetime64[s]')
+    celulas = candidatas.pop(FORMATO_CELULA_DATA, None)
+    if celulas is not None:
+        convertidas[celulas[0]] = celulas[1]
+    if candidatas:
+        formato_coluna = max(candidatas, key=lambda formato: ocorrencias[candidatas[formato][0]].sum())
+        posicoes, datas = candidatas.pop(formato_coluna)
+        convertidas[posicoes] = datas
+
+        # Datas válidas nos outros formatos ficam de fora
+        fora = np.unique(np.concatenate([np.empty(0, dtype=np.int64)]
+                                        + [posicoes for posicoes, _ in candidatas.values()]))
+        if diagnosticos is not None and len(fora):
+            valores_fora = valores[fora].tolist()
+            diagnosticos.aviso(
+                'data_fora_do_formato',
+                f"Datas fora do formato {formato_coluna} da coluna '{campo or 'Data'}' (desconsideradas): "
+                f"{', '.join(valores_fora)}",
+                campo=campo, formato=formato_coluna, valores=valores_fora
+            )
+    # Código -1 (valor ausente) aponta para o NaT final
+    return pd.Series(convertidas[codigos], index=textos.index)
@@ -0,0 +1,52 @@
+"""
+Dados de Teste
+==============
+
+Cadastro de colaboradores sintético e comparação de DataFrames usados pelos
+scripts de teste (teste_*.py).
+"""
+
+import pandas as pd
+
+def colaboradores_teste(quantidade, tipos, **campos):
+    """
+    Monta um cadastro de colaboradores para os testes.
+
+    Cada coluna recebe um valor fixo, uma lista (usada em rodízio: valores[i % len(valores)])
+    ou uma função chamada com o índice do colaborador, linha a linha e na ordem das colunas.
+
+    Args:
+        quantidade: Quantidade de colaboradores
+        tipos: Tipos de escala (lista em rodízio ou função do índice)
+        **campos: Demais colunas, ou Nome, Cargo e Turno para substituir os valores padrão
+
+    Returns:
+        DataFrame com Nome ('Colaborador <i>'), Cargo ('Técnico'), Tipo_Escala, Turno ('Manhã')
+        e as colunas de campos, nessa ordem
+    """
+    colunas = {'Nome': lambda i: f'Colaborador {i}', 'Cargo': 'Técnico', 'Tipo_Escala': tipos, 'Turno': 'Manhã'}
+    colunas.update(campos)
+
+    def valor(valores, i):
+        if callable(valores):
+            return valores(i)
+        if isinstance(valores, (list, tuple)):
+            return valores[i % len(valores)]
+        return valores
+
+    return pd.DataFrame([{coluna: valor(valores, i) for coluna, valores in colunas.items()}
+                         for i in range(quantidade)])
+
+def iguais(df_a, df_b):
+    """
+    Compara dois DataFrames pelos textos dos valores, independente dos tipos das colunas.
+
+    Args:
+        df_a: Primeiro DataFrame
+        df_b: Segundo DataFrame
+
+    Returns:
+        True se têm as mesmas colunas, na mesma ordem, e os mesmos valores
+    """
+    return (df_a.shape == df_b.shape and list(df_a.columns) == list(df_b.columns)
+            and (df_a.astype(str).to_numpy() == df_b.astype(str).to_numpy()).all())
@@ -7,9 +7,10 @@ determinar_tipo_plantao_automatico.
 """
 
 import pandas as pd
-from datetime import date, datetime
+from datetime import date
 from escala_generator import GeradorEscala
 from regras_clt import RegrasCLT
+from conversao_datas import converter_data
 
 def debug_plantao():
     """Debuga a função determinar_tipo_plantao_automatico."""
@@ -51,17 +52,7 @@ def debug_plantao():
         print(f"   Último plantão: {ultimo_plantao_str}")
         
         # Processar último plantão
-        ultimo_plantao = None
-        if ultimo_plantao_str and ultimo_plantao_str.strip():
-            try:
-                for formato in ['%d/%m/%Y', '%d-%m-%Y', '%Y-%m-%d']:
-                    try:
-                        ultimo_plantao = datetime.strptime(ultimo_plantao_str.strip(), formato).date()
-                        break
-                    except ValueError:
-                        continue
-            except:
-                pass
+        ultimo_plantao = converter_data(ultimo_plantao_str)
         
         if ultimo_plantao:
             print(f"   Último plantão processado: {ultimo_plantao} (dia {ultimo_plantao.day})")
@@ -0,0 +1,129 @@
+"""
+Diagnósticos da Geração
+=======================
+
+Coletor de avisos estruturados produzidos pelo motor de escalas (ajustes de
+tipo de plantão, datas que não puderam ser convertidas, tipos de escala e
+turnos inválidos). O motor apenas registra os diagnósticos; a interface
+(Streamlit, linha de comando, job em lote) decide como exibi-los.
+"""
+
+from typing import Any, Dict, Iterable, Iterator, List
+
+import pandas as pd
+
+# Níveis, do menos ao mais grave
+NIVEIS = ('info', 'aviso', 'erro')
+
+class Diagnostico:
+    """Um aviso estruturado da geração de escalas."""
+
+    def __init__(self, nivel: str, categoria: str, mensagem: str, colaborador: str = None,
+                 dados: Dict[str, Any] = None):
+        """
+        Inicializa o diagnóstico.
+
+        Args:
+            nivel: Nível do diagnóstico (info, aviso ou erro)
+            categoria: Categoria (ex.: ajuste_tipo, mudanca_tipo, data_invalida, tipo_invalido)
+            mensagem: Mensagem pronta para exibição
+            colaborador: Nome do colaborador relacionado (opcional)
+            dados: Dados adicionais do diagnóstico (opcional)
+        """
+        if nivel not in NIVEIS:
+            raise ValueError(f"Nível de diagnóstico '{nivel}' não suportado")
+
+        self.nivel = nivel
+        self.categoria = categoria
+        self.mensagem = mensagem
+        self.colaborador = colaborador
+        self.dados = dados or {}
+
+    def __repr__(self) -> str:
+        return f"Diagnostico({self.nivel!r}, {self.categoria!r}, {self.mensagem!r})"
+
+    def para_dict(self) -> Dict[str, Any]:
+        """Converte o diagnóstico em dicionário."""
+        return {
+            'Nivel': self.nivel,
+            'Categoria': self.categoria,
+            'Colaborador': self.colaborador or '',
+            'Mensagem': self.mensagem,
+            **self.dados
+        }
+
+class ColetorDiagnosticos:
+    """Lista de diagnósticos registrados durante a leitura e a geração das escalas."""
+
+    def __init__(self):
+        """Inicializa o coletor vazio."""
+        self._diagnosticos: List[Diagnostico] = []
+
+    def registrar(self, nivel: str, categoria: str, mensagem: str, colaborador: str = None,
+                  **dados) -> Diagnostico:
+        """
+        Registra um diagnóstico.
+
+        Args:
+            nivel: Nível do diagnóstico (info, aviso ou erro)
+            categoria: Categoria do diagnóstico
+            mensagem: Mensagem pronta para exibição
+            colaborador: Nome do colaborador relacionado (opcional)
+            **dados: Dados adicionais (tipo, valor recebido, data, etc.)
+
+        Returns:
+            O diagnóstico registrado
+        """
+        diagnostico = Diagnostico(nivel, categoria, mensagem, colaborador, dados)
+        self._diagnosticos.append(diagnostico)
+        return diagnostico
+
+    def info(self, categoria: str, mensagem: str, colaborador: str = None, **dados) -> Diagnostico:
+        """Registra um diagnóstico informativo."""
+        return self.registrar('info', categoria, mensagem, colaborador, **dados)
+
+    def aviso(self, categoria: str, mensagem: str, colaborador: str = None, **dados) -> Diagnostico:
+        """Registra um aviso."""
+        return self.registrar('aviso', categoria, mensagem, colaborador, **dados)
+
+    def erro(self, categoria: str, mensagem: str, colaborador: str = None, **dados) -> Diagnostico:
+        """Registra um erro."""
+        return self.registrar('erro', categoria, mensagem, colaborador, **dados)
+
+    def filtrar(self, nivel: str = None, categoria: str = None) -> List[Diagnostico]:
+        """
+        Retorna os diagnósticos de um nível e/ou categoria.
+
+        Args:
+            nivel: Nível procurado (opcional)
+            categoria: Categoria procurada (opcional)
+
+        Returns:
+            Lista de diagnósticos, na ordem em que foram registrados
+        """
+        return [
+            diagnostico for diagnostico in self._diagnosticos
+            if (nivel is None or diagnostico.nivel == nivel)
+            and (categoria is None or diagnostico.categoria == categoria)
+        ]
+
+    def estender(self, outro: Iterable[Diagnostico]):
+        """Acrescenta os diagnósticos de outro coletor (ou de uma lista de diagnósticos)."""
+        self._diagnosticos.extend(outro)
+
+    def limpar(self):
+        """Remove todos os diagnósticos."""
+        self._diagnosticos.clear()
+
+    def para_dataframe(self) -> pd.DataFrame:
+        """Converte os diagnósticos em DataFrame (uma linha por diagnóstico)."""
+        return pd.DataFrame([diagnostico.para_dict() for diagnostico in self._diagnosticos])
+
+    def __iter__(self) -> Iterator[Diagnostico]:
+        return iter(list(self._diagnosticos))
+
+    def __len__(self) -> int:
+        return len(self._diagnosticos)
+
+    def __bool__(self) -> bool:
+        return bool(self._diagnosticos)
@@ -6,30 +6,227 @@ Módulo principal para geração de escalas de trabalho automatizadas
 respeitando as regras da CLT brasileira.
 """
 
+import os
+import numpy as np
 import pandas as pd
-from datetime import date, timedelta, datetime
-from typing import Dict, List, Any
-import streamlit as st
+from concurrent.futures import ProcessPoolExecutor
+from datetime import date, timedelta
+from typing import Dict, Iterable, Iterator, List, Any, Optional, Tuple
 
 from regras_clt import RegrasCLT
+from calendario import Calendario, CalendarioFeriados, tabela_feriados
+from conversao_datas import converter_data
+from excecoes_escala import (COLUNAS_INTERVALOS, IntervaloExcecao, TipoExcecao, aplicar_intervalos,
+                             aplicar_intervalos_lote, intervalos_excecoes, juntar_excecoes, tabela_intervalos)
+from status_escala import ROTULOS_STATUS, StatusEscala
+from diagnosticos import ColetorDiagnosticos
+from matriz_escala import COLUNA_ID, COLUNAS_CONTROLE, COLUNAS_INFO, MatrizEscala, contagens_fatos
+from normalizacao_colaboradores import CAMPOS_CONTADOR, COLUNA_REJEICOES, normalizar_colaboradores, para_data
+
+class MontadorEscala:
+    """
+    Monta a escala em colunas pré-alocadas (colaboradores × dias).
+    
+    Cada colaborador ocupa uma linha da matriz de códigos de status, preenchida
+    no lugar; a MatrizEscala (e dela o DataFrame) é construída uma única vez, ao término.
+    """
+    
+    COLUNAS_TEXTO = COLUNAS_INFO
+    COLUNAS_CONTROLE = COLUNAS_CONTROLE
+    
+    def __init__(self, calendario: Calendario, capacidade: int):
+        """
+        Pré-aloca as colunas da escala.
+        
+        Args:
+            calendario: Calendário do período
+            capacidade: Quantidade máxima de colaboradores
+        """
+        self.calendario = calendario
+        self.status = np.empty((capacidade, len(calendario)), dtype=np.uint8)
+        self.textos = {coluna: np.empty(capacidade, dtype=object) for coluna in self.COLUNAS_TEXTO}
+        self.controle = {
+            'Ultimo_Domingo_Folga': np.empty(capacidade, dtype=object),
+            'Domingos_Folgados': np.zeros(capacidade, dtype=np.int64),
+            'Semanas_Sem_Domingo': np.zeros(capacidade, dtype=np.int64)
+        }
+        self.linhas = 0
+    
+    @property
+    def vazio(self) -> bool:
+        """Indica se nenhum colaborador foi incluído (ou se o período não tem dias)."""
+        return self.linhas == 0 or self.status.shape[1] == 0
+    
+    def adicionar(self, nome: str, cargo: str, tipo_escala: str, turno: str,
+                  info_controle: Dict[str, Any]) -> np.ndarray:
+        """
+        Reserva a próxima linha para um colaborador.
+        
+        Args:
+            nome: Nome do colaborador
+            cargo: Cargo do colaborador
+            tipo_escala: Tipo de escala (concatenado em caso de mudança)
+            turno: Turno do colaborador
+            info_controle: Info de controle 6x1 da escala base
+            
+        Returns:
+            Linha da matriz de status (view) a ser preenchida com os códigos do colaborador
+        """
+        linha = self.linhas
+        for coluna, valor in zip(self.COLUNAS_TEXTO, (nome, cargo, tipo_escala, turno)):
+            self.textos[coluna][linha] = valor
+        self.controle['Ultimo_Domingo_Folga'][linha] = info_controle.get('ultimo_domingo_folga', '')
+        self.controle['Domingos_Folgados'][linha] = info_controle.get('domingos_folgados', 0)
+        self.controle['Semanas_Sem_Domingo'][linha] = info_controle.get('semanas_sem_domingo', 0)
+        self.linhas += 1
+        return self.status[linha]
+    
+    def para_arrays(self) -> Tuple[np.ndarray, Dict[str, np.ndarray], Dict[str, np.ndarray]]:
+        """
+        Retorna as linhas preenchidas como arrays compactos (sem montar DataFrame).
+        
+        Returns:
+            Tupla (matriz de status, colunas de texto, colunas de controle 6x1)
+        """
+        linhas = self.linhas
+        return (
+            self.status[:linhas],
+            {coluna: valores[:linhas] for coluna, valores in self.textos.items()},
+            {coluna: valores[:linhas] for coluna, valores in self.controle.items()}
+        )
+    
+    def anexar(self, status: np.ndarray, textos: Dict[str, np.ndarray], controle: Dict[str, np.ndarray]):
+        """
+        Copia um bloco de linhas já geradas (ex.: por um processo de trabalho).
+        
+        Args:
+            status: Matriz de códigos de status do bloco
+            textos: Colunas de texto do bloco
+            controle: Colunas de controle 6x1 do bloco
+        """
+        inicio, fim = self.linhas, self.linhas + len(status)
+        self.status[inicio:fim] = status
+        for coluna in self.COLUNAS_TEXTO:
+            self.textos[coluna][inicio:fim] = textos[coluna]
+        for coluna in self.COLUNAS_CONTROLE:
+            self.controle[coluna][inicio:fim] = controle[coluna]
+        self.linhas = fim
+    
+    def construir_matriz(self) -> MatrizEscala:
+        """
+        Constrói a matriz da escala com as linhas preenchidas.
+        
+        Returns:
+            MatrizEscala com os metadados (incluindo o controle 6x1) de cada colaborador
+        """
+        status, textos, controle = self.para_arrays()
+        return MatrizEscala(status, pd.DataFrame({**textos, **controle}), self.calendario)
+
+# Gerador de cada processo de trabalho da geração paralela (montado uma vez por processo)
+_gerador_trabalhador = None
+
+def _inicializar_trabalhador(data_inicio: date, data_fim: date, calendario_feriados: CalendarioFeriados,
+                             unidade: str):
+    """Monta o gerador (calendário, regras e cache) do processo de trabalho."""
+    global _gerador_trabalhador
+    _gerador_trabalhador = GeradorEscala(data_inicio, data_fim, calendario_feriados, unidade)
+
+def _gerar_lote_trabalhador(lote: pd.DataFrame) -> Dict[str, Any]:
+    """
+    Gera a escala de um lote de colaboradores no processo de trabalho.
+    
+    Args:
+        lote: Fatia do DataFrame de colaboradores
+        
+    Returns:
+        Dict com os arrays compactos do lote ('status', 'textos', 'controle'),
+        as chaves das escalas base geradas, o estado final de cada colaborador
+        e os diagnósticos registrados
+    """
+    gerador = _gerador_trabalhador
+    gerador.diagnosticos.limpar()
+    montador = MontadorEscala(gerador.calendario, len(lote))
+    escalas_base = {}
+    estados_finais = []
+    for colaborador in lote.to_dict('records'):
+        escala_base = gerador._preencher_escala_colaborador(colaborador, montador, escalas_base, excecoes=False)
+        estados_finais.append(escala_base['estado_final'] if escala_base else None)
+    gerador._aplicar_excecoes_lote(montador, lote, estados_finais)
+    
+    status, textos, controle = montador.para_arrays()
+    return {
+        'status': status,
+        'textos': textos,
+        'controle': controle,
+        'chaves_base': list(escalas_base),
+        'estados_finais': estados_finais,
+        'diagnosticos': list(gerador.diagnosticos)
+    }
 
 class GeradorEscala:
     """Classe principal para geração de escalas de trabalho."""
     
-    def __init__(self, data_inicio: date, data_fim: date, feriados: pd.DataFrame):
+    # Abaixo desta quantidade de colaboradores a geração é sempre serial
+    MINIMO_COLABORADORES_PARALELO = 2000
+    
+    # Campos do colaborador que determinam sua escala (regra e exceções)
+    CAMPOS_IMPRESSAO = ['Nome', 'Cargo', 'Tipo_Escala', 'Turno', 'Atestados', 'Ferias', 'Escalas_Manuais',
+                        'Ultimo_Plantao_Mes_Anterior', 'Ultimo_Domingo_Folga',
+                        'Dias_Trabalhados_Seguidos', 'Semanas_Sem_Domingo', COLUNA_REJEICOES]
+    
+    # Campos transportados para o período seguinte (ver colaboradores_proximo_periodo)
+    CAMPOS_ESTADO = ['Tipo_Escala', 'Ultimo_Plantao_Mes_Anterior', 'Ultimo_Domingo_Folga',
+                     'Dias_Trabalhados_Seguidos', 'Semanas_Sem_Domingo']
+    
+    def __init__(self, data_inicio: date, data_fim: date, feriados: pd.DataFrame, unidade: str = None,
+                 diagnosticos: ColetorDiagnosticos = None, periodo: Calendario = None):
         """
         Inicializa o gerador de escalas.
         
         Args:
             data_inicio: Data de início do período
             data_fim: Data de fim do período
-            feriados: DataFrame com os feriados do período
+            feriados: DataFrame com os feriados do período ou CalendarioFeriados já montado
+            unidade: Unidade cujos feriados próprios devem ser considerados (opcional)
+            diagnosticos: Coletor onde os avisos da geração são registrados (opcional)
+            periodo: Calendário do mesmo período já montado, compartilhado entre geradores
+                (opcional; apenas os feriados são recalculados)
         """
         self.data_inicio = data_inicio
         self.data_fim = data_fim
-        self.feriados = self._processar_feriados(feriados)
+        self.unidade = unidade
+        
+        # Avisos da geração (ajustes de tipo, datas inválidas...), exibidos pela interface
+        self.diagnosticos = diagnosticos if diagnosticos is not None else ColetorDiagnosticos()
+        
+        self.calendario_feriados = self._processar_feriados(feriados)
+        self.feriados = self.calendario_feriados.datas(unidade)
         self.regras_clt = RegrasCLT()
         
+        # Calendário do período, montado uma única vez e compartilhado por todos os colaboradores
+        if periodo is not None:
+            self.calendario = periodo.com_feriados(self.calendario_feriados, unidade)
+        else:
+            self.calendario = Calendario(data_inicio, data_fim, self.calendario_feriados, unidade)
+        
+        # Estatísticas da última execução de gerar_escala_completa
+        self.estatisticas_execucao = {}
+        
+        # Matriz da última execução e seus metadados (controle 6x1, uma linha por colaborador)
+        self.matriz_escala = None
+        self.controle_6x1 = None
+        
+        # Estado de cada colaborador ao fim do período (uma entrada por linha da última entrada)
+        self._estados_finais = []
+        
+        # Linhas já geradas por atualizar, pela impressão digital dos dados do colaborador,
+        # e as escalas base usadas por elas (ambas limitadas ao último cadastro)
+        self._linhas_geradas = {}
+        self._escalas_base = {}
+        
+        # Escala da última execução (ver _dados_completos)
+        self._escala_completa = None
+        
         # Cores para visualização
         self.cores = {
             'TRABALHO_MANHA': '🟢',
@@ -43,250 +240,778 @@ class GeradorEscala:
             'FÉRIAS': '🟡'
         }
     
-    def _processar_feriados(self, df_feriados: pd.DataFrame) -> List[date]:
+    def rotulos_coloridos(self) -> List[str]:
         """
-        Processa o DataFrame de feriados para extrair as datas.
+        Retorna os rótulos coloridos de cada código de status, para exibição.
+        
+        Returns:
+            Lista de rótulos com emoji, na ordem dos códigos de status
+        """
+        return [f"{self.cores.get(rotulo, '⚪')} {rotulo}" for rotulo in ROTULOS_STATUS]
+    
+    def _processar_feriados(self, df_feriados: pd.DataFrame) -> CalendarioFeriados:
+        """
+        Processa o DataFrame de feriados para montar o calendário de feriados indexado.
+        
+        As datas são convertidas de uma só vez (ver calendario.tabela_feriados) e
+        apenas os feriados do período entram no calendário; linhas com data não
+        reconhecida são ignoradas.
         
         Args:
-            df_feriados: DataFrame com colunas 'Data' e 'Descricao'
+            df_feriados: DataFrame com colunas 'Data' e 'Descricao' e, opcionalmente,
+                'Camada' (nacional, estadual, municipal, unidade) e 'Unidade'
             
         Returns:
-            Lista de objetos date dos feriados
+            CalendarioFeriados com os feriados organizados por camada
         """
-        feriados = []
-        if df_feriados is not None and not df_feriados.empty:
-            for _, row in df_feriados.iterrows():
-                if pd.notna(row['Data']):
-                    if isinstance(row['Data'], str):
-                        # Converter string para date
-                        try:
-                            for formato in ['%Y-%m-%d', '%d/%m/%Y', '%d-%m-%Y']:
-                                try:
-                                    data_feriado = pd.to_datetime(row['Data'], format=formato).date()
-                                    feriados.append(data_feriado)
-                                    break
-                                except:
-                                    continue
-                        except:
-                            continue
-                    else:
-                        # Já é um objeto date
-                        feriados.append(row['Data'])
+        if isinstance(df_feriados, CalendarioFeriados):
+            return df_feriados
+        if df_feriados is None or df_feriados.empty:
+            return CalendarioFeriados()
         
-        return feriados
+        tabela, _ = tabela_feriados(df_feriados, self.diagnosticos)
+        return CalendarioFeriados.de_tabela(tabela, self.data_inicio, self.data_fim)
     
-    def gerar_escala_completa(self, df_colaboradores: pd.DataFrame) -> pd.DataFrame:
+    def gerar_escala_completa(self, df_colaboradores: pd.DataFrame, processos: int = 1,
+                              tamanho_lote: int = 1000, excecoes: pd.DataFrame = None) -> pd.DataFrame:
         """
         Gera a escala completa para todos os colaboradores.
         
         Args:
             df_colaboradores: DataFrame com os dados dos colaboradores
+            processos: Quantidade de processos de trabalho (1 = serial; 0 ou None = um por CPU)
+            tamanho_lote: Quantidade de colaboradores por lote na geração paralela
+            excecoes: Tabela longa de exceções (ver gerar_matriz_escala, opcional)
             
         Returns:
-            DataFrame com a escala completa
+            DataFrame com a escala completa (idêntico no modo serial e no paralelo)
         """
-        if df_colaboradores.empty:
+        matriz = self.gerar_matriz_escala(df_colaboradores, processos, tamanho_lote, excecoes)
+        if matriz.vazia:
             return pd.DataFrame()
         
-        escalas = []
-        dados_completos = []  # Para relatórios específicos
+        # Formato longo montado uma única vez a partir da matriz
+        escala_completa = matriz.para_longo(self.rotulos_coloridos())
+        self._escala_completa = escala_completa
         
-        for _, colaborador in df_colaboradores.iterrows():
-            escala_colaborador = self._gerar_escala_colaborador(colaborador)
-            if not escala_colaborador.empty:
-                escalas.append(escala_colaborador)
-                
-                # Manter dados completos para relatórios específicos
-                dados_completos.extend(escala_colaborador.to_dict('records'))
-        
-        if not escalas:
+        return escala_completa
+    
+    @classmethod
+    def gerar_unidades(cls, data_inicio: date, data_fim: date, unidades: Iterable[Tuple[str, pd.DataFrame, Any]],
+                       diagnosticos: ColetorDiagnosticos = None) -> Dict[str, 'GeradorEscala']:
+        """
+        Gera a escala de várias unidades no mesmo período, em uma única passada.
+        
+        O calendário do período é montado uma vez (cada unidade recalcula apenas
+        a máscara dos seus feriados), os dados de todas as unidades são normalizados
+        juntos (um formato de data por coluna do cadastro conjunto; os avisos de
+        datas fora do formato vão para todas as unidades) e as escalas base que não dependem de feriados (6x1, plantões,
+        12x36, 24x72) vêm do cache compartilhado, geradas uma única vez para todas
+        as unidades.
+        
+        Args:
+            data_inicio: Data de início do período
+            data_fim: Data de fim do período
+            unidades: Tuplas (unidade, DataFrame de colaboradores, feriados) - os feriados
+                como DataFrame ou CalendarioFeriados, como em GeradorEscala
+            diagnosticos: Coletor onde os avisos de todas as unidades são registrados
+                (opcional; por padrão cada unidade tem o seu)
+            
+        Returns:
+            Dict unidade → gerador, com matriz_escala, controle_6x1, estatisticas_execucao
+            e diagnosticos da unidade já preenchidos
+        """
+        unidades = list(unidades)
+        periodo = Calendario(data_inicio, data_fim)
+        
+        # Datas e exceções de todas as unidades convertidas de uma só vez; as fatias de
+        # cada unidade já chegam normalizadas e gerar_matriz_escala não as converte de novo
+        diagnosticos_conversao = diagnosticos if diagnosticos is not None else ColetorDiagnosticos()
+        normalizados = normalizar_colaboradores(
+            pd.concat([df_colaboradores for _, df_colaboradores, _ in unidades], ignore_index=True),
+            diagnosticos_conversao
+        ) if unidades else None
+        
+        geradores = {}
+        inicio = 0
+        for unidade, df_colaboradores, feriados in unidades:
+            gerador = cls(data_inicio, data_fim, feriados, unidade, diagnosticos, periodo=periodo)
+            if diagnosticos is None:
+                gerador.diagnosticos.estender(diagnosticos_conversao)
+            gerador.gerar_matriz_escala(normalizados.iloc[inicio:inicio + len(df_colaboradores)])
+            inicio += len(df_colaboradores)
+            geradores[unidade] = gerador
+        return geradores
+    
+    def gerar_matriz_escala(self, df_colaboradores: pd.DataFrame, processos: int = 1,
+                            tamanho_lote: int = 1000, excecoes: pd.DataFrame = None) -> MatrizEscala:
+        """
+        Gera a escala de todos os colaboradores como matriz colaboradores × dias.
+        
+        A matriz fica disponível em matriz_escala e seus metadados (uma linha por
+        colaborador) em controle_6x1.
+        
+        Args:
+            df_colaboradores: DataFrame com os dados dos colaboradores, em texto ou já
+                normalizado (usado sem nova conversão; ver normalizar_colaboradores)
+            processos: Quantidade de processos de trabalho (1 = serial; 0 ou None = um por CPU)
+            tamanho_lote: Quantidade de colaboradores por lote na geração paralela
+            excecoes: Tabela longa de exceções (Nome ou Id, Tipo, Inicio, Fim; ver
+                excel_utils.ler_planilha_excecoes), aplicada junto com as exceções
+                dos campos de cada colaborador (opcional)
+            
+        Returns:
+            MatrizEscala com uma linha por colaborador incluído na escala
+        """
+        # Datas e exceções convertidas uma única vez, para todos os colaboradores
+        # (DataFrames já normalizados, como as fatias de gerar_unidades, passam direto)
+        df_colaboradores = normalizar_colaboradores(df_colaboradores, self.diagnosticos)
+        
+        # Colunas pré-alocadas (colaboradores × dias), preenchidas no lugar
+        montador = MontadorEscala(self.calendario, len(df_colaboradores))
+        da_tabela = self._juntar_excecoes(df_colaboradores, excecoes)
+        
+        processos = processos or os.cpu_count() or 1
+        tamanho_lote = max(1, int(tamanho_lote))
+        if processos > 1 and len(df_colaboradores) >= self.MINIMO_COLABORADORES_PARALELO \
+                and len(df_colaboradores) > tamanho_lote:
+            chaves_base = self._gerar_paralelo(df_colaboradores, montador, processos, tamanho_lote)
+            if da_tabela is not None:
+                # Reaplica as exceções dos campos junto com as da tabela, na ordem de precedência
+                self._aplicar_excecoes_lote(montador, df_colaboradores, self._estados_finais, da_tabela)
+            modo = 'paralelo'
+        else:
+            # Escalas base distintas, compartilhadas por perfil de regra
+            escalas_base = {}
+            estados_finais = []
+            for colaborador in df_colaboradores.to_dict('records'):
+                escala_base = self._preencher_escala_colaborador(colaborador, montador, escalas_base, excecoes=False)
+                estados_finais.append(escala_base['estado_final'] if escala_base else None)
+            # Exceções de todos os colaboradores aplicadas de uma só vez
+            self._aplicar_excecoes_lote(montador, df_colaboradores, estados_finais, da_tabela)
+            self._estados_finais = estados_finais
+            chaves_base = set(escalas_base)
+            processos = 1
+            modo = 'serial'
+        
+        # Estatísticas da execução
+        self.estatisticas_execucao = {
+            'colaboradores': len(df_colaboradores),
+            'escalas_base_distintas': len(chaves_base),
+            'razao_deduplicacao': round(len(df_colaboradores) / len(chaves_base), 2) if chaves_base else 0.0,
+            'modo': modo,
+            'processos': processos,
+            'cache': self.regras_clt.cache_info()
+        }
+        
+        # O controle 6x1 são os metadados da matriz (uma linha por colaborador)
+        self.matriz_escala = montador.construir_matriz()
+        self.controle_6x1 = self.matriz_escala.metadados
+        
+        return self.matriz_escala
+    
+    def gerar_tabelas_escala(self, df_colaboradores: pd.DataFrame, processos: int = 1,
+                             tamanho_lote: int = 1000,
+                             excecoes: pd.DataFrame = None) -> Tuple[pd.DataFrame, pd.DataFrame]:
+        """
+        Gera a escala como tabela de fatos diária e dimensão de colaboradores.
+        
+        A tabela de fatos tem apenas colunas numéricas (Id_Colaborador, Dia, Status);
+        identificação e controle 6x1 ficam uma única vez na dimensão. Os relatórios
+        (gerar_resumo_estatisticas, gerar_relatorio_plantoes) aceitam a tabela de
+        fatos e a ligam à dimensão desta geração pelo Id_Colaborador.
+        
+        Args:
+            df_colaboradores: DataFrame com os dados dos colaboradores
+            processos: Quantidade de processos de trabalho (ver gerar_matriz_escala)
+            tamanho_lote: Quantidade de colaboradores por lote na geração paralela
+            excecoes: Tabela longa de exceções (ver gerar_matriz_escala, opcional)
+            
+        Returns:
+            Tupla (tabela de fatos, dimensão de colaboradores)
+        """
+        matriz = self.gerar_matriz_escala(df_colaboradores, processos, tamanho_lote, excecoes)
+        return matriz.para_fatos(), matriz.dimensao_colaboradores()
+    
+    def atualizar(self, df_colaboradores: pd.DataFrame, excecoes: pd.DataFrame = None) -> pd.DataFrame:
+        """
+        Atualiza a escala recalculando apenas os colaboradores alterados.
+        
+        Cada colaborador é identificado pela impressão digital dos campos que
+        determinam sua escala (CAMPOS_IMPRESSAO) e das suas exceções na tabela
+        longa de exceções, se houver. Linhas com impressão já gerada
+        são reaproveitadas; apenas as novas ou alteradas são recalculadas, e as
+        removidas são descartadas. Na primeira chamada todos são gerados.
+        
+        O resultado é idêntico ao de gerar_escala_completa, e os diagnósticos
+        passam a refletir a escala atual.
+        
+        Args:
+            df_colaboradores: DataFrame com os dados (atuais) dos colaboradores
+            excecoes: Tabela longa de exceções (atual; ver gerar_matriz_escala, opcional)
+            
+        Returns:
+            DataFrame com a escala completa
+        """
+        anteriores = self._linhas_geradas
+        atuais = {}
+        recalculados = 0
+        
+        self.diagnosticos.limpar()
+        df_colaboradores = normalizar_colaboradores(df_colaboradores, self.diagnosticos)
+        da_tabela = self._intervalos_por_colaborador(self._juntar_excecoes(df_colaboradores, excecoes),
+                                                     len(df_colaboradores))
+        linhas = []
+        self._estados_finais = []
+        for posicao, impressao in enumerate(self._impressoes(df_colaboradores)):
+            # Alterar apenas as exceções da tabela também altera a impressão
+            impressao += (da_tabela[posicao],)
+            linha = atuais.get(impressao) or anteriores.get(impressao)
+            if linha is None:
+                linha = self._gerar_linha(df_colaboradores.iloc[posicao], da_tabela[posicao])
+                recalculados += 1
+            atuais[impressao] = linha
+            self._estados_finais.append(linha['estado_final'])
+            self.diagnosticos.estender(linha['diagnosticos'])
+            if linha['status'] is not None:
+                linhas.append(linha)
+        self._linhas_geradas = atuais
+        
+        # Escalas base de colaboradores que saíram do cadastro não ficam retidas
+        usadas = {id(linha['escala_base']) for linha in atuais.values()}
+        self._escalas_base = {chave: escala_base for chave, escala_base in self._escalas_base.items()
+                              if id(escala_base) in usadas}
+        
+        # Matriz montada com as linhas (reaproveitadas ou recalculadas) na ordem atual
+        status = np.empty((len(linhas), len(self.calendario)), dtype=np.uint8)
+        for indice, linha in enumerate(linhas):
+            status[indice] = linha['status']
+        metadados = pd.DataFrame(
+            [linha['metadados'] for linha in linhas],
+            columns=MontadorEscala.COLUNAS_TEXTO + MontadorEscala.COLUNAS_CONTROLE
+        ).astype({'Domingos_Folgados': np.int64, 'Semanas_Sem_Domingo': np.int64})
+        self.matriz_escala = MatrizEscala(status, metadados, self.calendario)
+        self.controle_6x1 = self.matriz_escala.metadados
+        
+        self.estatisticas_execucao = {
+            'colaboradores': len(df_colaboradores),
+            'escalas_base_distintas': len(self._escalas_base),
+            'razao_deduplicacao': round(len(df_colaboradores) / len(self._escalas_base), 2) if self._escalas_base else 0.0,
+            'modo': 'incremental',
+            'processos': 1,
+            'recalculados': recalculados,
+            'reaproveitados': len(df_colaboradores) - recalculados,
+            'cache': self.regras_clt.cache_info()
+        }
+        
+        if self.matriz_escala.vazia:
             return pd.DataFrame()
         
-        # Concatenar todas as escalas
-        escala_completa = pd.concat(escalas, ignore_index=True)
+        escala_completa = self.matriz_escala.para_longo(self.rotulos_coloridos())
+        self._escala_completa = escala_completa
+        return escala_completa
+    
+    def _impressoes(self, df_colaboradores: pd.DataFrame) -> List[tuple]:
+        """
+        Calcula a impressão digital de cada colaborador (valores de CAMPOS_IMPRESSAO).
+        
+        Args:
+            df_colaboradores: DataFrame com os dados dos colaboradores já normalizados
+            
+        Returns:
+            Lista de tuplas, na ordem das linhas (valores ausentes viram None)
+        """
+        campos = df_colaboradores.reindex(columns=self.CAMPOS_IMPRESSAO).astype(object)
+        campos = campos.where(campos.notna(), None)
+        return list(campos.itertuples(index=False, name=None))
+    
+    def _intervalos_por_colaborador(self, da_tabela: Optional[pd.DataFrame],
+                                    quantidade: int) -> List[Tuple[IntervaloExcecao, ...]]:
+        """
+        Agrupa os intervalos da tabela de exceções por colaborador.
+        
+        Args:
+            da_tabela: Intervalos com 'Linha' = posição do colaborador (ver _juntar_excecoes), ou None
+            quantidade: Quantidade de colaboradores
+            
+        Returns:
+            Tupla ordenada de intervalos de cada colaborador, na ordem do DataFrame
+        """
+        por_colaborador = [[] for _ in range(quantidade)]
+        if da_tabela is not None:
+            da_tabela = da_tabela.sort_values(COLUNAS_INTERVALOS)
+            for linha, tipo, inicio, fim in zip(da_tabela['Linha'].tolist(), da_tabela['Tipo'].tolist(),
+                                                da_tabela['Inicio'].to_numpy(dtype='datetime64[D]').tolist(),
+                                                da_tabela['Fim'].to_numpy(dtype='datetime64[D]').tolist()):
+                por_colaborador[linha].append(IntervaloExcecao(TipoExcecao(tipo), inicio, fim))
+        return [tuple(intervalos) for intervalos in por_colaborador]
+    
+    def _gerar_linha(self, colaborador: pd.Series,
+                     intervalos_tabela: Tuple[IntervaloExcecao, ...] = ()) -> Dict[str, Any]:
+        """
+        Gera a linha da escala de um colaborador, guardando seus diagnósticos.
+        
+        Args:
+            colaborador: Série pandas com os dados do colaborador
+            intervalos_tabela: Intervalos do colaborador na tabela longa de exceções (opcional)
+            
+        Returns:
+            Dict com 'status' (códigos do período, ou None se o colaborador não entra
+            na escala), 'metadados' (textos e controle 6x1), 'estado_final', 'diagnosticos'
+            e 'escala_base' (entrada de _escalas_base usada pela linha)
+        """
+        diagnosticos, self.diagnosticos = self.diagnosticos, ColetorDiagnosticos()
+        try:
+            montador = MontadorEscala(self.calendario, 1)
+            escala_base = self._preencher_escala_colaborador(colaborador, montador, self._escalas_base,
+                                                             intervalos_tabela=intervalos_tabela)
+            linha = {'status': None, 'metadados': None, 'diagnosticos': list(self.diagnosticos),
+                     'estado_final': escala_base['estado_final'] if escala_base else None,
+                     'escala_base': escala_base}
+        finally:
+            self.diagnosticos = diagnosticos
+        
+        if escala_base:
+            status, textos, controle = montador.para_arrays()
+            status = status[0].copy()
+            status.flags.writeable = False
+            linha['status'] = status
+            linha['metadados'] = tuple(valores[0] for valores in {**textos, **controle}.values())
+        return linha
+    
+    def iter_escala(self, df_colaboradores: pd.DataFrame, tamanho_lote: int = 500,
+                    formato: str = 'pandas', excecoes: pd.DataFrame = None) -> Iterator[Any]:
+        """
+        Gera a escala em lotes de colaboradores, sem manter o período inteiro em memória.
+        
+        Cada lote é entregue assim que fica pronto, com as mesmas colunas (e a mesma
+        ordem de linhas) de gerar_escala_completa. Ao final, controle_6x1 e
+        estatisticas_execucao ficam disponíveis como na geração completa.
+        
+        Args:
+            df_colaboradores: DataFrame com os dados dos colaboradores
+            tamanho_lote: Quantidade de colaboradores por lote
+            formato: 'pandas' (DataFrame) ou 'arrow' (pyarrow.RecordBatch)
+            excecoes: Tabela longa de exceções (ver gerar_matriz_escala, opcional)
+            
+        Returns:
+            Iterador de lotes da escala (lotes sem colaboradores válidos são omitidos)
+        """
+        if formato not in ('pandas', 'arrow'):
+            raise ValueError(f"Formato de lote '{formato}' não suportado")
+        
+        tamanho_lote = max(1, int(tamanho_lote))
+        rotulos_coloridos = self.rotulos_coloridos()
+        escalas_base = {}
+        controles = []
+        self._estados_finais = []
+        # Cadastro normalizado de uma só vez (um formato de data por coluna, não por lote)
+        df_colaboradores = normalizar_colaboradores(df_colaboradores, self.diagnosticos)
+        # Tabela de exceções ligada uma única vez ao cadastro inteiro, e recortada por lote
+        da_tabela = self._juntar_excecoes(df_colaboradores, excecoes)
+        
+        for inicio in range(0, len(df_colaboradores), tamanho_lote):
+            lote = df_colaboradores.iloc[inicio:inicio + tamanho_lote]
+            montador = MontadorEscala(self.calendario, len(lote))
+            estados_finais = []
+            for colaborador in lote.to_dict('records'):
+                escala_base = self._preencher_escala_colaborador(colaborador, montador, escalas_base, excecoes=False)
+                estados_finais.append(escala_base['estado_final'] if escala_base else None)
+            da_lote = None
+            if da_tabela is not None:
+                no_lote = da_tabela['Linha'].between(inicio, inicio + len(lote) - 1)
+                da_lote = da_tabela[no_lote].assign(Linha=lambda tabela: tabela['Linha'] - inicio)
+            self._aplicar_excecoes_lote(montador, lote, estados_finais, da_lote)
+            self._estados_finais.extend(estados_finais)
+            
+            matriz = montador.construir_matriz()
+            controles.append(matriz.metadados)
+            if matriz.vazia:
+                continue
+            if formato == 'arrow':
+                yield matriz.para_arrow(rotulos_coloridos)
+            else:
+                yield matriz.para_longo(rotulos_coloridos)
+        
+        self.controle_6x1 = pd.concat(controles, ignore_index=True) if controles else None
+        self.estatisticas_execucao = {
+            'colaboradores': len(df_colaboradores),
+            'escalas_base_distintas': len(escalas_base),
+            'razao_deduplicacao': round(len(df_colaboradores) / len(escalas_base), 2) if escalas_base else 0.0,
+            'modo': 'lotes',
+            'processos': 1,
+            'cache': self.regras_clt.cache_info()
+        }
+    
+    def _gerar_paralelo(self, df_colaboradores: pd.DataFrame, montador: MontadorEscala,
+                        processos: int, tamanho_lote: int) -> set:
+        """
+        Gera a escala em lotes de colaboradores distribuídos entre processos.
         
-        # Armazenar dados completos para uso nos relatórios
-        self._dados_completos = pd.DataFrame(dados_completos)
+        Cada processo devolve apenas arrays compactos (códigos de status e colunas
+        do lote); os lotes são anexados ao montador na ordem original, de modo que
+        a escala e os diagnósticos são idênticos aos do modo serial.
         
-        # Para a escala completa, retornar apenas as colunas básicas
-        colunas_escala_completa = ['Nome', 'Cargo', 'Tipo_Escala', 'Turno', 'Data', 'Status', 'Status_Colorido']
+        Args:
+            df_colaboradores: DataFrame com os dados dos colaboradores
+            montador: Montador com as colunas pré-alocadas da escala
+            processos: Quantidade de processos de trabalho
+            tamanho_lote: Quantidade de colaboradores por lote
+            
+        Returns:
+            Conjunto das chaves das escalas base distintas
+        """
+        lotes = [df_colaboradores.iloc[inicio:inicio + tamanho_lote]
+                 for inicio in range(0, len(df_colaboradores), tamanho_lote)]
+        chaves_base = set()
+        self._estados_finais = []
+        
+        with ProcessPoolExecutor(
+            max_workers=min(processos, len(lotes)),
+            initializer=_inicializar_trabalhador,
+            initargs=(self.data_inicio, self.data_fim, self.calendario_feriados, self.unidade)
+        ) as executor:
+            for resultado in executor.map(_gerar_lote_trabalhador, lotes):
+                montador.anexar(resultado['status'], resultado['textos'], resultado['controle'])
+                chaves_base.update(resultado['chaves_base'])
+                self._estados_finais.extend(resultado['estados_finais'])
+                self.diagnosticos.estender(resultado['diagnosticos'])
+        
+        return chaves_base
+    
+    @property
+    def _dados_completos(self) -> pd.DataFrame:
+        """
+        Escala completa com as colunas de controle 6x1 repetidas em cada dia.
         
-        return escala_completa[colunas_escala_completa]
+        Montada sob demanda a partir da escala e da tabela de controle por colaborador.
+        """
+        if self._escala_completa is None:
+            raise AttributeError('_dados_completos')
+        
+        dias = len(self.calendario)
+        return self._escala_completa.assign(**{
+            coluna: np.repeat(self.controle_6x1[coluna].to_numpy(), dias)
+            for coluna in MontadorEscala.COLUNAS_CONTROLE
+        })
     
-    def _gerar_escala_colaborador(self, colaborador: pd.Series) -> pd.DataFrame:
+    def _gerar_escala_colaborador(self, colaborador: pd.Series, escalas_base: Dict[tuple, Dict[str, Any]] = None) -> pd.DataFrame:
         """
         Gera a escala para um colaborador específico.
         
         Args:
             colaborador: Série pandas com os dados do colaborador
+            escalas_base: Escalas base já geradas, por perfil de regra (opcional).
+                Quando informado, a escala base é reaproveitada e a nova é registrada.
             
         Returns:
-            DataFrame com a escala do colaborador
+            DataFrame com a escala do colaborador, incluindo as colunas de controle 6x1
+        """
+        montador = MontadorEscala(self.calendario, 1)
+        colaborador = normalizar_colaboradores(colaborador.to_frame().T, self.diagnosticos).iloc[0]
+        self._preencher_escala_colaborador(colaborador, montador, escalas_base)
+        if montador.vazio:
+            return pd.DataFrame()
+        return montador.construir_matriz().para_longo(self.rotulos_coloridos(), controle=True, categoricos=False)
+    
+    def _preencher_escala_colaborador(self, colaborador: pd.Series, montador: 'MontadorEscala',
+                                      escalas_base: Dict[tuple, Dict[str, Any]] = None,
+                                      excecoes: bool = True,
+                                      intervalos_tabela: Tuple[IntervaloExcecao, ...] = ()) -> Optional[Dict[str, Any]]:
+        """
+        Gera a escala de um colaborador diretamente na próxima linha do montador.
+        
+        Args:
+            colaborador: Série pandas com os dados do colaborador, já normalizados
+                (ver normalizar_colaboradores)
+            montador: Montador com as colunas pré-alocadas da escala
+            escalas_base: Escalas base já geradas, por perfil de regra (opcional).
+                Quando informado, a escala base é reaproveitada e a nova é registrada.
+            excecoes: Se False, a linha recebe apenas a escala base e as exceções ficam
+                para _aplicar_excecoes_lote
+            intervalos_tabela: Intervalos do colaborador na tabela longa de exceções,
+                aplicados junto com os dos campos (opcional)
+            
+        Returns:
+            Escala base do colaborador (ver _gerar_escala_base), ou None se ele não foi
+            incluído na escala
         """
         nome = colaborador['Nome']
         tipo_escala = colaborador['Tipo_Escala']
         turno = colaborador['Turno']
-        atestados = colaborador.get('Atestados', '')
-        ferias = colaborador.get('Ferias', '')
-        escalas_manuais = colaborador.get('Escalas_Manuais', '')
-        ultimo_plantao_mes_anterior = colaborador.get('Ultimo_Plantao_Mes_Anterior', '')
-        ultimo_domingo_folga = colaborador.get('Ultimo_Domingo_Folga', '')
-        
-        # Processar último plantão do mês anterior
-        ultimo_plantao = None
-        if ultimo_plantao_mes_anterior and ultimo_plantao_mes_anterior.strip():
-            try:
-                for formato in ['%d/%m/%Y', '%d-%m-%Y', '%Y-%m-%d']:
-                    try:
-                        ultimo_plantao = datetime.strptime(ultimo_plantao_mes_anterior.strip(), formato).date()
-                        break
-                    except ValueError:
-                        continue
-            except:
-                pass
-        
-        # Processar último domingo de folga
-        ultimo_domingo = None
-        if ultimo_domingo_folga and str(ultimo_domingo_folga).strip():
-            valor = str(ultimo_domingo_folga).strip()
-            convertido = False
-            for formato in ['%d/%m/%Y', '%d-%m-%Y', '%Y-%m-%d', '%Y-%m-%d %H:%M:%S']:
-                try:
-                    ultimo_domingo = datetime.strptime(valor, formato).date()
-                    convertido = True
-                    break
-                except ValueError:
-                    continue
-            if not convertido:
-                try:
-                    # Tentar converter se vier como datetime do pandas
-                    if hasattr(ultimo_domingo_folga, 'date'):
-                        ultimo_domingo = ultimo_domingo_folga.date()
-                        convertido = True
-                except Exception:
-                    pass
-            if not convertido:
-                if tipo_escala.startswith('M6X1') or tipo_escala.startswith('T6X1') or tipo_escala.startswith('N6X1'):
-                    st.warning(f"Não foi possível converter o campo 'Ultimo_Domingo_Folga' para o colaborador: {nome}. Valor recebido: '{valor}'")
         
-        # Para plantões, determinar automaticamente o tipo baseado no último plantão
+        if tipo_escala not in self.regras_clt.tipos_escala:
+            self.diagnosticos.erro(
+                'tipo_invalido',
+                f"Colaborador {nome}: tipo de escala '{tipo_escala}' não suportado. O colaborador não foi incluído na escala.",
+                nome, tipo=tipo_escala
+            )
+            return None
+        
+        ultimo_plantao = para_data(colaborador['Ultimo_Plantao_Mes_Anterior'])
+        ultimo_domingo = para_data(colaborador['Ultimo_Domingo_Folga'])
+        
+        # Contadores 6x1 transportados do período anterior (colunas opcionais)
+        estado_6x1 = None
+        usa_ultimo_domingo = self.regras_clt.padroes[tipo_escala].usa_ultimo_domingo
+        if usa_ultimo_domingo:
+            dias_trabalhados, semanas_sem_domingo = (
+                None if pd.isna(colaborador[campo]) else int(colaborador[campo]) for campo in CAMPOS_CONTADOR
+            )
+            if dias_trabalhados is not None or semanas_sem_domingo is not None:
+                estado_6x1 = (dias_trabalhados or 0, semanas_sem_domingo)
+            
+            # Valores rejeitados na normalização que afetam a escala 6x1
+            for campo, valor in colaborador[COLUNA_REJEICOES]:
+                if campo == 'Ultimo_Domingo_Folga':
+                    self.diagnosticos.aviso(
+                        'data_invalida',
+                        f"Não foi possível converter o campo 'Ultimo_Domingo_Folga' para o colaborador: {nome}. Valor recebido: '{valor}'",
+                        nome, campo='Ultimo_Domingo_Folga', valor=valor
+                    )
+                elif campo in CAMPOS_CONTADOR:
+                    self.diagnosticos.aviso(
+                        'valor_invalido',
+                        f"Não foi possível converter o campo '{campo}' para o colaborador: {nome}. Valor recebido: '{valor}'",
+                        nome, campo=campo, valor=valor
+                    )
+        
+        # Escala base compartilhada entre colaboradores com o mesmo perfil de regra
+        chave_base = self._chave_escala_base(tipo_escala, ultimo_plantao, ultimo_domingo, estado_6x1)
+        if escalas_base is not None and chave_base in escalas_base:
+            escala_base = escalas_base[chave_base]
+        else:
+            escala_base = self._gerar_escala_base(tipo_escala, ultimo_plantao, ultimo_domingo, estado_6x1)
+            if escalas_base is not None:
+                escalas_base[chave_base] = escala_base
+        
+        status_base = escala_base['status']
+        info_controle = escala_base['info_controle']
+        
         if tipo_escala.startswith('P_') or tipo_escala.startswith('I_'):
-            tipo_escala_original = tipo_escala
+            # Se houve mudança no tipo inicial, mostrar aviso
+            if escala_base['tipo_inicial'] != tipo_escala:
+                self.diagnosticos.info(
+                    'ajuste_tipo',
+                    f"🔄 Colaborador {nome}: Tipo de plantão ajustado de {tipo_escala} para {escala_base['tipo_inicial']} devido à regra de alternância (mês anterior com 31 dias).",
+                    nome, tipo_anterior=tipo_escala, tipo_novo=escala_base['tipo_inicial']
+                )
+            
+            # Registrar as mudanças de tipo durante o período
+            for indice_mudanca, tipo_ant, tipo_novo in escala_base['mudancas']:
+                data_mudanca = self.calendario.datas_python[indice_mudanca]
+                self.diagnosticos.aviso(
+                    'mudanca_tipo',
+                    f"Colaborador {nome}: Tipo de plantão alterado automaticamente de {tipo_ant} para {tipo_novo} a partir de {data_mudanca:%d/%m/%Y}.",
+                    nome, tipo_anterior=tipo_ant, tipo_novo=tipo_novo, data=data_mudanca
+                )
+        
+        # Tipo concatenado quando houve mudanças de plantão no período
+        tipo_escala = escala_base['tipo_escala']
+        
+        if len(status_base) == 0:
+            return None
+        
+        # Aplicar exceções diretamente na linha pré-alocada do colaborador
+        linha = montador.adicionar(nome, colaborador['Cargo'], tipo_escala, turno, info_controle)
+        if not excecoes:
+            linha[:] = status_base
+            return escala_base
+        if intervalos_tabela:
+            intervalos = intervalos_excecoes(colaborador['Atestados'], colaborador['Ferias'],
+                                             colaborador['Escalas_Manuais'])
+            aplicar_intervalos(status_base, self.calendario, intervalos + list(intervalos_tabela), linha)
+            return escala_base
+        self.regras_clt.aplicar_excecoes_normalizadas(
+            status_base, self.calendario, colaborador['Atestados'], colaborador['Ferias'],
+            colaborador['Escalas_Manuais'], destino=linha
+        )
+        return escala_base
+    
+    def _aplicar_excecoes_lote(self, montador: 'MontadorEscala', colaboradores: pd.DataFrame,
+                               estados_finais: List[Optional[Dict[str, Any]]], da_tabela: pd.DataFrame = None):
+        """
+        Aplica de uma só vez as exceções dos colaboradores preenchidos sem exceções.
+        
+        Args:
+            montador: Montador cujas linhas foram preenchidas, a partir da primeira,
+                na ordem dos colaboradores
+            colaboradores: DataFrame normalizado dos colaboradores
+            estados_finais: Estado final de cada colaborador (None para os não incluídos na escala)
+            da_tabela: Intervalos da tabela longa de exceções, com 'Linha' = posição do
+                colaborador no DataFrame (ver _juntar_excecoes), aplicados junto com os
+                dos campos (opcional)
+        """
+        incluidos = np.array([estado is not None for estado in estados_finais], dtype=bool)
+        linhas = np.where(incluidos, np.cumsum(incluidos) - 1, -1)
+        intervalos = tabela_intervalos(colaboradores, linhas)
+        if da_tabela is not None and len(da_tabela):
+            # Posição do colaborador → linha da matriz (negativa para os não incluídos)
+            da_tabela = da_tabela.assign(Linha=linhas[da_tabela['Linha'].to_numpy()])
+            intervalos = pd.concat([intervalos, da_tabela[da_tabela['Linha'] >= 0]], ignore_index=True)
+        aplicar_intervalos_lote(montador.status, self.calendario, intervalos)
+    
+    def _juntar_excecoes(self, df_colaboradores: pd.DataFrame, excecoes: pd.DataFrame) -> Optional[pd.DataFrame]:
+        """
+        Liga a tabela longa de exceções aos colaboradores, avisando as chaves sem colaborador.
+        
+        Args:
+            df_colaboradores: DataFrame dos colaboradores
+            excecoes: Tabela longa de exceções (ver excel_utils.ler_planilha_excecoes), ou None
+            
+        Returns:
+            Intervalos (COLUNAS_INTERVALOS) com 'Linha' = posição do colaborador no
+            DataFrame, ou None se não houver tabela de exceções
+        """
+        if excecoes is None:
+            return None
+        da_tabela, desconhecidas = juntar_excecoes(df_colaboradores, excecoes, diagnosticos=self.diagnosticos)
+        if desconhecidas:
+            self.diagnosticos.aviso(
+                'excecao_sem_colaborador',
+                f"Exceções ignoradas: nenhum colaborador encontrado para {', '.join(map(str, desconhecidas))}",
+                chaves=desconhecidas
+            )
+        return da_tabela
+    
+    def _chave_escala_base(self, tipo_escala: str, ultimo_plantao: date = None, ultimo_domingo: date = None,
+                           estado_6x1: Tuple[int, Optional[int]] = None) -> tuple:
+        """
+        Monta a chave com os dados que determinam a escala base de um colaborador.
+        
+        Args:
+            tipo_escala: Tipo de escala do colaborador
+            ultimo_plantao: Último plantão do mês anterior (já convertido)
+            ultimo_domingo: Último domingo de folga (já convertido)
+            estado_6x1: Contadores 6x1 transportados do período anterior (opcional)
+            
+        Returns:
+            Tupla usada para compartilhar escalas base idênticas
+        """
+        padrao = self.regras_clt.padroes.get(tipo_escala)
+        if tipo_escala.startswith('P_') or tipo_escala.startswith('I_') or (padrao and padrao.usa_ultimo_plantao):
+            return (tipo_escala, ultimo_plantao)
+        elif padrao and padrao.usa_ultimo_domingo:
+            return (tipo_escala, ultimo_domingo, estado_6x1)
+        return (tipo_escala,)
+    
+    def _gerar_escala_base(self, tipo_escala: str, ultimo_plantao: date = None, ultimo_domingo: date = None,
+                           estado_6x1: Tuple[int, Optional[int]] = None) -> Dict[str, Any]:
+        """
+        Gera a escala base (antes das exceções) para um perfil de regra.
+        
+        Args:
+            tipo_escala: Tipo de escala
+            ultimo_plantao: Último plantão do mês anterior (para plantões)
+            ultimo_domingo: Último domingo de folga (para escalas 6x1)
+            estado_6x1: Dias trabalhados em sequência e semanas sem domingo antes do
+                período (para escalas 6x1, opcional)
             
+        Returns:
+            Dict com 'status' (array somente leitura), 'info_controle', 'tipo_escala'
+            (concatenado em caso de mudança), 'tipo_inicial', 'mudancas' e 'estado_final'
+            (campos de CAMPOS_ESTADO que iniciam o período seguinte)
+        """
+        # Para plantões, determinar automaticamente o tipo baseado no último plantão
+        if tipo_escala.startswith('P_') or tipo_escala.startswith('I_'):
             # Determinar o tipo inicial considerando a regra de alternância
-            tipo_atual = self._determinar_tipo_plantao_inicial(tipo_escala, self.data_inicio, ultimo_plantao)
+            tipo_inicial = self._determinar_tipo_plantao_inicial(tipo_escala, self.data_inicio, ultimo_plantao)
             
-            # Se houve mudança no tipo inicial, mostrar aviso
-            if tipo_atual != tipo_escala_original:
-                st.info(f"🔄 Colaborador {nome}: Tipo de plantão ajustado de {tipo_escala_original} para {tipo_atual} devido à regra de alternância (mês anterior com 31 dias).")
-            
-            data_atual = self.data_inicio
-            data_fim = self.data_fim
-            escalas_mes = []
-            ultimo_plantao = None
-            avisos_mudanca = []
-            tipos_utilizados = [tipo_atual]  # Lista para rastrear todos os tipos utilizados
-            
-            while data_atual <= data_fim:
-                # Determinar o último dia do mês atual
-                ultimo_dia_mes = (data_atual.replace(day=1) + timedelta(days=32)).replace(day=1) - timedelta(days=1)
-                fim_periodo = min(ultimo_dia_mes, data_fim)
-                
-                # Gerar escala para o mês atual
-                escala_mes = self.regras_clt.gerar_escala_base(
-                    tipo_atual, data_atual, fim_periodo, self.feriados, ultimo_plantao
-                )
-                
-                # Adicionar tipo vigente em cada dia
-                for data in escala_mes:
-                    escala_mes[data] = (escala_mes[data], tipo_atual)
-                escalas_mes.append(escala_mes)
-                
-                # Preparar para o próximo mês
-                ultimo_plantao = fim_periodo
-                
-                # Avançar para o próximo mês
-                data_atual = fim_periodo + timedelta(days=1)
-                
-                if data_atual <= data_fim:
-                    # REGRA DE ALTERNÂNCIA: Trocar a paridade apenas se o mês terminar em 31
-                    if ultimo_dia_mes.day == 31:
-                        tipo_novo = self.regras_clt.determinar_tipo_plantao_automatico(ultimo_plantao, tipo_atual)
-                        if tipo_novo != tipo_atual:
-                            avisos_mudanca.append((fim_periodo, tipo_atual, tipo_novo))
-                            tipos_utilizados.append(tipo_novo)  # Adicionar novo tipo à lista
-                        tipo_atual = tipo_novo
-                    # Para meses com 28, 29 ou 30 dias, a paridade é mantida e tipo_atual não muda.
-            
-            # Concatenar todas as escalas dos meses
-            escala_base = {}
-            for escala_mes in escalas_mes:
-                escala_base.update(escala_mes)
+            # Período inteiro em uma passada: a paridade inverte a cada mês de 31 dias atravessado
+            status, tipos_utilizados, mudancas = self.regras_clt.gerar_plantao_vetorizado(
+                tipo_inicial, self.calendario
+            )
             info_controle = {}
             
-            # Mostrar avisos de mudança de tipo durante o período
-            for data_mudanca, tipo_ant, tipo_novo in avisos_mudanca:
-                st.warning(f"Colaborador {nome}: Tipo de plantão alterado automaticamente de {tipo_ant} para {tipo_novo} a partir de {data_mudanca + timedelta(days=1):%d/%m/%Y}.")
-            
             # Criar tipo concatenado se houve mudanças
-            if len(tipos_utilizados) > 1:
-                tipo_escala_final = " - ".join(tipos_utilizados)
-            else:
-                tipo_escala_final = tipos_utilizados[0]
-            
-            # Atualizar tipo_escala para o tipo concatenado
-            tipo_escala = tipo_escala_final
-        # Gerar escala base para outros tipos
-        elif tipo_escala.startswith('M6X1') or tipo_escala.startswith('T6X1') or tipo_escala.startswith('N6X1'):
-            resultado = self.regras_clt.gerar_escala_base(
-                tipo_escala, self.data_inicio, self.data_fim, self.feriados, 
-                ultimo_plantao, ultimo_domingo
-            )
-            if isinstance(resultado, tuple):
-                escala_base, info_controle = resultado
-            else:
-                escala_base = resultado
-                info_controle = {}
+            tipo_escala_final = " - ".join(tipos_utilizados)
+            
+            # O período seguinte parte do tipo vigente no último dia e do último plantão
+            dias_plantao = np.flatnonzero(status != StatusEscala.FOLGA)
+            estado_final = {'Tipo_Escala': tipos_utilizados[-1]}
+            if len(dias_plantao):
+                estado_final['Ultimo_Plantao_Mes_Anterior'] = self.calendario.datas_python[dias_plantao[-1]]
         else:
-            escala_base = self.regras_clt.gerar_escala_base(
-                tipo_escala, self.data_inicio, self.data_fim, self.feriados, ultimo_plantao
+            # Demais tipos (44H, 40H, 6x1 e rotativos) geram o período inteiro de uma vez
+            status, info_controle = self.regras_clt.gerar_escala_vetorizada(
+                tipo_escala, self.data_inicio, self.data_fim, self.feriados,
+                ultimo_plantao, ultimo_domingo, self.calendario, estado_6x1
             )
-            info_controle = {}
-        
-        # Aplicar exceções
-        escala_final = self.regras_clt.aplicar_excecoes(
-            escala_base, atestados, ferias, escalas_manuais
-        )
+            tipo_inicial = tipo_escala
+            tipo_escala_final = tipo_escala
+            mudancas = []
+            estado_final = self._estado_final(tipo_escala, ultimo_plantao, ultimo_domingo, estado_6x1, info_controle)
+        
+        # A escala base é compartilhada (e vem do cache): exceções sempre trabalham sobre uma cópia
+        status.flags.writeable = False
+        
+        return {
+            'status': status,
+            'info_controle': info_controle,
+            'tipo_escala': tipo_escala_final,
+            'tipo_inicial': tipo_inicial,
+            'mudancas': mudancas,
+            'estado_final': estado_final
+        }
+    
+    def _estado_final(self, tipo_escala: str, ultimo_plantao: date, ultimo_domingo: date,
+                      estado_6x1: Tuple[int, Optional[int]], info_controle: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Calcula os campos que iniciam o período seguinte (escalas fixas, 6x1 e rotativas).
         
-        # Converter para DataFrame
-        dados_escala = []
-        for data, status in escala_final.items():
-            if isinstance(status, tuple):
-                status_real, tipo_vigente = status
-            else:
-                status_real = status
-                tipo_vigente = tipo_escala
-            dados_escala.append({
-                'Nome': nome,
-                'Cargo': colaborador['Cargo'],
-                'Tipo_Escala': tipo_escala,  # Usar o tipo concatenado para todos os dias
-                'Turno': turno,
-                'Data': data,
-                'Status': status_real,
-                'Status_Colorido': f"{self.cores.get(status_real, '⚪')} {status_real}",
-                'Ultimo_Domingo_Folga': info_controle.get('ultimo_domingo_folga', ''),
-                'Domingos_Folgados': info_controle.get('domingos_folgados', 0),
-                'Semanas_Sem_Domingo': info_controle.get('semanas_sem_domingo', 0)
+        Args:
+            tipo_escala: Tipo de escala
+            ultimo_plantao: Último dia trabalhado antes do período (escalas rotativas)
+            ultimo_domingo: Último domingo de folga antes do período (escalas 6x1)
+            estado_6x1: Contadores 6x1 antes do período (opcional)
+            info_controle: Controle 6x1 do período
+            
+        Returns:
+            Dict com os campos de CAMPOS_ESTADO aplicáveis ao tipo de escala
+        """
+        padrao = self.regras_clt.padroes[tipo_escala]
+        estado_final = {'Tipo_Escala': tipo_escala}
+        if padrao.usa_ultimo_plantao:
+            estado_final['Ultimo_Plantao_Mes_Anterior'] = padrao.ancora_seguinte(self.calendario, ultimo_plantao)
+        elif padrao.usa_ultimo_domingo:
+            dias_trabalhados, semanas_sem_domingo = estado_6x1 or (0, None)
+            dias_trabalhados, semanas_sem_domingo = self.regras_clt.estado_final_6x1(
+                self.calendario, ultimo_domingo, dias_trabalhados, semanas_sem_domingo
+            )
+            estado_final.update({
+                'Ultimo_Domingo_Folga': info_controle.get('ultimo_domingo_folga'),
+                'Dias_Trabalhados_Seguidos': dias_trabalhados,
+                'Semanas_Sem_Domingo': semanas_sem_domingo
             })
+        return estado_final
+    
+    def colaboradores_proximo_periodo(self, df_colaboradores: pd.DataFrame) -> pd.DataFrame:
+        """
+        Monta os dados dos colaboradores para o período seguinte.
         
-        df_escala = pd.DataFrame(dados_escala)
-        
-        # Para a escala completa, retornar apenas as colunas básicas
-        # As colunas de controle 6x1 serão usadas apenas nos relatórios específicos
-        colunas_escala_completa = ['Nome', 'Cargo', 'Tipo_Escala', 'Turno', 'Data', 'Status', 'Status_Colorido']
+        Os campos de CAMPOS_ESTADO (tipo de plantão vigente, último plantão,
+        último domingo de folga e contadores 6x1) são atualizados com o estado
+        de cada colaborador no último dia do período; os demais campos são
+        mantidos. Datas são gravadas no formato dd/mm/aaaa, como na planilha.
         
-        # Retornar dados completos para uso interno
-        return df_escala
+        Args:
+            df_colaboradores: DataFrame usado na última geração deste gerador
+            
+        Returns:
+            Novo DataFrame de colaboradores, na mesma ordem
+        """
+        if len(df_colaboradores) != len(self._estados_finais):
+            raise ValueError("Os colaboradores informados não correspondem à última geração da escala")
+        
+        proximo = df_colaboradores.copy()
+        for campo in self.CAMPOS_ESTADO:
+            valores = proximo[campo].astype(object).tolist() if campo in proximo else [None] * len(proximo)
+            for posicao, estado_final in enumerate(self._estados_finais):
+                if estado_final and campo in estado_final:
+                    valor = estado_final[campo]
+                    valores[posicao] = valor.strftime('%d/%m/%Y') if isinstance(valor, date) else valor
+            proximo[campo] = pd.Series(valores, index=proximo.index, dtype=object)
+        return proximo
     
     def validar_escalas(self, df_colaboradores: pd.DataFrame) -> Dict[str, Any]:
         """
@@ -332,16 +1057,25 @@ class GeradorEscala:
         Gera resumo estatístico da escala completa.
         
         Args:
-            escala_completa: DataFrame com a escala completa
+            escala_completa: DataFrame com a escala completa, MatrizEscala ou tabela de fatos
             
         Returns:
             DataFrame com estatísticas por colaborador
         """
-        if escala_completa.empty:
-            return pd.DataFrame()
-        
-        # Agrupar por colaborador e status
-        estatisticas = escala_completa.groupby(['Nome', 'Status']).size().unstack(fill_value=0)
+        if self._contagens_disponiveis(escala_completa):
+            contagens, colaboradores = self._contagens_colaboradores(escala_completa)
+            if not contagens.size:
+                return pd.DataFrame()
+            # Contagens por colaborador, somadas por nome (sem agrupar o formato longo)
+            contagens = self._contagens_status(contagens, colaboradores, ['Nome'])
+            estatisticas = contagens.loc[:, contagens.sum() > 0]
+            estatisticas.columns.name = 'Status'
+        else:
+            if escala_completa.empty:
+                return pd.DataFrame()
+            
+            # Agrupar por colaborador e status
+            estatisticas = escala_completa.groupby(['Nome', 'Status'], observed=True).size().unstack(fill_value=0)
         
         # Adicionar totais
         estatisticas['Total_Dias'] = estatisticas.sum(axis=1)
@@ -399,21 +1133,114 @@ class GeradorEscala:
         """
         Formata a escala para exportação, organizando por colaborador e data.
         
+        A grade larga é montada remodelando os status (colaboradores × dias) sem
+        agrupamentos; o resultado é o mesmo do pivot_table (linhas ordenadas pelas
+        colunas de informação, primeira ocorrência em caso de repetição e datas em
+        ordem). Dados que não formam blocos densos por colaborador usam o pivot_table.
+        
         Args:
-            escala_completa: DataFrame com a escala completa
+            escala_completa: DataFrame com a escala completa ou MatrizEscala
             
         Returns:
             DataFrame formatado para exportação
         """
-        if escala_completa.empty:
-            return pd.DataFrame()
+        colunas_info = ['Nome', 'Cargo', 'Tipo_Escala', 'Turno']
+        
+        if isinstance(escala_completa, MatrizEscala):
+            if escala_completa.vazia:
+                return pd.DataFrame()
+            largo = escala_completa.para_largo(self.rotulos_coloridos(), categoricos=True)
+        else:
+            if escala_completa.empty:
+                return pd.DataFrame()
+            largo = self._remodelar_largo(escala_completa)
+            if largo is None:
+                return self._pivotar_largo(escala_completa)
+        
+        # Mesma ordem (e primeira ocorrência) do pivot
+        largo = largo.drop_duplicates(colunas_info).sort_values(colunas_info, kind='stable')
+        return largo.reset_index(drop=True)
+    
+    def _remodelar_largo(self, escala_completa: pd.DataFrame) -> pd.DataFrame:
+        """
+        Monta a grade larga remodelando o formato longo, quando ele é denso e ordenado.
+        
+        Exige blocos consecutivos com as mesmas datas (em ordem crescente) para cada
+        colaborador, sem valores ausentes nas colunas de informação e nos status.
+        
+        Args:
+            escala_completa: DataFrame com a escala completa
+            
+        Returns:
+            DataFrame largo, na ordem das linhas de entrada, ou None se os dados não forem densos
+        """
+        colunas_info = ['Nome', 'Cargo', 'Tipo_Escala', 'Turno']
+        datas = escala_completa['Data'].to_numpy(dtype=object)
+        
+        # Quantidade de dias = tamanho do primeiro bloco de datas crescentes
+        try:
+            quebras = np.flatnonzero(datas[1:] <= datas[:-1])
+        except TypeError:
+            return None
+        dias = int(quebras[0]) + 1 if len(quebras) else len(datas)
+        if len(datas) % dias:
+            return None
+        linhas = len(datas) // dias
+        
+        try:
+            if not (datas.reshape(linhas, dias) == datas[:dias]).all():
+                return None
+        except TypeError:
+            return None
+        
+        # Informações constantes em cada bloco
+        informacoes = {}
+        for coluna in colunas_info:
+            valores = escala_completa[coluna]
+            if valores.isna().any():
+                return None
+            codigos = pd.factorize(valores)[0].reshape(linhas, dias)
+            if not (codigos == codigos[:, :1]).all():
+                return None
+            # Mesmos tipos do índice do pivot: categóricos preservados, demais inferidos
+            primeiros = valores.iloc[::dias]
+            informacoes[coluna] = primeiros.array if isinstance(primeiros.dtype, pd.CategoricalDtype) \
+                else pd.Index(primeiros.tolist())
+        
+        status = escala_completa['Status_Colorido']
+        if status.isna().any():
+            return None
+        colunas_datas = pd.Index(datas[:dias], dtype=object)
+        if isinstance(status.dtype, pd.CategoricalDtype):
+            codigos = status.cat.codes.to_numpy().reshape(linhas, dias)
+            celulas = pd.DataFrame({
+                data: pd.Categorical.from_codes(codigos[:, dia], dtype=status.dtype)
+                for dia, data in enumerate(colunas_datas)
+            }, columns=colunas_datas)
+        else:
+            celulas = pd.DataFrame(status.to_numpy().reshape(linhas, dias), columns=colunas_datas).astype(status.dtype)
+        
+        largo = pd.concat([pd.DataFrame(informacoes), celulas], axis=1)
+        largo.columns.name = 'Data'
+        return largo
+    
+    def _pivotar_largo(self, escala_completa: pd.DataFrame) -> pd.DataFrame:
+        """
+        Monta a grade larga com pivot_table (dados que não são densos ou ordenados).
         
+        Args:
+            escala_completa: DataFrame com a escala completa
+            
+        Returns:
+            DataFrame formatado para exportação
+        """
         # Pivotar a tabela para ter colaboradores como linhas e datas como colunas
         escala_pivot = escala_completa.pivot_table(
             index=['Nome', 'Cargo', 'Tipo_Escala', 'Turno'],
             columns='Data',
             values='Status_Colorido',
-            aggfunc='first'
+            aggfunc='first',
+            observed=True
         ).reset_index()
         
         # Reorganizar colunas
@@ -435,11 +1262,12 @@ class GeradorEscala:
         Returns:
             DataFrame com informações de controle 6x1
         """
-        if not hasattr(self, '_dados_completos') or self._dados_completos.empty:
+        controle = getattr(self, 'controle_6x1', None)
+        if controle is None or controle.empty:
             return pd.DataFrame()
         
-        # Usar dados completos que contêm as colunas de controle 6x1
-        escala_6x1 = self._dados_completos[self._dados_completos['Tipo_Escala'].str.contains('6X1')]
+        # Usar a tabela de controle 6x1 (uma linha por colaborador)
+        escala_6x1 = controle[controle['Tipo_Escala'].str.contains('6X1')]
         
         if escala_6x1.empty:
             return pd.DataFrame()
@@ -488,21 +1316,10 @@ class GeradorEscala:
         if not data:
             return 'Não informado'
         
-        try:
-            if isinstance(data, str):
-                # Tentar diferentes formatos
-                for formato in ['%Y-%m-%d', '%d/%m/%Y', '%d-%m-%Y']:
-                    try:
-                        data_obj = datetime.strptime(data, formato).date()
-                        return data_obj.strftime('%d/%m/%Y')
-                    except ValueError:
-                        continue
-            elif hasattr(data, 'strftime'):
-                return data.strftime('%d/%m/%Y')
-            else:
-                return str(data)
-        except:
-            return str(data) if data else 'Não informado'
+        data_obj = converter_data(data)
+        if data_obj is None:
+            return str(data)
+        return data_obj.strftime('%d/%m/%Y')
     
     def _calcular_proximo_domingo_folga(self, ultimo_domingo: str) -> str:
         """
@@ -514,36 +1331,27 @@ class GeradorEscala:
         Returns:
             String com a data do próximo domingo de folga
         """
-        if not ultimo_domingo:
+        data = converter_data(ultimo_domingo)
+        if data is None:
             return ''
         
-        try:
-            if isinstance(ultimo_domingo, str):
-                for formato in ['%d/%m/%Y', '%d-%m-%Y', '%Y-%m-%d']:
-                    try:
-                        data = datetime.strptime(ultimo_domingo, formato).date()
-                        break
-                    except ValueError:
-                        continue
-            else:
-                data = ultimo_domingo
-            
-            # Próximo domingo de folga (7 semanas depois)
-            proximo_domingo = data + timedelta(weeks=7)
-            return proximo_domingo.strftime('%d/%m/%Y')
-        except:
-            return ''
+        # Próximo domingo de folga (7 semanas depois)
+        proximo_domingo = data + timedelta(weeks=7)
+        return proximo_domingo.strftime('%d/%m/%Y')
     
     def gerar_relatorio_plantoes(self, escala_completa: pd.DataFrame) -> pd.DataFrame:
         """
         Gera relatório específico para plantonistas.
         
         Args:
-            escala_completa: DataFrame com a escala completa
+            escala_completa: DataFrame com a escala completa, MatrizEscala ou tabela de fatos
             
         Returns:
             DataFrame com informações de controle dos plantões
         """
+        if self._contagens_disponiveis(escala_completa):
+            return self._relatorio_plantoes_contagens(*self._contagens_colaboradores(escala_completa))
+        
         if escala_completa.empty:
             return pd.DataFrame()
         
@@ -556,7 +1364,7 @@ class GeradorEscala:
         # Calcular dias de trabalho e folga por colaborador
         relatorio_dados = []
         
-        for (nome, cargo, tipo_escala, turno), grupo in plantoes.groupby(['Nome', 'Cargo', 'Tipo_Escala', 'Turno']):
+        for (nome, cargo, tipo_escala, turno), grupo in plantoes.groupby(['Nome', 'Cargo', 'Tipo_Escala', 'Turno'], observed=True):
             # Contar dias de trabalho (TRABALHO_DIA ou TRABALHO_NOITE)
             dias_trabalho = len(grupo[grupo['Status'].isin(['TRABALHO_DIA', 'TRABALHO_NOITE'])])
             
@@ -564,7 +1372,7 @@ class GeradorEscala:
             dias_folga = len(grupo[grupo['Status'] == 'FOLGA'])
             
             # Calcular total de dias no período
-            total_dias = (self.data_fim - self.data_inicio).days + 1
+            total_dias = len(self.calendario)
             
             # Calcular último plantão do mês
             ultimo_plantao_mes = self._calcular_ultimo_plantao_mes(tipo_escala, self.data_fim)
@@ -582,6 +1390,73 @@ class GeradorEscala:
         
         return pd.DataFrame(relatorio_dados)
     
+    def _relatorio_plantoes_contagens(self, contagens: np.ndarray, colaboradores: pd.DataFrame) -> pd.DataFrame:
+        """
+        Gera o relatório de plantonistas a partir das contagens de status por colaborador.
+        
+        Args:
+            contagens: Matriz (colaboradores × status) de contagens, na ordem dos Id_Colaborador
+            colaboradores: Dimensão de colaboradores
+            
+        Returns:
+            DataFrame com informações de controle dos plantões (mesmo formato de gerar_relatorio_plantoes)
+        """
+        colunas_info = ['Nome', 'Cargo', 'Tipo_Escala', 'Turno']
+        if not contagens.size:
+            return pd.DataFrame()
+        
+        plantoes = colaboradores[colaboradores['Tipo_Escala'].str.contains('P_|I_')]
+        if plantoes.empty:
+            return pd.DataFrame()
+        
+        contagens = self._contagens_status(contagens, plantoes, colunas_info)
+        relatorio = contagens.index.to_frame(index=False)
+        relatorio['Dias_Trabalho'] = (contagens['TRABALHO_DIA'] + contagens['TRABALHO_NOITE']).to_numpy()
+        relatorio['Dias_Folga'] = contagens['FOLGA'].to_numpy()
+        relatorio['Total_Dias'] = len(self.calendario)
+        relatorio['Ultimo_Plantao_Mes'] = [
+            self._calcular_ultimo_plantao_mes(tipo_escala, self.data_fim) for tipo_escala in relatorio['Tipo_Escala']
+        ]
+        return relatorio
+    
+    def _contagens_disponiveis(self, escala: Any) -> bool:
+        """Indica se o relatório pode partir de contagens (MatrizEscala ou tabela de fatos)."""
+        return isinstance(escala, MatrizEscala) or (isinstance(escala, pd.DataFrame) and COLUNA_ID in escala.columns)
+    
+    def _contagens_colaboradores(self, escala: Any) -> Tuple[np.ndarray, pd.DataFrame]:
+        """
+        Conta os dias de cada status por colaborador.
+        
+        Args:
+            escala: MatrizEscala ou tabela de fatos (ligada à dimensão da última geração)
+            
+        Returns:
+            Tupla (contagens colaboradores × status, dimensão de colaboradores)
+        """
+        if isinstance(escala, MatrizEscala):
+            return escala.contagens(), escala.dimensao_colaboradores()
+        if self.matriz_escala is None:
+            raise ValueError("Tabela de fatos sem dimensão de colaboradores: gere a escala antes dos relatórios")
+        colaboradores = self.matriz_escala.dimensao_colaboradores()
+        return contagens_fatos(escala, len(colaboradores)), colaboradores
+    
+    def _contagens_status(self, contagens: np.ndarray, colaboradores: pd.DataFrame, chaves: List[str]) -> pd.DataFrame:
+        """
+        Soma as contagens de status por colunas da dimensão de colaboradores.
+        
+        Args:
+            contagens: Matriz (colaboradores × status) de contagens, na ordem dos Id_Colaborador
+            colaboradores: Dimensão de colaboradores (apenas as linhas a considerar)
+            chaves: Colunas da dimensão usadas no agrupamento
+            
+        Returns:
+            DataFrame (uma linha por chave, em ordem) com uma coluna por rótulo de status
+        """
+        por_id = pd.DataFrame(contagens, columns=list(ROTULOS_STATUS),
+                              index=pd.RangeIndex(len(contagens), name=COLUNA_ID))
+        tabela = colaboradores[[COLUNA_ID] + chaves].join(por_id, on=COLUNA_ID)
+        return tabela.groupby(chaves, sort=True)[list(ROTULOS_STATUS)].sum()
+    
     def _calcular_ultimo_plantao_mes(self, tipo_escala: str, data_fim: date) -> str:
         """
         Calcula o último plantão do mês baseado no tipo de escala.
@@ -595,8 +1470,11 @@ class GeradorEscala:
         """
         try:
             # Encontrar o último dia do mês que corresponde ao tipo de plantão
-            ultimo_dia = data_fim.replace(day=1) + timedelta(days=32)
-            ultimo_dia = ultimo_dia.replace(day=1) - timedelta(days=1)
+            if data_fim == self.calendario.data_fim and len(self.calendario):
+                ultimo_dia = data_fim.replace(day=int(self.calendario.dias_no_mes[-1]))
+            else:
+                ultimo_dia = data_fim.replace(day=1) + timedelta(days=32)
+                ultimo_dia = ultimo_dia.replace(day=1) - timedelta(days=1)
             
             if tipo_escala.startswith('P_'):  # Plantão par
                 # Encontrar o último dia par do mês
@@ -621,6 +1499,9 @@ class GeradorEscala:
         Returns:
             True se o mês anterior tem 31 dias, False caso contrário
         """
+        if data_inicio == self.calendario.data_inicio:
+            return self.calendario.dias_mes_anterior == 31
+        
         # Calcular o último dia do mês anterior
         primeiro_dia_mes_atual = data_inicio.replace(day=1)
         ultimo_dia_mes_anterior = primeiro_dia_mes_atual - timedelta(days=1)
@@ -0,0 +1,387 @@
+"""
+Exceções da Escala
+==================
+
+Atestados, férias e escalas manuais representados como intervalos tipados de
+datas (início e fim inclusivos), aplicados sobre os códigos de status por
+atribuição de fatias dos índices do calendário: o custo é proporcional à
+quantidade de intervalos, e não aos dias que eles cobrem.
+
+A precedência é explícita na ordem de TipoExcecao: atestado < férias < escala
+manual (em um mesmo dia, vale a exceção de maior precedência).
+
+A forma em lote recebe uma tabela de intervalos (COLUNAS_INTERVALOS), com a
+linha da matriz de cada colaborador, e aplica as exceções de todos os
+colaboradores de uma só vez.
+
+Cada campo de exceção aceita vários itens separados por vírgula ou ponto e
+vírgula; cada item é uma data ou um período 'início-fim' (ou 'início a fim'),
+em qualquer formato de FORMATOS_EXCECAO. Exemplo:
+'10/06/2025-20/06/2025; 2025-07-01 a 2025-07-05, 15-08-2025'.
+
+As exceções também podem vir em uma tabela longa, uma linha por exceção
+(Id e/ou Nome, e COLUNAS_TABELA_EXCECOES: Tipo, Inicio, Fim), ligada aos
+colaboradores por junção (juntar_excecoes) e aplicada na mesma forma em lote.
+"""
+
+import re
+from datetime import date, timedelta
+from enum import IntEnum
+from functools import lru_cache
+from typing import Iterable, List, NamedTuple, Sequence, Tuple
+
+import numpy as np
+import pandas as pd
+
+from calendario import Calendario
+from conversao_datas import (FORMATOS_DATA, FORMATOS_EXCECAO, TAMANHO_CACHE, converter_data, converter_datas,
+                             padrao_formato, textos_data)
+from diagnosticos import ColetorDiagnosticos
+from status_escala import StatusEscala
+
+class TipoExcecao(IntEnum):
+    """Tipo de exceção; o valor é a precedência (maior prevalece)."""
+
+    ATESTADO = 0
+    FERIAS = 1
+    ESCALA_MANUAL = 2
+
+    @property
+    def status(self) -> StatusEscala:
+        """Status aplicado nos dias da exceção."""
+        return STATUS_EXCECAO[self]
+
+STATUS_EXCECAO = {
+    TipoExcecao.ATESTADO: StatusEscala.ATESTADO,
+    TipoExcecao.FERIAS: StatusEscala.FERIAS,
+    TipoExcecao.ESCALA_MANUAL: StatusEscala.ESCALA_MANUAL
+}
+
+# Campo do colaborador (normalizado) de cada tipo de exceção
+CAMPOS_EXCECAO = {
+    'Atestados': TipoExcecao.ATESTADO,
+    'Ferias': TipoExcecao.FERIAS,
+    'Escalas_Manuais': TipoExcecao.ESCALA_MANUAL
+}
+
+# Tabela de intervalos da forma em lote: linha da matriz, tipo e datas (inclusivas)
+COLUNAS_INTERVALOS = ['Linha', 'Tipo', 'Inicio', 'Fim']
+
+# Tabela longa de exceções: chaves do colaborador (as colunas de COLUNAS_CHAVE presentes,
+# em ordem de preferência na junção), tipo e datas (Fim vazio = um único dia)
+COLUNAS_CHAVE = ['Id', 'Nome']
+COLUNAS_TABELA_EXCECOES = ['Tipo', 'Inicio', 'Fim']
+
+# Grafias aceitas na coluna Tipo (minúsculas, '_' como espaço)
+TIPOS_POR_NOME = {
+    'atestado': TipoExcecao.ATESTADO, 'atestados': TipoExcecao.ATESTADO,
+    'ferias': TipoExcecao.FERIAS, 'férias': TipoExcecao.FERIAS,
+    'escala manual': TipoExcecao.ESCALA_MANUAL, 'escalas manuais': TipoExcecao.ESCALA_MANUAL,
+    'manual': TipoExcecao.ESCALA_MANUAL
+}
+
+# Sintaxe dos campos de exceção: itens separados por ',' ou ';', cada um data ou período
+SEPARADOR_ITENS = r'[,;]'
+_DATA = '(?:' + '|'.join(padrao_formato(formato) for formato in FORMATOS_EXCECAO) + ')'
+PADRAO_ITEM = rf'^(?P<inicio>{_DATA})(?:(?:\s*-\s*|\s+(?:a|até)\s+)(?P<fim>{_DATA}))?$'
+_REGEX_ITEM = re.compile(PADRAO_ITEM)
+
+class IntervaloExcecao(NamedTuple):
+    """Exceção de um colaborador entre duas datas (inclusivas)."""
+
+    tipo: TipoExcecao
+    inicio: date
+    fim: date
+
+@lru_cache(maxsize=TAMANHO_CACHE)
+def converter_campo_excecao(texto: str) -> Tuple[Tuple[Tuple[date, date], ...], Tuple[str, ...]]:
+    """
+    Converte um campo de exceção em períodos.
+
+    Args:
+        texto: Campo com datas e períodos separados por vírgula ou ponto e vírgula
+
+    Returns:
+        Tupla (períodos (início, fim), itens não reconhecidos); datas isoladas
+        viram períodos de um dia
+    """
+    periodos, rejeitados = [], []
+    for item in re.split(SEPARADOR_ITENS, texto):
+        item = item.strip()
+        if not item:
+            continue
+        partes = _REGEX_ITEM.match(item)
+        inicio = converter_data(partes['inicio'], FORMATOS_EXCECAO) if partes else None
+        fim = converter_data(partes['fim'] or partes['inicio'], FORMATOS_EXCECAO) if inicio else None
+        if fim is None:
+            rejeitados.append(item)
+        else:
+            periodos.append((inicio, fim))
+    return tuple(periodos), tuple(rejeitados)
+
+def converter_coluna_excecoes(textos: pd.Series, diagnosticos: ColetorDiagnosticos = None,
+                              campo: str = None) -> Tuple[pd.DataFrame, pd.Series]:
+    """
+    Converte uma coluna inteira de campos de exceção em uma tabela de períodos.
+
+    Os campos são quebrados em itens, e os itens reconhecidos e convertidos
+    com operações sobre a coluna inteira: as datas de início e de fim de todos
+    os itens seguem um único formato, o da coluna (ver converter_datas).
+
+    Args:
+        textos: Série com os campos em texto (sem espaços nas pontas, '' para vazios)
+        diagnosticos: Coletor onde as datas fora do formato da coluna são registradas (opcional)
+        campo: Nome da coluna, usado no aviso (opcional)
+
+    Returns:
+        Tupla (DataFrame com as colunas 'Linha' (posição na série), 'Inicio' e 'Fim'
+        (datetime64), na ordem das linhas; Série com os itens não reconhecidos,
+        indexada pela posição na série)
+    """
+    textos = textos.reset_index(drop=True)
+    itens = textos[textos.ne('')].str.split(SEPARADOR_ITENS, regex=True).explode().str.strip()
+    itens = itens[itens.ne('')]
+    linhas = itens.index.to_numpy(dtype=np.int64)
+    itens = itens.reset_index(drop=True)
+
+    partes = itens.str.extract(PADRAO_ITEM)
+    datas = converter_datas(pd.concat([partes['inicio'], partes['fim'].fillna(partes['inicio'])],
+                                      ignore_index=True).fillna(''),
+                            FORMATOS_EXCECAO, diagnosticos, campo).to_numpy(dtype='datetime64[D]')
+    inicios, fins = datas[:len(itens)], datas[len(itens):]
+    validos = ~np.isnat(inicios) & ~np.isnat(fins)
+
+    periodos = pd.DataFrame({'Linha': linhas[validos], 'Inicio': inicios[validos], 'Fim': fins[validos]})
+    rejeitados = pd.Series(itens[~validos].to_numpy(dtype=object), index=linhas[~validos])
+    return periodos, rejeitados
+
+def dias_periodos(periodos: Iterable[Tuple[date, date]]) -> List[date]:
+    """Lista os dias cobertos pelos períodos (início e fim inclusivos), na ordem dos períodos."""
+    return [inicio + timedelta(days=dia) for inicio, fim in periodos for dia in range((fim - inicio).days + 1)]
+
+def intervalos_excecoes(atestados: Iterable[Tuple[date, date]] = (), ferias: Iterable[Tuple[date, date]] = (),
+                        escalas_manuais: Iterable[Tuple[date, date]] = ()) -> List[IntervaloExcecao]:
+    """
+    Monta os intervalos de exceção de um colaborador, em ordem de precedência.
+
+    Args:
+        atestados: Períodos (início, fim) de atestado
+        ferias: Períodos (início, fim) de férias
+        escalas_manuais: Períodos (início, fim) de escala manual
+
+    Returns:
+        Lista de intervalos
+    """
+    return [
+        IntervaloExcecao(tipo, inicio, fim)
+        for tipo, periodos in zip(TipoExcecao, (atestados, ferias, escalas_manuais))
+        for inicio, fim in periodos
+    ]
+
+def aplicar_intervalos(status: np.ndarray, calendario: Calendario, intervalos: Sequence[IntervaloExcecao],
+                       destino: np.ndarray = None) -> np.ndarray:
+    """
+    Aplica intervalos de exceção sobre os códigos de status de um colaborador.
+
+    Args:
+        status: Array uint8 de códigos de status, alinhado ao calendário
+        calendario: Calendário do período
+        intervalos: Intervalos de exceção (em qualquer ordem)
+        destino: Array onde a escala final é escrita (opcional; ex.: linha de uma matriz pré-alocada)
+
+    Returns:
+        Array de códigos de status após aplicação das exceções (destino, se informado)
+    """
+    if destino is None:
+        status_final = status.copy()
+    else:
+        status_final = destino
+        status_final[:] = status
+
+    for tipo, inicio, fim in sorted(intervalos, key=lambda intervalo: intervalo.tipo):
+        status_final[calendario.intervalo(inicio, fim)] = tipo.status
+    return status_final
+
+def tabela_intervalos(colaboradores: pd.DataFrame, linhas: np.ndarray = None) -> pd.DataFrame:
+    """
+    Monta a tabela de intervalos de exceção de colaboradores normalizados.
+
+    Args:
+        colaboradores: DataFrame normalizado (ver normalizar_colaboradores)
+        linhas: Linha da matriz de cada colaborador, na ordem do DataFrame
+            (opcional; padrão: a posição no DataFrame). Colaboradores com linha
+            negativa (fora da matriz) são descartados.
+
+    Returns:
+        DataFrame com as colunas COLUNAS_INTERVALOS (datas em datetime64)
+    """
+    linhas = np.arange(len(colaboradores)) if linhas is None else np.asarray(linhas, dtype=np.int64)
+    partes = []
+    for campo, tipo in CAMPOS_EXCECAO.items():
+        periodos = colaboradores[campo].reset_index(drop=True).explode().dropna()
+        partes.append(pd.DataFrame({
+            'Linha': linhas[periodos.index.to_numpy(dtype=np.int64)],
+            'Tipo': np.full(len(periodos), tipo, dtype=np.uint8),
+            'Inicio': np.array([inicio for inicio, _ in periodos], dtype='datetime64[D]'),
+            'Fim': np.array([fim for _, fim in periodos], dtype='datetime64[D]')
+        }))
+    tabela = pd.concat(partes, ignore_index=True)
+    return tabela[tabela['Linha'] >= 0].reset_index(drop=True)
+
+def aplicar_intervalos_lote(status: np.ndarray, calendario: Calendario, intervalos: pd.DataFrame) -> np.ndarray:
+    """
+    Aplica, no lugar, as exceções de todos os colaboradores sobre a matriz de status.
+
+    Os intervalos são recortados ao período e expandidos em coordenadas
+    (linha, dia) com operações vetorizadas; cada tipo é aplicado de uma vez,
+    em ordem de precedência.
+
+    Args:
+        status: Matriz uint8 colaboradores × dias
+        calendario: Calendário do período (colunas da matriz)
+        intervalos: Tabela com as colunas COLUNAS_INTERVALOS
+
+    Returns:
+        A própria matriz de status
+    """
+    if not len(intervalos) or not len(calendario):
+        return status
+
+    dias = len(calendario)
+    linhas = intervalos['Linha'].to_numpy(dtype=np.int64)
+    tipos = intervalos['Tipo'].to_numpy(dtype=np.int64)
+    inicios = np.clip((intervalos['Inicio'].to_numpy(dtype='datetime64[D]') - calendario.datas[0]).astype(np.int64),
+                      0, dias)
+    fins = np.clip((intervalos['Fim'].to_numpy(dtype='datetime64[D]') - calendario.datas[0]).astype(np.int64) + 1,
+                   0, dias)
+    tamanhos = np.maximum(fins - inicios, 0)
+
+    for tipo in TipoExcecao:
+        selecionados = (tipos == tipo) & (tamanhos > 0)
+        if not selecionados.any():
+            continue
+        quantidades = tamanhos[selecionados]
+        # Deslocamento de cada dia dentro do seu intervalo
+        deslocamentos = np.arange(quantidades.sum()) - np.repeat(np.cumsum(quantidades) - quantidades, quantidades)
+        status[np.repeat(linhas[selecionados], quantidades),
+               np.repeat(inicios[selecionados], quantidades) + deslocamentos] = tipo.status
+    return status
+
+def textos_chave(valores: pd.Series) -> pd.Series:
+    """
+    Converte a chave dos colaboradores (Nome ou Id) em texto comparável.
+
+    Ids numéricos lidos como float (coluna com células vazias) viram o texto do
+    inteiro: 1.0 e 1 resultam ambos em '1'.
+    """
+    return textos_data(valores).str.replace(r'^(-?\d+)\.0+$', r'\1', regex=True)
+
+def _datas_coluna(valores: pd.Series, diagnosticos: ColetorDiagnosticos = None) -> Tuple[pd.Series, pd.Series]:
+    """Converte uma coluna de datas (texto ou datas do Excel); retorna (datas, máscara das preenchidas)."""
+    if pd.api.types.is_datetime64_any_dtype(valores):
+        return valores.astype('datetime64[s]').dt.normalize(), valores.notna()
+    textos = textos_data(valores)
+    return converter_datas(textos, FORMATOS_DATA, diagnosticos, valores.name), textos.ne('')
+
+def normalizar_tabela_excecoes(excecoes: pd.DataFrame,
+                               diagnosticos: ColetorDiagnosticos = None) -> Tuple[pd.DataFrame, np.ndarray]:
+    """
+    Converte a tabela longa de exceções (uma linha por exceção) em colunas tipadas.
+
+    Args:
+        excecoes: DataFrame com uma ou mais colunas de COLUNAS_CHAVE e as colunas Tipo,
+            Inicio e Fim (opcional); datas em texto, em um formato aceito por coluna, ou datas do Excel
+        diagnosticos: Coletor onde as datas fora do formato da coluna são registradas (opcional)
+
+    Returns:
+        Tupla (DataFrame com as chaves presentes (texto, ver textos_chave; '' se vazia),
+        'Tipo' (código de TipoExcecao, uint8) e 'Inicio' e 'Fim' (datetime64), apenas com
+        as linhas válidas (ao menos uma chave preenchida); máscara das linhas inválidas
+        da tabela recebida)
+
+    Raises:
+        ValueError: Se faltar a chave do colaborador ou a coluna Tipo ou Inicio
+    """
+    chaves = [coluna for coluna in COLUNAS_CHAVE if coluna in excecoes.columns]
+    faltantes = [coluna for coluna in ('Tipo', 'Inicio') if coluna not in excecoes.columns]
+    if not chaves or faltantes:
+        raise ValueError(f"Colunas obrigatórias não encontradas na tabela de exceções: "
+                         f"{faltantes + ([] if chaves else [' ou '.join(COLUNAS_CHAVE)])}")
+
+    tipos = textos_data(excecoes['Tipo']).str.lower().str.replace('_', ' ').map(TIPOS_POR_NOME)
+    inicios, _ = _datas_coluna(excecoes['Inicio'], diagnosticos)
+    if 'Fim' in excecoes.columns:
+        fins, fim_preenchido = _datas_coluna(excecoes['Fim'], diagnosticos)
+        fins = fins.where(fim_preenchido, inicios)
+    else:
+        fins = inicios
+    colaboradores = {chave: textos_chave(excecoes[chave]).to_numpy() for chave in chaves}
+
+    identificadas = np.logical_or.reduce([valores != '' for valores in colaboradores.values()])
+    validas = (tipos.notna() & inicios.notna() & fins.notna()).to_numpy(dtype=bool) & identificadas
+    tabela = pd.DataFrame({
+        **{chave: valores[validas] for chave, valores in colaboradores.items()},
+        'Tipo': tipos.to_numpy()[validas].astype(np.uint8),
+        'Inicio': inicios.to_numpy()[validas],
+        'Fim': fins.to_numpy()[validas]
+    })
+    return tabela, ~validas
+
+def juntar_excecoes(colaboradores: pd.DataFrame, excecoes: pd.DataFrame, linhas: np.ndarray = None,
+                    diagnosticos: ColetorDiagnosticos = None) -> Tuple[pd.DataFrame, List[str]]:
+    """
+    Liga a tabela longa de exceções às linhas da matriz dos colaboradores.
+
+    A junção usa as colunas de COLUNAS_CHAVE presentes nas duas tabelas, em ordem
+    de preferência: cada exceção é ligada pela primeira delas que estiver preenchida.
+    Colaboradores com a mesma chave recebem as mesmas exceções.
+
+    Args:
+        colaboradores: DataFrame dos colaboradores
+        excecoes: Tabela de exceções (ver normalizar_tabela_excecoes; é normalizada
+            aqui se ainda não estiver, com 'Tipo' em código uint8)
+        linhas: Linha da matriz de cada colaborador, na ordem do DataFrame
+            (opcional; padrão: a posição no DataFrame). Colaboradores com linha
+            negativa (fora da matriz) não recebem exceções.
+        diagnosticos: Coletor onde as datas fora do formato da coluna são registradas,
+            se a tabela for normalizada aqui (opcional)
+
+    Returns:
+        Tupla (DataFrame com as colunas COLUNAS_INTERVALOS; chaves de exceções sem
+        colaborador correspondente)
+
+    Raises:
+        ValueError: Se não houver coluna de COLUNAS_CHAVE nas duas tabelas
+    """
+    if excecoes['Tipo'].dtype != np.uint8:
+        excecoes, _ = normalizar_tabela_excecoes(excecoes, diagnosticos)
+    comuns = [coluna for coluna in COLUNAS_CHAVE if coluna in excecoes.columns and coluna in colaboradores.columns]
+    if not comuns:
+        raise ValueError(f"A tabela de exceções e a de colaboradores precisam de uma coluna em comum: "
+                         f"{' ou '.join(COLUNAS_CHAVE)}")
+
+    linhas = np.arange(len(colaboradores)) if linhas is None else np.asarray(linhas, dtype=np.int64)
+    excecoes = excecoes.reset_index(drop=True)
+    pendentes = np.ones(len(excecoes), dtype=bool)
+    partes, desconhecidas = [], []
+    for chave in comuns:
+        selecionadas = pendentes & (excecoes[chave] != '').to_numpy(dtype=bool)
+        pendentes &= ~selecionadas
+        linhas_por_chave = pd.DataFrame({chave: textos_chave(colaboradores[chave]).to_numpy(), 'Linha': linhas})
+        juntas = (excecoes.loc[selecionadas, [chave] + COLUNAS_TABELA_EXCECOES].rename_axis('Ordem').reset_index()
+                  .merge(linhas_por_chave, on=chave, how='left'))
+        sem_colaborador = juntas['Linha'].isna().to_numpy()
+        desconhecidas += juntas.loc[sem_colaborador, chave].unique().tolist()
+        partes.append(juntas[~sem_colaborador & (juntas['Linha'].fillna(-1) >= 0).to_numpy()])
+
+    # Exceções identificadas apenas por chaves que os colaboradores não têm
+    for chave in COLUNAS_CHAVE:
+        if chave in excecoes.columns and chave not in comuns:
+            selecionadas = pendentes & (excecoes[chave] != '').to_numpy(dtype=bool)
+            pendentes &= ~selecionadas
+            desconhecidas += excecoes.loc[selecionadas, chave].unique().tolist()
+
+    # Ordem da tabela de exceções preservada
+    juntas = pd.concat(partes, ignore_index=True).sort_values('Ordem', kind='stable')
+    tabela = juntas[COLUNAS_INTERVALOS].astype({'Linha': np.int64}).reset_index(drop=True)
+    return tabela, desconhecidas
@@ -2,23 +2,28 @@
 Módulo para manipulação de arquivos Excel
 =========================================
 
-Funções para leitura de planilhas de colaboradores e feriados,
+Funções para leitura de planilhas de colaboradores, exceções e feriados,
 bem como exportação de escalas geradas.
 """
 
 import pandas as pd
-import streamlit as st
 from datetime import datetime
 import os
 from io import BytesIO
 from openpyxl.styles import Font, PatternFill
+from padroes_escala import PADROES_ESCALA
+from calendario import tabela_feriados
+from excecoes_escala import normalizar_tabela_excecoes
+from diagnosticos import ColetorDiagnosticos
+from exportacao_escala import escrever_escala_excel
 
-def ler_planilha_colaboradores(arquivo):
+def ler_planilha_colaboradores(arquivo, diagnosticos: ColetorDiagnosticos = None):
     """
     Lê a planilha de colaboradores e valida os dados.
     
     Args:
-        arquivo: Arquivo uploader do Streamlit
+        arquivo: Arquivo uploader do Streamlit (ou caminho do arquivo)
+        diagnosticos: Coletor onde os avisos de validação são registrados (opcional)
         
     Returns:
         pandas.DataFrame: DataFrame com os dados dos colaboradores
@@ -26,6 +31,8 @@ def ler_planilha_colaboradores(arquivo):
     Raises:
         ValueError: Se a planilha não contém as colunas obrigatórias
     """
+    if diagnosticos is None:
+        diagnosticos = ColetorDiagnosticos()
     try:
         df = pd.read_excel(arquivo)
         
@@ -50,25 +57,18 @@ def ler_planilha_colaboradores(arquivo):
                 df[coluna] = ''
         
         # Validar tipos de escala
-        tipos_escala_validos = [
-            # Escalas 44H
-            'M44', 'T44', 'N44',
-            # Escalas 40H
-            'M40', 'T40', 'N40',
-            # Escalas 6X1
-            'M6X1', 'T6X1', 'N6X1',
-            # Plantões
-            'P_D', 'P_N', 'I_D', 'I_N'
-        ]
+        tipos_escala_validos = list(PADROES_ESCALA)
         escalas_invalidas = df[~df['Tipo_Escala'].isin(tipos_escala_validos)]['Tipo_Escala'].unique()
         if len(escalas_invalidas) > 0:
-            st.warning(f"Tipos de escala inválidos encontrados: {escalas_invalidas}")
+            diagnosticos.aviso('tipo_invalido', f"Tipos de escala inválidos encontrados: {list(escalas_invalidas)}",
+                               tipos=list(escalas_invalidas))
         
         # Validar turnos
         turnos_validos = ['Manhã', 'Tarde', 'Noite', 'Dia']
         turnos_invalidos = df[~df['Turno'].isin(turnos_validos)]['Turno'].unique()
         if len(turnos_invalidos) > 0:
-            st.warning(f"Turnos inválidos encontrados: {turnos_invalidos}")
+            diagnosticos.aviso('turno_invalido', f"Turnos inválidos encontrados: {list(turnos_invalidos)}",
+                               turnos=list(turnos_invalidos))
         
         # Limpar dados - preservar formato original das datas
         df = df.fillna('')
@@ -90,15 +90,62 @@ def ler_planilha_colaboradores(arquivo):
     except Exception as e:
         raise ValueError(f"Erro ao ler planilha de colaboradores: {str(e)}")
 
-def ler_planilha_feriados(arquivo):
+def ler_planilha_excecoes(arquivo, diagnosticos: ColetorDiagnosticos = None, planilha='Excecoes'):
+    """
+    Lê a tabela longa de exceções (uma linha por atestado, férias ou escala manual).
+    
+    Colunas: Nome e/ou Id, Tipo (Atestado, Férias ou Escala Manual), Inicio e Fim
+    (opcional; vazio = um único dia). A tabela pode ser uma aba da própria planilha
+    de colaboradores (padrão: aba 'Excecoes') ou um arquivo separado (planilha=0).
+    
+    Args:
+        arquivo: Arquivo uploader do Streamlit (ou caminho do arquivo)
+        diagnosticos: Coletor onde os avisos de validação são registrados (opcional)
+        planilha: Nome (ou posição) da aba com as exceções
+        
+    Returns:
+        pandas.DataFrame: Exceções com colunas tipadas (ver normalizar_tabela_excecoes),
+        ou None se a planilha não tiver a aba de exceções
+        
+    Raises:
+        ValueError: Se a aba não contém as colunas obrigatórias
+    """
+    if diagnosticos is None:
+        diagnosticos = ColetorDiagnosticos()
+    try:
+        if hasattr(arquivo, 'seek'):
+            arquivo.seek(0)
+        with pd.ExcelFile(arquivo) as planilhas:
+            if isinstance(planilha, str) and planilha not in planilhas.sheet_names:
+                return None
+            df = planilhas.parse(planilha)
+        
+        excecoes, invalidas = normalizar_tabela_excecoes(df, diagnosticos)
+        if invalidas.any():
+            # Linhas numeradas como no Excel (a linha 1 é o cabeçalho)
+            linhas = (df.index[invalidas] + 2).tolist()
+            diagnosticos.aviso('excecao_invalida',
+                               f"Linhas da tabela de exceções ignoradas (tipo, data ou colaborador inválido): {linhas}",
+                               linhas=linhas)
+        return excecoes
+        
+    except Exception as e:
+        raise ValueError(f"Erro ao ler planilha de exceções: {str(e)}")
+
+def ler_planilha_feriados(arquivo, diagnosticos: ColetorDiagnosticos = None):
     """
     Lê a planilha de feriados e valida os dados.
     
+    As datas são convertidas uma única vez, em um único formato para a coluna;
+    o DataFrame retornado já está normalizado (ver calendario.tabela_feriados)
+    e é aceito pelo GeradorEscala sem nova conversão.
+    
     Args:
         arquivo: Arquivo uploader do Streamlit
+        diagnosticos: Coletor onde as datas fora do formato da coluna são registradas (opcional)
         
     Returns:
-        pandas.DataFrame: DataFrame com os dados dos feriados
+        pandas.DataFrame: Feriados sem repetições, com colunas Data, Descricao, Camada e Unidade
         
     Raises:
         ValueError: Se a planilha não contém as colunas obrigatórias
@@ -106,24 +153,12 @@ def ler_planilha_feriados(arquivo):
     try:
         df = pd.read_excel(arquivo)
         
-        # Verificar colunas obrigatórias
-        if 'Data' not in df.columns:
-            raise ValueError("Coluna 'Data' não encontrada na planilha de feriados")
-        
-        # Adicionar coluna de descrição se não existir
-        if 'Descricao' not in df.columns:
-            df['Descricao'] = 'Feriado'
-        
-        # Converter coluna de data
-        try:
-            df['Data'] = pd.to_datetime(df['Data']).dt.date
-        except:
+        # Converter coluna de data (DD/MM/AAAA, DD-MM-AAAA ou AAAA-MM-DD, um por coluna, ou data do Excel)
+        feriados, invalidas = tabela_feriados(df, diagnosticos)
+        if invalidas.any():
             raise ValueError("Erro ao converter coluna 'Data' para formato de data")
         
-        # Limpar dados
-        df = df.fillna('')
-        
-        return df
+        return feriados
         
     except Exception as e:
         raise ValueError(f"Erro ao ler planilha de feriados: {str(e)}")
@@ -133,7 +168,8 @@ def exportar_escala_excel(escala_completa, data_inicio, data_fim, nome_arquivo=N
     Exporta a escala completa para arquivo Excel.
     
     Args:
-        escala_completa (pandas.DataFrame): DataFrame com a escala completa
+        escala_completa (pandas.DataFrame): DataFrame com a escala completa, ou iterador de
+            lotes (ver GeradorEscala.iter_escala), gravados à medida que são gerados
         data_inicio (date): Data de início do período
         data_fim (date): Data de fim do período
         nome_arquivo (str, optional): Nome do arquivo de saída
@@ -146,6 +182,14 @@ def exportar_escala_excel(escala_completa, data_inicio, data_fim, nome_arquivo=N
         if nome_arquivo is None:
             nome_arquivo = f"escala_{data_inicio.strftime('%Y%m')}_{datetime.now().strftime('%Y%m%d_%H%M%S')}.xlsx"
         
+        if not isinstance(escala_completa, pd.DataFrame):
+            # Lotes da escala: cada lote é gravado assim que chega
+            escrever_escala_excel(escala_completa, nome_arquivo)
+            with open(nome_arquivo, 'rb') as f:
+                conteudo = f.read()
+            os.remove(nome_arquivo)
+            return conteudo
+        
         # Criar writer do Excel
         with pd.ExcelWriter(nome_arquivo, engine='openpyxl') as writer:
             # Escrever escala completa
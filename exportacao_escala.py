@@ -0,0 +1,108 @@
+"""
+Exportação da Escala em Lotes
+=============================
+
+Gravação da escala em Excel, CSV e Parquet a partir de lotes (ver
+GeradorEscala.iter_escala). Cada lote é gravado assim que chega, de modo que
+a memória usada não depende da quantidade de colaboradores e as primeiras
+linhas já estão no arquivo enquanto os lotes seguintes são gerados.
+
+Os lotes podem ser DataFrames ou pyarrow.RecordBatch; a gravação em Parquet
+requer pyarrow.
+"""
+
+from typing import Any, Iterable
+
+import pandas as pd
+from openpyxl import Workbook
+try:
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+except ImportError:
+    pa = None
+    pq = None
+
+from matriz_escala import ESQUEMA_ARROW
+
+def _para_dataframe(lote: Any) -> pd.DataFrame:
+    """Converte um lote (DataFrame ou RecordBatch) em DataFrame."""
+    if isinstance(lote, pd.DataFrame):
+        return lote
+    return lote.to_pandas()
+
+def escrever_escala_excel(lotes: Iterable[Any], destino, nome_aba: str = 'Escala_Completa') -> int:
+    """
+    Grava os lotes da escala em uma planilha Excel (modo somente escrita do openpyxl).
+
+    Args:
+        lotes: Lotes da escala (DataFrames ou RecordBatches)
+        destino: Caminho do arquivo ou objeto de arquivo (ex.: BytesIO)
+        nome_aba: Nome da aba da escala
+
+    Returns:
+        Quantidade de linhas gravadas (sem o cabeçalho)
+    """
+    workbook = Workbook(write_only=True)
+    planilha = workbook.create_sheet(nome_aba)
+    linhas = 0
+    cabecalho = False
+
+    for lote in lotes:
+        df_lote = _para_dataframe(lote)
+        if not cabecalho:
+            planilha.append(list(df_lote.columns))
+            cabecalho = True
+        colunas = [df_lote[coluna].astype(object).tolist() for coluna in df_lote.columns]
+        for linha in zip(*colunas):
+            planilha.append(linha)
+        linhas += len(df_lote)
+
+    workbook.save(destino)
+    return linhas
+
+def escrever_escala_csv(lotes: Iterable[Any], destino, sep: str = ',', encoding: str = 'utf-8') -> int:
+    """
+    Grava os lotes da escala em CSV, com o cabeçalho apenas no primeiro lote.
+
+    Args:
+        lotes: Lotes da escala (DataFrames ou RecordBatches)
+        destino: Caminho do arquivo ou objeto de arquivo texto
+        sep: Separador de colunas
+        encoding: Codificação do arquivo (quando destino é um caminho)
+
+    Returns:
+        Quantidade de linhas gravadas (sem o cabeçalho)
+    """
+    if isinstance(destino, str):
+        with open(destino, 'w', encoding=encoding, newline='') as arquivo:
+            return escrever_escala_csv(lotes, arquivo, sep)
+
+    linhas = 0
+    for lote in lotes:
+        df_lote = _para_dataframe(lote)
+        df_lote.to_csv(destino, sep=sep, index=False, header=linhas == 0)
+        linhas += len(df_lote)
+    return linhas
+
+def escrever_escala_parquet(lotes: Iterable[Any], destino) -> int:
+    """
+    Grava os lotes da escala em Parquet (um grupo de linhas por lote).
+
+    Args:
+        lotes: Lotes da escala (DataFrames ou RecordBatches)
+        destino: Caminho do arquivo ou objeto de arquivo binário
+
+    Returns:
+        Quantidade de linhas gravadas
+    """
+    if pq is None:
+        raise ImportError("pyarrow não está instalado - não é possível gravar Parquet")
+
+    linhas = 0
+    with pq.ParquetWriter(destino, ESQUEMA_ARROW) as writer:
+        for lote in lotes:
+            if isinstance(lote, pd.DataFrame):
+                lote = pa.RecordBatch.from_pandas(lote, schema=ESQUEMA_ARROW, preserve_index=False)
+            writer.write_batch(lote)
+            linhas += lote.num_rows
+    return linhas
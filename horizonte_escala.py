@@ -0,0 +1,112 @@
+"""
+Horizonte de Escalas
+====================
+
+Geração de vários meses consecutivos em uma única passada. O estado de cada
+colaborador ao fim de um mês (tipo de plantão vigente, último plantão,
+contadores e último domingo de folga da 6x1, posição das escalas
+rotativas) é transportado para o mês seguinte, sem a cópia manual de
+Ultimo_Plantao_Mes_Anterior e Ultimo_Domingo_Folga na planilha.
+
+Os meses são gerados sob demanda: cada período só é calculado quando o
+anterior já foi consumido.
+"""
+
+from datetime import date, timedelta
+from typing import Iterator, List, Tuple
+
+import pandas as pd
+
+from calendario import CalendarioFeriados, tabela_feriados
+from diagnosticos import ColetorDiagnosticos
+from escala_generator import GeradorEscala
+
+def periodos_mensais(data_inicio: date, meses: int) -> List[Tuple[date, date]]:
+    """
+    Divide o horizonte em períodos mensais consecutivos.
+
+    O primeiro período vai de data_inicio ao fim do mês; os demais são meses completos.
+
+    Args:
+        data_inicio: Data de início do horizonte
+        meses: Quantidade de meses
+
+    Returns:
+        Lista de tuplas (data de início, data de fim)
+    """
+    periodos = []
+    inicio = data_inicio
+    for _ in range(meses):
+        proximo_mes = (inicio.replace(day=1) + timedelta(days=32)).replace(day=1)
+        periodos.append((inicio, proximo_mes - timedelta(days=1)))
+        inicio = proximo_mes
+    return periodos
+
+class PeriodoEscala:
+    """Escala de um período do horizonte."""
+
+    def __init__(self, indice: int, gerador: GeradorEscala, df_colaboradores: pd.DataFrame,
+                 escala_completa: pd.DataFrame):
+        """
+        Inicializa o período.
+
+        Args:
+            indice: Posição do período no horizonte (0 = primeiro mês)
+            gerador: Gerador usado no período (matriz, controle 6x1, estatísticas e diagnósticos)
+            df_colaboradores: Dados dos colaboradores usados no período, já com o estado transportado
+            escala_completa: Escala completa do período
+        """
+        self.indice = indice
+        self.gerador = gerador
+        self.df_colaboradores = df_colaboradores
+        self.escala_completa = escala_completa
+
+    def __repr__(self) -> str:
+        return f"PeriodoEscala({self.indice}, {self.data_inicio:%d/%m/%Y} a {self.data_fim:%d/%m/%Y})"
+
+    @property
+    def data_inicio(self) -> date:
+        return self.gerador.data_inicio
+
+    @property
+    def data_fim(self) -> date:
+        return self.gerador.data_fim
+
+    @property
+    def matriz_escala(self):
+        return self.gerador.matriz_escala
+
+def gerar_horizonte(df_colaboradores: pd.DataFrame, data_inicio: date, meses: int, feriados: pd.DataFrame,
+                    unidade: str = None, diagnosticos: ColetorDiagnosticos = None,
+                    processos: int = 1) -> Iterator[PeriodoEscala]:
+    """
+    Gera a escala de meses consecutivos, transportando o estado dos colaboradores.
+
+    Os feriados são processados uma única vez e compartilhados por todos os
+    períodos, assim como o cache de escalas base.
+
+    Args:
+        df_colaboradores: DataFrame com os dados dos colaboradores no início do horizonte
+        data_inicio: Data de início do horizonte
+        meses: Quantidade de meses
+        feriados: DataFrame com os feriados do horizonte ou CalendarioFeriados já montado
+        unidade: Unidade cujos feriados próprios devem ser considerados (opcional)
+        diagnosticos: Coletor onde os avisos de todos os períodos são registrados (opcional)
+        processos: Quantidade de processos de trabalho de cada período (ver gerar_escala_completa)
+
+    Returns:
+        Iterador de PeriodoEscala, um por mês, na ordem do calendário
+    """
+    periodos = periodos_mensais(data_inicio, meses)
+    calendario_feriados = feriados
+    if not isinstance(feriados, CalendarioFeriados):
+        # Feriados recortados ao horizonte inteiro, não ao primeiro período
+        calendario_feriados = CalendarioFeriados()
+        if periodos and feriados is not None and not feriados.empty:
+            tabela, _ = tabela_feriados(feriados, diagnosticos)
+            calendario_feriados = CalendarioFeriados.de_tabela(tabela, data_inicio, periodos[-1][1])
+    for indice, (inicio, fim) in enumerate(periodos):
+        gerador = GeradorEscala(inicio, fim, calendario_feriados, unidade, diagnosticos)
+        escala_completa = gerador.gerar_escala_completa(df_colaboradores, processos=processos)
+        yield PeriodoEscala(indice, gerador, df_colaboradores, escala_completa)
+        df_colaboradores = gerador.colaboradores_proximo_periodo(df_colaboradores)
@@ -0,0 +1,376 @@
+"""
+Matriz da Escala
+================
+
+Representação canônica da escala em memória: uma matriz uint8 de códigos de
+status (linhas = colaboradores, colunas = dias), os metadados de cada linha
+(Nome, Cargo, Tipo_Escala, Turno e controle 6x1) e o calendário do período
+como eixo das colunas.
+
+O acesso a uma célula é O(1); fatias de linhas e de dias compartilham os
+dados; os formatos longo (uma linha por colaborador e dia), largo (uma coluna
+por data) e Arrow são montados a partir da matriz, sem agrupamentos.
+
+Para armazenamento e relatórios a matriz também se decompõe em duas tabelas
+ligadas pelo Id_Colaborador: a tabela de fatos (Id_Colaborador, Dia, Status,
+todas numéricas) e a dimensão de colaboradores (identificação e controle 6x1,
+uma linha por colaborador).
+"""
+
+from datetime import date
+from typing import List, Sequence, Union
+
+import numpy as np
+import pandas as pd
+try:
+    import pyarrow as pa
+except ImportError:
+    pa = None
+
+from calendario import Calendario
+from status_escala import ROTULOS_STATUS, StatusEscala
+
+COLUNAS_INFO = ['Nome', 'Cargo', 'Tipo_Escala', 'Turno']
+COLUNAS_CONTROLE = ['Ultimo_Domingo_Folga', 'Domingos_Folgados', 'Semanas_Sem_Domingo']
+
+# Chave que liga a tabela de fatos à dimensão de colaboradores
+COLUNA_ID = 'Id_Colaborador'
+COLUNAS_FATOS = [COLUNA_ID, 'Dia', 'Status']
+
+# Esquema dos lotes Arrow da escala (textos e status como dicionários, datas como date32)
+ESQUEMA_ARROW = pa.schema(
+    [(coluna, pa.dictionary(pa.int32(), pa.string())) for coluna in COLUNAS_INFO]
+    + [('Data', pa.date32()),
+       ('Status', pa.dictionary(pa.int8(), pa.string())),
+       ('Status_Colorido', pa.dictionary(pa.int8(), pa.string()))]
+) if pa is not None else None
+
+def contagens_fatos(fatos: pd.DataFrame, colaboradores: int) -> np.ndarray:
+    """
+    Conta os dias de cada status por colaborador a partir da tabela de fatos.
+
+    Args:
+        fatos: Tabela de fatos (Id_Colaborador, Dia, Status)
+        colaboradores: Quantidade de colaboradores da dimensão (Id_Colaborador de 0 a colaboradores - 1)
+
+    Returns:
+        Matriz int64 (colaboradores × status), na ordem dos Id_Colaborador
+    """
+    quantidade = len(ROTULOS_STATUS)
+    chaves = fatos[COLUNA_ID].to_numpy(dtype=np.int64) * quantidade + fatos['Status'].to_numpy()
+    return np.bincount(chaves, minlength=colaboradores * quantidade).reshape(colaboradores, quantidade)
+
+class MatrizEscala:
+    """Escala como matriz colaboradores × dias de códigos de status."""
+
+    def __init__(self, status: np.ndarray, metadados: pd.DataFrame, calendario: Calendario):
+        """
+        Inicializa a matriz.
+
+        Args:
+            status: Matriz uint8 (colaboradores × dias) de códigos StatusEscala
+            metadados: DataFrame com uma linha por colaborador (COLUNAS_INFO e,
+                opcionalmente, COLUNAS_CONTROLE)
+            calendario: Calendário do período (eixo das colunas)
+        """
+        status = np.asarray(status, dtype=np.uint8)
+        if status.ndim != 2:
+            raise ValueError("A matriz de status deve ter duas dimensões (colaboradores × dias)")
+        if status.shape[0] != len(metadados):
+            raise ValueError(f"Matriz com {status.shape[0]} linhas e {len(metadados)} linhas de metadados")
+        if status.shape[1] != len(calendario):
+            raise ValueError(f"Matriz com {status.shape[1]} dias e calendário com {len(calendario)} dias")
+
+        self.status = status
+        self.metadados = metadados.reset_index(drop=True)
+        self.calendario = calendario
+        self._indice_nomes = None
+
+    def __repr__(self) -> str:
+        return (f"MatrizEscala({self.status.shape[0]} colaboradores × {self.status.shape[1]} dias, "
+                f"{self.calendario.data_inicio} a {self.calendario.data_fim})")
+
+    def __len__(self) -> int:
+        """Quantidade de colaboradores."""
+        return self.status.shape[0]
+
+    @property
+    def shape(self):
+        """Formato (colaboradores, dias)."""
+        return self.status.shape
+
+    @property
+    def vazia(self) -> bool:
+        """Indica se a matriz não tem colaboradores ou dias."""
+        return self.status.size == 0
+
+    @property
+    def datas(self) -> List[date]:
+        """Datas do eixo das colunas."""
+        return list(self.calendario.datas_python)
+
+    def indice_colaborador(self, nome: str) -> int:
+        """
+        Retorna a linha de um colaborador.
+
+        Args:
+            nome: Nome do colaborador
+
+        Returns:
+            Índice da primeira linha com o nome, ou -1 se não existir
+        """
+        if self._indice_nomes is None:
+            indice = {}
+            for linha, valor in enumerate(self.metadados['Nome']):
+                indice.setdefault(valor, linha)
+            self._indice_nomes = indice
+        return self._indice_nomes.get(nome, -1)
+
+    def _linha(self, colaborador: Union[int, str]) -> int:
+        if isinstance(colaborador, str):
+            linha = self.indice_colaborador(colaborador)
+            if linha < 0:
+                raise KeyError(f"Colaborador '{colaborador}' não está na escala")
+            return linha
+        return colaborador
+
+    def _dia(self, dia: Union[int, date]) -> int:
+        if isinstance(dia, date):
+            indice = self.calendario.indice(dia)
+            if indice < 0:
+                raise KeyError(f"Data {dia} fora do período da escala")
+            return indice
+        return dia
+
+    def status_em(self, colaborador: Union[int, str], dia: Union[int, date]) -> StatusEscala:
+        """
+        Retorna o status de um colaborador em um dia (acesso O(1)).
+
+        Args:
+            colaborador: Linha ou nome do colaborador
+            dia: Índice do dia ou data
+
+        Returns:
+            Status do dia
+        """
+        return StatusEscala(int(self.status[self._linha(colaborador), self._dia(dia)]))
+
+    def __getitem__(self, chave) -> Union[StatusEscala, 'MatrizEscala']:
+        """
+        Acessa uma célula (matriz[i, j]) ou fatia linhas e/ou dias (matriz[linhas, inicio:fim]).
+
+        Linhas e dias aceitam índices, nomes e datas; fatias de dias devem ser contíguas.
+        """
+        linhas, dias = chave if isinstance(chave, tuple) else (chave, slice(None))
+        if not isinstance(linhas, (slice, list, np.ndarray)) and not isinstance(dias, slice):
+            return self.status_em(linhas, dias)
+        if not isinstance(linhas, (slice, list, np.ndarray)):
+            linhas = [self._linha(linhas)]
+        if not isinstance(dias, slice):
+            dia = self._dia(dias)
+            dias = slice(dia, dia + 1)
+        return self.fatiar(linhas, dias)
+
+    def fatiar(self, linhas: Union[slice, Sequence[int], np.ndarray] = slice(None),
+               dias: slice = slice(None)) -> 'MatrizEscala':
+        """
+        Retorna a matriz restrita a algumas linhas e a um trecho contíguo de dias.
+
+        Args:
+            linhas: Fatia, índices, nomes ou máscara booleana das linhas
+            dias: Fatia contígua de dias (índices ou datas; fim exclusivo)
+
+        Returns:
+            Nova MatrizEscala (fatias simples compartilham os dados)
+        """
+        if isinstance(linhas, list) and linhas and isinstance(linhas[0], str):
+            linhas = [self._linha(nome) for nome in linhas]
+        if isinstance(linhas, list):
+            linhas = np.array(linhas, dtype=np.int64)
+        if dias.step not in (None, 1):
+            raise ValueError("Fatias de dias devem ser contíguas")
+
+        inicio = 0 if dias.start is None else self._dia(dias.start)
+        fim = len(self.calendario) if dias.stop is None else self._dia(dias.stop)
+        inicio, fim, _ = slice(inicio, fim).indices(len(self.calendario))
+        if fim <= inicio:
+            raise ValueError("Fatia de dias vazia")
+
+        metadados = self.metadados[linhas] if isinstance(linhas, np.ndarray) and linhas.dtype == bool \
+            else self.metadados.iloc[linhas]
+        calendario = self.calendario if (inicio, fim) == (0, len(self.calendario)) \
+            else self.calendario.fatiar(inicio, fim)
+        return MatrizEscala(self.status[linhas, inicio:fim], metadados, calendario)
+
+    def periodo(self, data_inicio: date, data_fim: date) -> 'MatrizEscala':
+        """
+        Retorna a matriz restrita a um período (datas inclusivas, recortadas ao calendário).
+
+        Args:
+            data_inicio: Primeira data
+            data_fim: Última data
+
+        Returns:
+            Nova MatrizEscala com os dias do período
+        """
+        inicio = max(0, (np.datetime64(data_inicio, 'D') - self.calendario.datas[0]).astype(int)) \
+            if len(self.calendario) else 0
+        fim = (np.datetime64(data_fim, 'D') - self.calendario.datas[0]).astype(int) + 1 \
+            if len(self.calendario) else 0
+        return self.fatiar(slice(None), slice(int(inicio), int(max(inicio, fim))))
+
+    def contagens(self) -> np.ndarray:
+        """
+        Conta os dias de cada status por colaborador.
+
+        Returns:
+            Matriz int64 (colaboradores × status) com as contagens, na ordem dos códigos
+        """
+        quantidade = len(ROTULOS_STATUS)
+        linhas = np.repeat(np.arange(len(self), dtype=np.int64), self.status.shape[1])
+        chaves = linhas * quantidade + self.status.ravel()
+        return np.bincount(chaves, minlength=len(self) * quantidade).reshape(len(self), quantidade)
+
+    def para_fatos(self) -> pd.DataFrame:
+        """
+        Converte a matriz na tabela de fatos diária (uma linha por colaborador e dia).
+
+        Id_Colaborador é a linha da matriz (ver dimensao_colaboradores), Dia é o
+        índice do dia no calendário e Status é o código StatusEscala.
+
+        Returns:
+            DataFrame com Id_Colaborador (int32), Dia (int16) e Status (uint8)
+        """
+        linhas, dias = self.status.shape
+        return pd.DataFrame({
+            COLUNA_ID: np.repeat(np.arange(linhas, dtype=np.int32), dias),
+            'Dia': np.tile(np.arange(dias, dtype=np.int16), linhas),
+            'Status': self.status.ravel()
+        })
+
+    def dimensao_colaboradores(self) -> pd.DataFrame:
+        """
+        Retorna a dimensão de colaboradores da tabela de fatos.
+
+        Returns:
+            DataFrame com Id_Colaborador (int32) seguido dos metadados, uma linha por colaborador
+        """
+        dimensao = self.metadados.copy()
+        dimensao.insert(0, COLUNA_ID, np.arange(len(dimensao), dtype=np.int32))
+        return dimensao
+
+    @classmethod
+    def de_tabelas(cls, fatos: pd.DataFrame, colaboradores: pd.DataFrame,
+                   calendario: Calendario) -> 'MatrizEscala':
+        """
+        Remonta a matriz a partir da tabela de fatos e da dimensão de colaboradores.
+
+        Args:
+            fatos: Tabela de fatos completa (uma linha por colaborador e dia, em qualquer ordem)
+            colaboradores: Dimensão de colaboradores (define a ordem das linhas)
+            calendario: Calendário do período
+
+        Returns:
+            MatrizEscala equivalente
+        """
+        if len(fatos) != len(colaboradores) * len(calendario):
+            raise ValueError(f"Tabela de fatos com {len(fatos)} linhas para {len(colaboradores)} "
+                             f"colaboradores e {len(calendario)} dias")
+        linhas = pd.Index(colaboradores[COLUNA_ID]).get_indexer(fatos[COLUNA_ID])
+        if (linhas < 0).any():
+            raise ValueError("Tabela de fatos com colaboradores ausentes da dimensão")
+
+        status = np.empty((len(colaboradores), len(calendario)), dtype=np.uint8)
+        status[linhas, fatos['Dia'].to_numpy()] = fatos['Status'].to_numpy()
+        return cls(status, colaboradores.drop(columns=COLUNA_ID), calendario)
+
+    def para_longo(self, rotulos_coloridos: Sequence[str] = None, controle: bool = False,
+                   categoricos: bool = True) -> pd.DataFrame:
+        """
+        Converte a matriz para o formato longo (uma linha por colaborador e dia).
+
+        Args:
+            rotulos_coloridos: Rótulo com emoji de cada código (opcional; inclui Status_Colorido)
+            controle: Incluir as colunas de controle 6x1 repetidas em cada dia
+            categoricos: Textos repetidos como categóricos (False mantém texto)
+
+        Returns:
+            DataFrame com Nome, Cargo, Tipo_Escala, Turno, Data, Status e Status_Colorido
+        """
+        linhas, dias = self.status.shape
+        codigos = self.status.ravel()
+
+        colunas = {}
+        for coluna in COLUNAS_INFO:
+            valores = self.metadados[coluna].to_numpy(dtype=object)
+            if categoricos:
+                categorias = pd.Categorical(valores)
+                colunas[coluna] = pd.Categorical.from_codes(np.repeat(categorias.codes, dias), categorias.categories)
+            else:
+                colunas[coluna] = np.repeat(valores, dias)
+        colunas['Data'] = np.tile(np.array(self.calendario.datas_python, dtype=object), linhas)
+        colunas['Status'] = pd.Categorical.from_codes(codigos, categories=ROTULOS_STATUS)
+        if rotulos_coloridos is not None:
+            colunas['Status_Colorido'] = pd.Categorical.from_codes(codigos, categories=list(rotulos_coloridos))
+        if controle:
+            for coluna in COLUNAS_CONTROLE:
+                colunas[coluna] = np.repeat(self.metadados[coluna].to_numpy(), dias)
+
+        return pd.DataFrame(colunas)
+
+    def para_largo(self, rotulos: Sequence[str] = None, categoricos: bool = False) -> pd.DataFrame:
+        """
+        Converte a matriz para o formato largo (uma coluna por data), na ordem das linhas.
+
+        Args:
+            rotulos: Rótulo de cada código exibido nas células (padrão: ROTULOS_STATUS)
+            categoricos: Informações e células como categóricos (como no pivot do formato longo)
+
+        Returns:
+            DataFrame com COLUNAS_INFO seguidas de uma coluna por data (columns.name = 'Data')
+        """
+        rotulos = list(ROTULOS_STATUS if rotulos is None else rotulos)
+        datas = pd.Index(self.datas, dtype=object)
+        if categoricos:
+            informacoes = pd.DataFrame({
+                coluna: pd.Categorical(self.metadados[coluna].to_numpy(dtype=object)) for coluna in COLUNAS_INFO
+            })
+            celulas = pd.DataFrame({
+                data: pd.Categorical.from_codes(self.status[:, dia], categories=rotulos)
+                for dia, data in enumerate(datas)
+            }, columns=datas)
+        else:
+            informacoes = self.metadados[COLUNAS_INFO]
+            celulas = pd.DataFrame(np.array(rotulos, dtype=object)[self.status], columns=datas)
+        largo = pd.concat([informacoes, celulas], axis=1)
+        largo.columns.name = 'Data'
+        return largo
+
+    def para_arrow(self, rotulos_coloridos: Sequence[str]) -> 'pa.RecordBatch':
+        """
+        Converte a matriz em lote Arrow (mesmas colunas de para_longo, esquema ESQUEMA_ARROW).
+
+        Args:
+            rotulos_coloridos: Rótulo com emoji de cada código de status
+
+        Returns:
+            pyarrow.RecordBatch com uma linha por colaborador e dia
+        """
+        if pa is None:
+            raise ImportError("pyarrow não está instalado - não é possível gerar lotes Arrow")
+
+        linhas, dias = self.status.shape
+        codigos = pa.array(self.status.ravel().astype(np.int8), pa.int8())
+
+        colunas = []
+        for coluna in COLUNAS_INFO:
+            categorias = pd.Categorical(self.metadados[coluna].to_numpy(dtype=object))
+            colunas.append(pa.DictionaryArray.from_arrays(
+                pa.array(np.repeat(categorias.codes.astype(np.int32), dias), pa.int32()),
+                pa.array(categorias.categories.astype(str), pa.string())
+            ))
+        colunas.append(pa.array(np.tile(self.calendario.datas, linhas), pa.date32()))
+        colunas.append(pa.DictionaryArray.from_arrays(codigos, pa.array(ROTULOS_STATUS, pa.string())))
+        colunas.append(pa.DictionaryArray.from_arrays(codigos, pa.array(list(rotulos_coloridos), pa.string())))
+
+        return pa.RecordBatch.from_arrays(colunas, schema=ESQUEMA_ARROW)
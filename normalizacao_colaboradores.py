@@ -0,0 +1,137 @@
+"""
+Normalização dos Colaboradores
+==============================
+
+Converte, de uma só vez para o DataFrame inteiro, os campos de data e de
+exceções dos colaboradores em colunas tipadas, antes da geração das escalas:
+
+- Ultimo_Plantao_Mes_Anterior e Ultimo_Domingo_Folga: datetime64 (NaT se vazio)
+- Atestados, Ferias e Escalas_Manuais: tupla de períodos (início, fim); cada campo
+  aceita várias datas e períodos (ver excecoes_escala)
+- Dias_Trabalhados_Seguidos e Semanas_Sem_Domingo: inteiros (Int64, <NA> se vazio)
+
+Os valores que não puderam ser convertidos são descartados e registrados na
+coluna Rejeicoes, como pares (campo, valor recebido); o gerador decide quais
+deles viram avisos. O DataFrame convertido é marcado em DataFrame.attrs
+(ATRIBUTO_NORMALIZADO), marca preservada nas fatias e cópias.
+
+As datas são convertidas coluna a coluna por conversao_datas.converter_datas,
+em um único formato por coluna (o que reconhece mais valores); as datas fora
+dele são rejeitadas e, com um coletor de diagnósticos, avisadas uma vez por
+coluna.
+"""
+
+from datetime import date
+from typing import Optional, Tuple
+
+import numpy as np
+import pandas as pd
+
+from conversao_datas import converter_datas, textos_data
+from diagnosticos import ColetorDiagnosticos
+from excecoes_escala import CAMPOS_EXCECAO, converter_coluna_excecoes
+
+CAMPOS_DATA = ['Ultimo_Plantao_Mes_Anterior', 'Ultimo_Domingo_Folga']
+CAMPOS_CONTADOR = ['Dias_Trabalhados_Seguidos', 'Semanas_Sem_Domingo']
+
+COLUNA_REJEICOES = 'Rejeicoes'
+
+# Marca, em DataFrame.attrs, dos DataFrames já convertidos por normalizar_colaboradores
+ATRIBUTO_NORMALIZADO = 'colaboradores_normalizados'
+
+def _textos(valores: pd.Series) -> Tuple[pd.Series, pd.Series]:
+    """Converte os valores em texto sem espaços nas pontas; retorna (textos, máscara de vazios)."""
+    textos = textos_data(valores)
+    return textos, textos.eq('')
+
+def _registrar(rejeicoes: list, campo: str, posicoes: np.ndarray, valores: np.ndarray):
+    """Acrescenta as rejeições de um campo às listas por linha."""
+    for posicao, valor in zip(posicoes, valores):
+        rejeicoes[posicao].append((campo, valor))
+
+def _tuplas_por_linha(valores: pd.Series, quantidade: int) -> list:
+    """Agrupa valores indexados pela posição da linha (em ordem) em uma tupla por linha."""
+    tuplas = [()] * quantidade
+    if len(valores):
+        posicoes = valores.index.to_numpy()
+        inicios = np.flatnonzero(np.diff(posicoes, prepend=-1))
+        for posicao, grupo in zip(posicoes[inicios], np.split(valores.to_numpy(dtype=object), inicios[1:])):
+            tuplas[posicao] = tuple(grupo)
+    return tuplas
+
+def _converter_excecoes(textos: pd.Series, campo: str, rejeicoes: list,
+                        diagnosticos: ColetorDiagnosticos = None) -> list:
+    """Converte um campo de exceção (datas e períodos) em uma tupla de períodos (início, fim) por linha."""
+    periodos, rejeitados = converter_coluna_excecoes(textos, diagnosticos, campo)
+    _registrar(rejeicoes, campo, rejeitados.index, rejeitados.to_numpy())
+    inicios, fins = (periodos[coluna].to_numpy(dtype='datetime64[D]').tolist() for coluna in ('Inicio', 'Fim'))
+    valores = pd.Series(list(zip(inicios, fins)),
+                        index=periodos['Linha'].to_numpy(), dtype=object)
+    return _tuplas_por_linha(valores, len(textos))
+
+def normalizar_colaboradores(df_colaboradores: pd.DataFrame,
+                             diagnosticos: ColetorDiagnosticos = None) -> pd.DataFrame:
+    """
+    Converte os campos de data e de exceções dos colaboradores em colunas tipadas.
+
+    Campos ausentes são criados vazios. Um DataFrame já normalizado (marcado em
+    attrs, ver normalizado) é devolvido sem alterações.
+
+    Args:
+        df_colaboradores: DataFrame com os dados dos colaboradores
+        diagnosticos: Coletor onde as datas fora do formato de cada coluna são registradas (opcional)
+
+    Returns:
+        Novo DataFrame, com o mesmo índice, com as colunas convertidas e a coluna Rejeicoes,
+        marcado como normalizado
+    """
+    if normalizado(df_colaboradores):
+        return df_colaboradores
+
+    normalizado_df = df_colaboradores.copy()
+    quantidade = len(normalizado_df)
+    rejeicoes = [[] for _ in range(quantidade)]
+
+    def coluna(campo: str) -> Tuple[pd.Series, pd.Series]:
+        if campo in normalizado_df:
+            valores = normalizado_df[campo].reset_index(drop=True)
+        else:
+            valores = pd.Series([None] * quantidade, dtype=object)
+        return _textos(valores)
+
+    for campo in CAMPOS_DATA:
+        textos, vazios = coluna(campo)
+        datas = converter_datas(textos, diagnosticos=diagnosticos, campo=campo)
+        rejeitados = datas.isna() & ~vazios
+        _registrar(rejeicoes, campo, np.flatnonzero(rejeitados), textos[rejeitados].to_numpy())
+        normalizado_df[campo] = datas.to_numpy()
+
+    for campo in CAMPOS_CONTADOR:
+        textos, vazios = coluna(campo)
+        numeros = pd.to_numeric(textos.where(~vazios), errors='coerce')
+        rejeitados = numeros.isna() & ~vazios
+        _registrar(rejeicoes, campo, np.flatnonzero(rejeitados), textos[rejeitados].to_numpy())
+        normalizado_df[campo] = pd.array(np.trunc(numeros).clip(lower=0), dtype='Int64')
+
+    for campo in CAMPOS_EXCECAO:
+        textos, _ = coluna(campo)
+        normalizado_df[campo] = pd.Series(_converter_excecoes(textos, campo, rejeicoes, diagnosticos),
+                                          index=normalizado_df.index, dtype=object)
+
+    normalizado_df[COLUNA_REJEICOES] = pd.Series([tuple(linha) for linha in rejeicoes],
+                                                 index=normalizado_df.index, dtype=object)
+    normalizado_df.attrs[ATRIBUTO_NORMALIZADO] = True
+    return normalizado_df
+
+def normalizado(df_colaboradores: pd.DataFrame) -> bool:
+    """
+    Indica se o DataFrame de colaboradores já passou por normalizar_colaboradores.
+
+    A marca fica em DataFrame.attrs: uma planilha que por acaso tenha uma coluna
+    Rejeicoes continua sendo convertida.
+    """
+    return bool(df_colaboradores.attrs.get(ATRIBUTO_NORMALIZADO, False))
+
+def para_data(valor) -> Optional[date]:
+    """Converte um valor de coluna de data normalizada (Timestamp ou NaT) em date."""
+    return None if pd.isna(valor) else valor.date()
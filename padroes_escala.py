@@ -0,0 +1,225 @@
+"""
+Padrões de Escala
+=================
+
+Registro declarativo dos tipos de escala. Cada padrão descreve o ciclo de
+trabalho/folga, a âncora que posiciona o ciclo no calendário, o tratamento
+de feriados e o status de trabalho (turno). O padrão é compilado uma única
+vez em arrays NumPy e gera o período inteiro de uma só vez.
+
+Para incluir um novo tipo de escala basta acrescentar uma entrada em
+PADROES_ESCALA.
+"""
+
+from datetime import date, timedelta
+from typing import Dict, Optional, Sequence, Tuple
+
+import numpy as np
+
+from calendario import Calendario
+from status_escala import CODIGOS_STATUS, StatusEscala
+
+# Âncoras suportadas:
+#   semana        posição do ciclo = dia da semana (0 = segunda-feira)
+#   paridade_mes  posição do ciclo = paridade do dia do mês (0 = par, 1 = ímpar)
+#   ciclo         posição contada a partir do último dia trabalhado (Ultimo_Plantao_Mes_Anterior);
+#                 sem âncora, o ciclo começa no primeiro dia do período
+#   domingo       motor 6x1 (folga a cada 6 dias e domingo a cada 7 semanas), posicionado
+#                 pelo último domingo de folga (Ultimo_Domingo_Folga)
+ANCORAS = ('semana', 'paridade_mes', 'ciclo', 'domingo')
+
+# Tratamento de feriados em dias de trabalho
+TRATAMENTOS_FERIADO = ('feriado', 'folga', 'trabalha')
+
+class PadraoEscala:
+    """Padrão de escala declarativo, compilado em arrays para geração vetorizada."""
+
+    def __init__(self, codigo: str, descricao: str, status_trabalho: str, ciclo: Sequence[int],
+                 ancora: str, feriado: str = 'trabalha'):
+        """
+        Inicializa e compila o padrão.
+
+        Args:
+            codigo: Código do tipo de escala (ex.: M44, P_D, D12X36)
+            descricao: Descrição exibida no formulário
+            status_trabalho: Status dos dias de trabalho (define o turno)
+            ciclo: Sequência de 1 (trabalho) e 0 (folga) de cada posição do ciclo
+            ancora: Regra que posiciona o ciclo no calendário (ver ANCORAS)
+            feriado: Tratamento de feriados em dias de trabalho (feriado, folga ou trabalha)
+        """
+        if ancora not in ANCORAS:
+            raise ValueError(f"Âncora '{ancora}' não suportada no padrão '{codigo}'")
+        if feriado not in TRATAMENTOS_FERIADO:
+            raise ValueError(f"Tratamento de feriado '{feriado}' não suportado no padrão '{codigo}'")
+        if ancora == 'semana' and len(ciclo) != 7:
+            raise ValueError(f"Padrão semanal '{codigo}' deve ter ciclo de 7 dias")
+        if ancora == 'paridade_mes' and len(ciclo) != 2:
+            raise ValueError(f"Padrão por paridade '{codigo}' deve ter ciclo de 2 dias")
+        if status_trabalho not in CODIGOS_STATUS:
+            raise ValueError(f"Status de trabalho '{status_trabalho}' não suportado no padrão '{codigo}'")
+
+        self.codigo = codigo
+        self.descricao = descricao
+        self.status_trabalho = status_trabalho
+        self.ciclo = tuple(int(dia) for dia in ciclo)
+        self.ancora = ancora
+        self.feriado = feriado
+
+        # Compilação: tipo de dia (0 = folga, 1 = trabalho, 2 = feriado) → código de status
+        self._trabalha = np.array(self.ciclo, dtype=bool)
+        self._status = np.array([StatusEscala.FOLGA, CODIGOS_STATUS[status_trabalho], StatusEscala.FERIADO],
+                                dtype=np.uint8)
+        self._ultima_posicao_trabalho = max((i for i, dia in enumerate(self.ciclo) if dia), default=0)
+
+    def __repr__(self) -> str:
+        return f"PadraoEscala({self.codigo!r}, ciclo={self.ciclo}, ancora={self.ancora!r})"
+
+    @property
+    def usa_ultimo_plantao(self) -> bool:
+        """Indica se a escala depende do último dia trabalhado antes do período."""
+        return self.ancora == 'ciclo'
+
+    @property
+    def usa_ultimo_domingo(self) -> bool:
+        """Indica se a escala depende do último domingo de folga."""
+        return self.ancora == 'domingo'
+
+    def posicoes(self, calendario: Calendario, ultimo_plantao: date = None) -> np.ndarray:
+        """
+        Calcula a posição do ciclo em cada dia do período.
+
+        Args:
+            calendario: Calendário do período
+            ultimo_plantao: Último dia trabalhado antes do período (âncora 'ciclo')
+
+        Returns:
+            Array com a posição do ciclo de cada dia
+        """
+        if self.ancora == 'semana':
+            return calendario.dia_semana
+        if self.ancora == 'paridade_mes':
+            return calendario.paridade
+        if self.ancora == 'ciclo':
+            dias = np.arange(len(calendario), dtype=np.int64)
+            if ultimo_plantao is not None:
+                dias += (calendario.data_inicio - ultimo_plantao).days + self._ultima_posicao_trabalho
+            return dias % len(self.ciclo)
+        raise ValueError(f"Padrão '{self.codigo}' usa o motor 6x1 e não tem posições fixas de ciclo")
+
+    def ancora_seguinte(self, calendario: Calendario, ultimo_plantao: date = None) -> date:
+        """
+        Calcula a âncora do ciclo para o período seguinte (âncora 'ciclo').
+
+        Retorna o último dia, até o fim do período, na última posição de
+        trabalho do ciclo. Usado como Ultimo_Plantao_Mes_Anterior do período
+        seguinte, mantém o ciclo contínuo mesmo quando o período termina no
+        meio de uma sequência de trabalho.
+
+        Args:
+            calendario: Calendário do período
+            ultimo_plantao: Último dia trabalhado antes do período
+
+        Returns:
+            Data da âncora
+        """
+        posicao_final = int(self.posicoes(calendario, ultimo_plantao)[-1])
+        recuo = (posicao_final - self._ultima_posicao_trabalho) % len(self.ciclo)
+        return calendario.data_fim - timedelta(days=recuo)
+
+    def tipos_dia(self, calendario: Calendario, posicoes: np.ndarray) -> np.ndarray:
+        """
+        Classifica os dias do período (0 = folga, 1 = trabalho, 2 = feriado).
+
+        Args:
+            calendario: Calendário do período
+            posicoes: Posição do ciclo em cada dia
+
+        Returns:
+            Array uint8 com o tipo de cada dia
+        """
+        trabalha = self._trabalha[posicoes]
+        tipos = trabalha.astype(np.uint8)
+        if self.feriado != 'trabalha':
+            tipos[trabalha & calendario.feriado] = 2 if self.feriado == 'feriado' else 0
+        return tipos
+
+    def gerar(self, calendario: Calendario, ultimo_plantao: date = None,
+              posicoes: np.ndarray = None) -> np.ndarray:
+        """
+        Gera a escala do período inteiro.
+
+        Args:
+            calendario: Calendário do período
+            ultimo_plantao: Último dia trabalhado antes do período (âncora 'ciclo')
+            posicoes: Posições do ciclo já calculadas (opcional, sobrepõe a âncora)
+
+        Returns:
+            Array uint8 de códigos de status (StatusEscala) alinhado a calendario.datas
+        """
+        if posicoes is None:
+            posicoes = self.posicoes(calendario, ultimo_plantao)
+        return self._status[self.tipos_dia(calendario, posicoes)]
+
+def _semana(dias_trabalho: int) -> Tuple[int, ...]:
+    """Ciclo semanal com trabalho nos primeiros dias da semana."""
+    return (1,) * dias_trabalho + (0,) * (7 - dias_trabalho)
+
+def _rotativo(dias_trabalho: int, dias_folga: int) -> Tuple[int, ...]:
+    """Ciclo rotativo de dias de trabalho seguidos de dias de folga."""
+    return (1,) * dias_trabalho + (0,) * dias_folga
+
+_TURNOS = (('M', 'Manhã', 'TRABALHO_MANHA'), ('T', 'Tarde', 'TRABALHO_TARDE'), ('N', 'Noite', 'TRABALHO_NOITE'))
+
+def _montar_padroes() -> Dict[str, PadraoEscala]:
+    """Monta o registro de padrões, na ordem exibida ao usuário."""
+    padroes = []
+    for sufixo, carga in (('44', '44H'), ('40', '40H')):
+        for letra, turno, status in _TURNOS:
+            padroes.append(PadraoEscala(f'{letra}{sufixo}', f"{carga} - {turno} (Segunda a sexta, 8h/dia)",
+                                        status, _semana(5), 'semana', feriado='feriado'))
+    for letra, turno, status in _TURNOS:
+        padroes.append(PadraoEscala(f'{letra}6X1', f"6x1 - {turno} (6 dias trabalho, 1 dia folga)",
+                                    status, _rotativo(6, 1), 'domingo'))
+    for prefixo, nome, ciclo in (('P', 'Par', (1, 0)), ('I', 'Ímpar', (0, 1))):
+        for letra, turno, status in (('D', 'Dia', 'TRABALHO_DIA'), ('N', 'Noite', 'TRABALHO_NOITE')):
+            padroes.append(PadraoEscala(f'{prefixo}_{letra}',
+                                        f"Plantão {nome} - {turno} (dias {nome.lower()}es do mês)",
+                                        status, ciclo, 'paridade_mes'))
+
+    # Escalas rotativas
+    padroes += [
+        PadraoEscala('D12X36', "12x36 - Dia (12h trabalho, 36h descanso)", 'TRABALHO_DIA', _rotativo(1, 1), 'ciclo'),
+        PadraoEscala('N12X36', "12x36 - Noite (12h trabalho, 36h descanso)", 'TRABALHO_NOITE', _rotativo(1, 1), 'ciclo'),
+        PadraoEscala('24X72', "24x72 - Dia (24h trabalho, 72h descanso)", 'TRABALHO_DIA', _rotativo(1, 3), 'ciclo'),
+    ]
+    for letra, turno, status in _TURNOS:
+        padroes.append(PadraoEscala(f'{letra}5X2', f"5x2 - {turno} (5 dias trabalho, 2 dias folga, rotativo)",
+                                    status, _rotativo(5, 2), 'ciclo', feriado='feriado'))
+    for letra, turno, status in _TURNOS:
+        padroes.append(PadraoEscala(f'{letra}4X2', f"4x2 - {turno} (4 dias trabalho, 2 dias folga)",
+                                    status, _rotativo(4, 2), 'ciclo', feriado='feriado'))
+
+    return {padrao.codigo: padrao for padrao in padroes}
+
+PADROES_ESCALA: Dict[str, PadraoEscala] = _montar_padroes()
+
+def padrao_por_ciclo(status_trabalho: str, ciclo: Sequence[int], ancora: str) -> Optional[PadraoEscala]:
+    """
+    Localiza o padrão com o mesmo turno, ciclo e âncora.
+
+    Usado na alternância dos plantões: ao inverter a paridade, o ciclo é
+    rotacionado e o tipo vigente passa a ser o padrão com o ciclo resultante.
+
+    Args:
+        status_trabalho: Status dos dias de trabalho
+        ciclo: Ciclo procurado
+        ancora: Âncora do padrão
+
+    Returns:
+        Padrão encontrado, ou None
+    """
+    ciclo = tuple(ciclo)
+    for padrao in PADROES_ESCALA.values():
+        if padrao.status_trabalho == status_trabalho and padrao.ciclo == ciclo and padrao.ancora == ancora:
+            return padrao
+    return None
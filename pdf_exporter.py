@@ -200,6 +200,7 @@ class PDFExporter:
         self.pdf.ln(3)
         
         estatisticas = escala_completa['Status'].value_counts()
+        estatisticas = estatisticas[estatisticas > 0]
         
         self.pdf.set_font('Arial', '', 10)
         for status, quantidade in estatisticas.items():
@@ -213,6 +214,7 @@ class PDFExporter:
         self.pdf.ln(3)
         
         estatisticas_colaborador = escala_completa[escala_completa['Status'] == 'TRABALHO']['Nome'].value_counts()
+        estatisticas_colaborador = estatisticas_colaborador[estatisticas_colaborador > 0]
         
         self.pdf.set_font('Arial', '', 10)
         for colaborador, quantidade in estatisticas_colaborador.items():
@@ -6,34 +6,221 @@ Contém as regras de jornada de trabalho conforme a CLT brasileira
 para cada tipo de escala implementado no sistema.
 """
 
-from datetime import date, timedelta, datetime
-from typing import List, Dict, Any, Tuple
+from datetime import date, timedelta
+from typing import List, Dict, Any, Sequence, Tuple
 import calendar
+import threading
+from collections import OrderedDict
+from functools import lru_cache, partial
+from types import MappingProxyType
+
+import numpy as np
+
+from calendario import Calendario, CalendarioFeriados
+from excecoes_escala import (IntervaloExcecao, aplicar_intervalos, converter_campo_excecao, dias_periodos,
+                             intervalos_excecoes)
+from padroes_escala import PADROES_ESCALA, PadraoEscala, padrao_por_ciclo
+from status_escala import CODIGOS_STATUS, StatusEscala, codificar_status, decodificar_status
+
+# Tabela de transições da escala 6x1
+# Estado = (dias trabalhados 0-6, semanas sem domingo 0-6, dia da semana 0-6)
+_ESTADOS_6X1 = 7 * 7 * 7
+
+def _estado_6x1(dias_trabalhados: int, semanas_sem_domingo: int, dia_semana: int) -> int:
+    """Codifica o estado 6x1 em um inteiro (semanas acima de 6 equivalem a 6)."""
+    return (min(dias_trabalhados, 6) * 7 + min(semanas_sem_domingo, 6)) * 7 + dia_semana
+
+def _decodificar_estado_6x1(estado: int) -> Tuple[int, int, int]:
+    """Decodifica o estado 6x1 em (dias trabalhados, semanas sem domingo, dia da semana)."""
+    return estado // 49, (estado // 7) % 7, estado % 7
+
+def _montar_transicoes_6x1() -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Monta a tabela de transições da regra 6x1 para todos os estados.
+    
+    Returns:
+        Tupla (próximo estado, trabalha no dia, folga em domingo) indexada pelo estado
+    """
+    proximo = np.zeros(_ESTADOS_6X1, dtype=np.int16)
+    trabalha = np.zeros(_ESTADOS_6X1, dtype=bool)
+    folga_domingo = np.zeros(_ESTADOS_6X1, dtype=bool)
+    
+    for estado in range(_ESTADOS_6X1):
+        dias_trabalhados, semanas_sem_domingo, dia_semana = _decodificar_estado_6x1(estado)
+        if dia_semana == 6:  # Domingo
+            # Regra: 1 domingo de folga a cada 7 semanas, no mínimo
+            if semanas_sem_domingo >= 6:  # Força folga no domingo
+                folga_domingo[estado] = True
+                semanas_sem_domingo = 0
+            # Verificar se já trabalhou 6 dias seguidos
+            elif dias_trabalhados >= 6:
+                folga_domingo[estado] = True
+                dias_trabalhados = 0
+                semanas_sem_domingo = 0
+            else:
+                trabalha[estado] = True
+                dias_trabalhados += 1
+                semanas_sem_domingo += 1
+        # Regra 6x1: 6 dias trabalho, 1 dia folga
+        elif dias_trabalhados < 6:
+            trabalha[estado] = True
+            dias_trabalhados += 1
+        else:
+            dias_trabalhados = 0
+        proximo[estado] = _estado_6x1(dias_trabalhados, semanas_sem_domingo, (dia_semana + 1) % 7)
+    
+    return proximo, trabalha, folga_domingo
+
+_PROXIMO_6X1, _TRABALHA_6X1, _FOLGA_DOMINGO_6X1 = _montar_transicoes_6x1()
+
+@lru_cache(maxsize=_ESTADOS_6X1)
+def _ciclo_6x1(estado_inicial: int) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Detecta o ciclo da sequência de estados a partir de um estado inicial.
+    
+    Returns:
+        Tupla (estados do prefixo antes do ciclo, estados de um ciclo completo)
+    """
+    visitados = {}
+    sequencia = []
+    estado = estado_inicial
+    while estado not in visitados:
+        visitados[estado] = len(sequencia)
+        sequencia.append(estado)
+        estado = int(_PROXIMO_6X1[estado])
+    inicio_ciclo = visitados[estado]
+    return np.array(sequencia[:inicio_ciclo], dtype=np.int16), np.array(sequencia[inicio_ciclo:], dtype=np.int16)
+
+def _percorrer_6x1(estado_inicial: int, total_dias: int) -> Tuple[np.ndarray, int, int]:
+    """
+    Percorre total_dias a partir do estado inicial saltando ciclos inteiros.
+    
+    Returns:
+        Tupla (estados de cada dia, domingos de folga no período, estado após o último dia)
+    """
+    prefixo, ciclo = _ciclo_6x1(estado_inicial)
+    if total_dias <= len(prefixo):
+        estados = prefixo[:total_dias]
+        return estados, int(_FOLGA_DOMINGO_6X1[estados].sum()), int(_PROXIMO_6X1[estados[-1]])
+    
+    ciclos_completos, resto = divmod(total_dias - len(prefixo), len(ciclo))
+    domingos_folgados = (
+        int(_FOLGA_DOMINGO_6X1[prefixo].sum())
+        + ciclos_completos * int(_FOLGA_DOMINGO_6X1[ciclo].sum())
+        + int(_FOLGA_DOMINGO_6X1[ciclo[:resto]].sum())
+    )
+    estados = np.concatenate([prefixo, np.tile(ciclo, ciclos_completos), ciclo[:resto]])
+    return estados, domingos_folgados, int(_PROXIMO_6X1[estados[-1]])
+
+def _estado_final_6x1(estado_inicial: int, total_dias: int) -> int:
+    """Estado após total_dias a partir do estado inicial, sem montar a sequência de estados."""
+    prefixo, ciclo = _ciclo_6x1(estado_inicial)
+    if total_dias <= len(prefixo):
+        ultimo = prefixo[total_dias - 1]
+    else:
+        ultimo = ciclo[(total_dias - len(prefixo) - 1) % len(ciclo)]
+    return int(_PROXIMO_6X1[ultimo])
+
+def _congelar(resultado: Any) -> Any:
+    """Torna imutável um resultado de escala (dicts, arrays, listas e tuplas)."""
+    if isinstance(resultado, dict):
+        return MappingProxyType(resultado)
+    if isinstance(resultado, np.ndarray):
+        resultado.flags.writeable = False
+        return resultado
+    if isinstance(resultado, (list, tuple)):
+        return tuple(_congelar(item) for item in resultado)
+    return resultado
+
+class CacheEscalas:
+    """Cache LRU de escalas base, compartilhado entre instâncias de RegrasCLT."""
+    
+    def __init__(self, tamanho_maximo: int = 1024):
+        """
+        Inicializa o cache.
+        
+        Args:
+            tamanho_maximo: Quantidade máxima de escalas mantidas (0 desativa o cache)
+        """
+        self.tamanho_maximo = tamanho_maximo
+        self.acertos = 0
+        self.falhas = 0
+        self._itens = OrderedDict()
+        self._trava = threading.Lock()
+    
+    def obter(self, chave: tuple, gerar) -> Any:
+        """
+        Retorna a escala da chave, gerando-a (e congelando-a) apenas em caso de falha.
+        
+        Args:
+            chave: Chave da escala
+            gerar: Função sem argumentos que gera a escala
+            
+        Returns:
+            Escala imutável; acertos devolvem o mesmo objeto, sem cópia
+        """
+        with self._trava:
+            if chave in self._itens:
+                self._itens.move_to_end(chave)
+                self.acertos += 1
+                return self._itens[chave]
+            self.falhas += 1
+        
+        resultado = _congelar(gerar())
+        if self.tamanho_maximo <= 0:
+            return resultado
+        
+        with self._trava:
+            self._itens[chave] = resultado
+            self._itens.move_to_end(chave)
+            while len(self._itens) > self.tamanho_maximo:
+                self._itens.popitem(last=False)
+        return resultado
+    
+    def limpar(self):
+        """Remove todas as escalas e zera os contadores."""
+        with self._trava:
+            self._itens.clear()
+            self.acertos = 0
+            self.falhas = 0
+    
+    def estatisticas(self) -> Dict[str, Any]:
+        """
+        Retorna os contadores do cache.
+        
+        Returns:
+            Dict com acertos, falhas, itens, tamanho máximo e taxa de acerto (%)
+        """
+        consultas = self.acertos + self.falhas
+        return {
+            'acertos': self.acertos,
+            'falhas': self.falhas,
+            'itens': len(self._itens),
+            'tamanho_maximo': self.tamanho_maximo,
+            'taxa_acerto': round(self.acertos / consultas * 100, 1) if consultas else 0.0
+        }
 
 class RegrasCLT:
     """Classe que implementa as regras da CLT para diferentes tipos de escala."""
     
-    def __init__(self):
-        """Inicializa as regras CLT."""
-        self.tipos_escala = {
-            # Escalas 44H
-            'M44': self._regra_44h_manha,
-            'T44': self._regra_44h_tarde,
-            'N44': self._regra_44h_noite,
-            # Escalas 40H
-            'M40': self._regra_40h_manha,
-            'T40': self._regra_40h_tarde,
-            'N40': self._regra_40h_noite,
-            # Escalas 6X1
-            'M6X1': self._regra_6x1_manha,
-            'T6X1': self._regra_6x1_tarde,
-            'N6X1': self._regra_6x1_noite,
-            # Plantões
-            'P_D': self._regra_plantao_par_dia,
-            'P_N': self._regra_plantao_par_noite,
-            'I_D': self._regra_plantao_impar_dia,
-            'I_N': self._regra_plantao_impar_noite
-        }
+    # Cache compartilhado: sobrevive à recriação do gerador a cada execução do Streamlit
+    cache_escalas = CacheEscalas()
+    
+    def __init__(self, cache: CacheEscalas = None):
+        """
+        Inicializa as regras CLT.
+        
+        Args:
+            cache: Cache de escalas base (padrão: cache compartilhado da classe)
+        """
+        if cache is not None:
+            self.cache_escalas = cache
+        
+        # Padrões declarativos de todos os tipos de escala
+        self.padroes: Dict[str, PadraoEscala] = PADROES_ESCALA
+        
+        # Regra dia a dia de cada tipo: o padrão compilado do registro é a única fonte
+        self.tipos_escala = {codigo: partial(self._regra_padrao, codigo) for codigo in self.padroes}
     
     def gerar_escala_base(self, tipo_escala: str, data_inicio: date, data_fim: date, 
                          feriados: List[date], ultimo_plantao_mes_anterior: date = None,
@@ -45,240 +232,231 @@ class RegrasCLT:
             tipo_escala: Tipo de escala (M44, T44, N44, etc.)
             data_inicio: Data de início do período
             data_fim: Data de fim do período
-            feriados: Lista de feriados do período
+            feriados: Feriados do período (lista, conjunto ou CalendarioFeriados)
             ultimo_plantao_mes_anterior: Último plantão do mês anterior (para plantões)
             ultimo_domingo_folga: Último domingo de folga (para escalas 6x1)
             
         Returns:
-            Dict com data como chave e status como valor
+            Dict (somente leitura) com data como chave e status como valor
         """
         if tipo_escala not in self.tipos_escala:
             raise ValueError(f"Tipo de escala '{tipo_escala}' não suportado")
         
-        if tipo_escala.startswith('P_') or tipo_escala.startswith('I_'):
-            return self.tipos_escala[tipo_escala](data_inicio, data_fim, feriados, ultimo_plantao_mes_anterior)
-        elif tipo_escala.startswith('M6X1') or tipo_escala.startswith('T6X1') or tipo_escala.startswith('N6X1'):
-            return self.tipos_escala[tipo_escala](data_inicio, data_fim, feriados, ultimo_domingo_folga)
-        else:
-            return self.tipos_escala[tipo_escala](data_inicio, data_fim, feriados)
+        # Consulta de feriados em O(1) nas regras dia a dia
+        feriados = self._conjunto_feriados(feriados)
+        
+        chave = self._chave_cache('base', tipo_escala, data_inicio, data_fim, feriados,
+                                  ultimo_plantao_mes_anterior, ultimo_domingo_folga)
+        return self.cache_escalas.obter(chave, lambda: self._gerar_escala_base_regra(
+            tipo_escala, data_inicio, data_fim, feriados, ultimo_plantao_mes_anterior, ultimo_domingo_folga
+        ))
     
-    def _regra_44h_manha(self, data_inicio: date, data_fim: date, feriados: List[date]) -> Dict[date, str]:
-        """
-        Regra para escala 44H - Manhã: Segunda a sexta, 8h/dia, turno manhã.
-        Não trabalha em feriados nem fins de semana.
+    def _gerar_escala_base_regra(self, tipo_escala: str, data_inicio: date, data_fim: date,
+                                 feriados: frozenset, ultimo_plantao_mes_anterior: date = None,
+                                 ultimo_domingo_folga: date = None) -> Dict[date, str]:
+        """Executa a regra do tipo de escala, sem passar pelo cache."""
+        return self.tipos_escala[tipo_escala](data_inicio, data_fim, feriados,
+                                              ultimo_plantao_mes_anterior, ultimo_domingo_folga)
+    
+    def _conjunto_feriados(self, feriados) -> frozenset:
+        """Converte os feriados recebidos em conjunto imutável (consulta O(1) e chave de cache)."""
+        if isinstance(feriados, frozenset):
+            return feriados
+        if isinstance(feriados, CalendarioFeriados):
+            return feriados.datas()
+        return frozenset(feriados or [])
+    
+    def _chave_cache(self, modo: str, tipo_escala: str, data_inicio: date, data_fim: date,
+                     feriados: frozenset, ultimo_plantao_mes_anterior: date = None,
+                     ultimo_domingo_folga: date = None, estado_6x1: Tuple[int, int] = None) -> tuple:
         """
-        escala = {}
-        data_atual = data_inicio
-        
-        while data_atual <= data_fim:
-            # Verificar se é fim de semana
-            if data_atual.weekday() >= 5:  # Sábado (5) ou Domingo (6)
-                escala[data_atual] = "FOLGA"
-            # Verificar se é feriado
-            elif data_atual in feriados:
-                escala[data_atual] = "FERIADO"
-            # Dias úteis (segunda a sexta)
-            else:
-                escala[data_atual] = "TRABALHO_MANHA"
-            
-            data_atual += timedelta(days=1)
+        Monta a chave do cache de escalas base.
         
-        return escala
-    
-    def _regra_44h_tarde(self, data_inicio: date, data_fim: date, feriados: List[date]) -> Dict[date, str]:
+        Âncoras que não influenciam o tipo de escala são descartadas, para que
+        colaboradores equivalentes compartilhem a mesma entrada.
         """
-        Regra para escala 44H - Tarde: Segunda a sexta, 8h/dia, turno tarde.
-        Não trabalha em feriados nem fins de semana.
+        padrao = self.padroes[tipo_escala]
+        if not padrao.usa_ultimo_plantao:
+            ultimo_plantao_mes_anterior = None
+        if not padrao.usa_ultimo_domingo:
+            ultimo_domingo_folga = None
+            estado_6x1 = None
+        if modo == 'vetorizada' and (padrao.usa_ultimo_domingo or padrao.feriado == 'trabalha'):
+            # Padrões que ignoram feriados: a mesma entrada serve a unidades com feriados diferentes
+            feriados = None
+        return (modo, tipo_escala, data_inicio, data_fim, feriados,
+                ultimo_plantao_mes_anterior, ultimo_domingo_folga, estado_6x1)
+    
+    def cache_info(self) -> Dict[str, Any]:
+        """Retorna os contadores de acertos e falhas do cache de escalas base."""
+        return self.cache_escalas.estatisticas()
+    
+    def montar_periodo(self, data_inicio: date, data_fim: date, feriados: List[date]) -> Calendario:
         """
-        escala = {}
-        data_atual = data_inicio
+        Monta a tabela de calendário do período para o modo vetorizado.
         
-        while data_atual <= data_fim:
-            # Verificar se é fim de semana
-            if data_atual.weekday() >= 5:  # Sábado (5) ou Domingo (6)
-                escala[data_atual] = "FOLGA"
-            # Verificar se é feriado
-            elif data_atual in feriados:
-                escala[data_atual] = "FERIADO"
-            # Dias úteis (segunda a sexta)
-            else:
-                escala[data_atual] = "TRABALHO_TARDE"
+        Args:
+            data_inicio: Data de início do período
+            data_fim: Data de fim do período
+            feriados: Lista de feriados do período
             
-            data_atual += timedelta(days=1)
-        
-        return escala
-    
-    def _regra_44h_noite(self, data_inicio: date, data_fim: date, feriados: List[date]) -> Dict[date, str]:
+        Returns:
+            Calendario com as colunas por dia do período
         """
-        Regra para escala 44H - Noite: Segunda a sexta, 8h/dia, turno noite.
-        Não trabalha em feriados nem fins de semana.
+        return Calendario(data_inicio, data_fim, feriados)
+    
+    def gerar_escala_vetorizada(self, tipo_escala: str, data_inicio: date, data_fim: date,
+                                feriados: List[date], ultimo_plantao_mes_anterior: date = None,
+                                ultimo_domingo_folga: date = None,
+                                calendario: Calendario = None,
+                                estado_6x1: Tuple[int, int] = None) -> Tuple[np.ndarray, Dict[str, Any]]:
         """
-        escala = {}
-        data_atual = data_inicio
+        Gera a escala base de uma só vez, como array de status alinhado ao período.
         
-        while data_atual <= data_fim:
-            # Verificar se é fim de semana
-            if data_atual.weekday() >= 5:  # Sábado (5) ou Domingo (6)
-                escala[data_atual] = "FOLGA"
-            # Verificar se é feriado
-            elif data_atual in feriados:
-                escala[data_atual] = "FERIADO"
-            # Dias úteis (segunda a sexta)
-            else:
-                escala[data_atual] = "TRABALHO_NOITE"
+        Equivale a gerar_escala_base, mas sem percorrer o período dia a dia.
+        
+        Args:
+            tipo_escala: Tipo de escala (M44, T44, N44, etc.)
+            data_inicio: Data de início do período
+            data_fim: Data de fim do período
+            feriados: Lista de feriados do período
+            ultimo_plantao_mes_anterior: Último plantão do mês anterior (para plantões)
+            ultimo_domingo_folga: Último domingo de folga (para escalas 6x1)
+            calendario: Calendário já montado para o período (opcional)
+            estado_6x1: Contadores 6x1 transportados do período anterior, (dias trabalhados em
+                sequência, semanas sem domingo) (opcional; escalas 6x1)
             
-            data_atual += timedelta(days=1)
+        Returns:
+            Tupla (array uint8 de códigos de status, somente leitura, na ordem de calendario.datas,
+            info de controle 6x1)
+        """
+        if tipo_escala not in self.tipos_escala:
+            raise ValueError(f"Tipo de escala '{tipo_escala}' não suportado")
         
-        return escala
+        if calendario is None:
+            calendario = self.montar_periodo(data_inicio, data_fim, feriados)
+        
+        chave = self._chave_cache('vetorizada', tipo_escala, calendario.data_inicio, calendario.data_fim,
+                                  calendario.feriados, ultimo_plantao_mes_anterior, ultimo_domingo_folga, estado_6x1)
+        return self.cache_escalas.obter(chave, lambda: self._gerar_escala_kernel(
+            tipo_escala, calendario, ultimo_plantao_mes_anterior, ultimo_domingo_folga, estado_6x1
+        ))
     
-    def _regra_40h_manha(self, data_inicio: date, data_fim: date, feriados: List[date]) -> Dict[date, str]:
-        """
-        Regra para escala 40H - Manhã: Segunda a sexta, 8h/dia, turno manhã.
-        Não trabalha em feriados nem fins de semana.
+    def _gerar_escala_kernel(self, tipo_escala: str, calendario: Calendario, ultimo_plantao_mes_anterior: date = None,
+                             ultimo_domingo_folga: date = None,
+                             estado_6x1: Tuple[int, int] = None) -> Tuple[np.ndarray, Dict[str, Any]]:
+        """Executa o padrão compilado do tipo de escala, sem passar pelo cache."""
+        padrao = self.padroes[tipo_escala]
+        if padrao.ancora == 'domingo':
+            # Escalas 6x1: motor de ciclos
+            dias_trabalhados, semanas_sem_domingo = estado_6x1 or (0, None)
+            return self.gerar_6x1_vetorizado(calendario, padrao.status_trabalho, ultimo_domingo_folga,
+                                             dias_trabalhados, semanas_sem_domingo)
+        
+        # Na paridade dos plantões o último plantão não entra: a alternância é feita em gerar_plantao_vetorizado
+        ancora = ultimo_plantao_mes_anterior if padrao.usa_ultimo_plantao else None
+        return padrao.gerar(calendario, ancora), {}
+    
+    def _regra_padrao(self, tipo_escala: str, data_inicio: date, data_fim: date, feriados: List[date],
+                      ultimo_plantao_mes_anterior: date = None, ultimo_domingo_folga: date = None):
         """
-        escala = {}
-        data_atual = data_inicio
-        
-        while data_atual <= data_fim:
-            # Verificar se é fim de semana
-            if data_atual.weekday() >= 5:  # Sábado (5) ou Domingo (6)
-                escala[data_atual] = "FOLGA"
-            # Verificar se é feriado
-            elif data_atual in feriados:
-                escala[data_atual] = "FERIADO"
-            # Dias úteis (segunda a sexta)
-            else:
-                escala[data_atual] = "TRABALHO_MANHA"
-            
-            data_atual += timedelta(days=1)
+        Regra dia a dia de um tipo de escala, a partir do padrão compilado do registro.
         
+        Returns:
+            Dict com data como chave e status como valor; nas escalas 6x1, tupla
+            (dict, info de controle 6x1)
+        """
+        calendario = Calendario(data_inicio, data_fim, feriados)
+        status, info_controle = self._gerar_escala_kernel(tipo_escala, calendario, ultimo_plantao_mes_anterior,
+                                                          ultimo_domingo_folga)
+        escala = dict(zip(calendario.datas_python, decodificar_status(status).tolist()))
+        if self.padroes[tipo_escala].usa_ultimo_domingo:
+            return escala, info_controle
         return escala
     
-    def _regra_40h_tarde(self, data_inicio: date, data_fim: date, feriados: List[date]) -> Dict[date, str]:
-        """
-        Regra para escala 40H - Tarde: Segunda a sexta, 8h/dia, turno tarde.
-        Não trabalha em feriados nem fins de semana.
+    def gerar_plantao_vetorizado(self, tipo_inicial: str, calendario: Calendario) -> Tuple[np.ndarray, List[str], List[Tuple[int, str, str]]]:
         """
-        escala = {}
-        data_atual = data_inicio
+        Gera a escala de plantão de todo o período em forma fechada.
         
-        while data_atual <= data_fim:
-            # Verificar se é fim de semana
-            if data_atual.weekday() >= 5:  # Sábado (5) ou Domingo (6)
-                escala[data_atual] = "FOLGA"
-            # Verificar se é feriado
-            elif data_atual in feriados:
-                escala[data_atual] = "FERIADO"
-            # Dias úteis (segunda a sexta)
-            else:
-                escala[data_atual] = "TRABALHO_TARDE"
+        O status de cada dia depende apenas do tipo inicial e da quantidade de
+        meses com 31 dias já atravessados (coluna viradas_31 do calendário):
+        cada virada inverte a paridade (P_ ↔ I_), mantendo o turno.
+        
+        Args:
+            tipo_inicial: Tipo de plantão no primeiro dia do período (P_D, P_N, I_D, I_N)
+            calendario: Calendário do período
             
-            data_atual += timedelta(days=1)
+        Returns:
+            Tupla (array uint8 de códigos de status, tipos utilizados em ordem, mudanças de tipo),
+            onde cada mudança é (índice do primeiro dia do novo tipo, tipo anterior, tipo novo)
+        """
+        if tipo_inicial not in self.padroes or self.padroes[tipo_inicial].ancora != 'paridade_mes':
+            raise ValueError(f"Tipo de plantão '{tipo_inicial}' não suportado")
         
-        return escala
+        chave = ('plantao', tipo_inicial, calendario.data_inicio, calendario.data_fim)
+        return self.cache_escalas.obter(chave, lambda: self._gerar_plantao_kernel(tipo_inicial, calendario))
     
-    def _regra_40h_noite(self, data_inicio: date, data_fim: date, feriados: List[date]) -> Dict[date, str]:
-        """
-        Regra para escala 40H - Noite: Segunda a sexta, 8h/dia, turno noite.
-        Não trabalha em feriados nem fins de semana.
+    def _gerar_plantao_kernel(self, tipo_inicial: str, calendario: Calendario) -> Tuple[np.ndarray, List[str], List[Tuple[int, str, str]]]:
+        """Calcula a escala de plantão em forma fechada, sem passar pelo cache."""
+        padrao = self.padroes[tipo_inicial]
+        # Cada virada de mês com 31 dias rotaciona o ciclo (inverte a paridade)
+        status = padrao.gerar(calendario, posicoes=(calendario.paridade + calendario.viradas_31) % 2)
+        
+        # Tipos vigentes: um por virada de mês com 31 dias
+        indices_mudanca = np.flatnonzero(np.diff(calendario.viradas_31)) + 1
+        tipos_utilizados = [tipo_inicial]
+        mudancas = []
+        for indice in indices_mudanca.tolist():
+            rotacao = int(calendario.viradas_31[indice]) % 2
+            ciclo = padrao.ciclo[rotacao:] + padrao.ciclo[:rotacao]
+            tipo_novo = padrao_por_ciclo(padrao.status_trabalho, ciclo, padrao.ancora).codigo
+            mudancas.append((indice, tipos_utilizados[-1], tipo_novo))
+            tipos_utilizados.append(tipo_novo)
+        
+        return status, tipos_utilizados, mudancas
+    
+    def gerar_plantoes_lote(self, tipos_iniciais: List[str], calendario: Calendario) -> np.ndarray:
         """
-        escala = {}
-        data_atual = data_inicio
+        Gera de uma só vez a escala de vários plantonistas.
         
-        while data_atual <= data_fim:
-            # Verificar se é fim de semana
-            if data_atual.weekday() >= 5:  # Sábado (5) ou Domingo (6)
-                escala[data_atual] = "FOLGA"
-            # Verificar se é feriado
-            elif data_atual in feriados:
-                escala[data_atual] = "FERIADO"
-            # Dias úteis (segunda a sexta)
-            else:
-                escala[data_atual] = "TRABALHO_NOITE"
+        Args:
+            tipos_iniciais: Tipo de plantão inicial de cada plantonista
+            calendario: Calendário do período
             
-            data_atual += timedelta(days=1)
+        Returns:
+            Matriz uint8 de códigos de status (plantonistas × dias)
+        """
+        if len(tipos_iniciais) == 0:
+            return np.empty((0, len(calendario)), dtype=np.uint8)
         
-        return escala
+        # Cada plantonista é uma das poucas linhas distintas (uma por tipo inicial)
+        tipos_distintos, posicoes = np.unique(np.asarray(tipos_iniciais, dtype=object), return_inverse=True)
+        linhas = np.stack([self.gerar_plantao_vetorizado(tipo, calendario)[0] for tipo in tipos_distintos])
+        return linhas[posicoes]
     
-    def _regra_6x1_manha(self, data_inicio: date, data_fim: date, feriados: List[date], ultimo_domingo_folga: date = None) -> Tuple[Dict[date, str], Dict[str, Any]]:
-        """
-        Regra para escala 6X1 - Manhã: Trabalha 6 dias e folga 1, turno manhã.
-        Deve folgar pelo menos um domingo a cada 7 semanas.
+    def gerar_6x1_vetorizado(self, calendario: Calendario, status_trabalho: str,
+                             ultimo_domingo_folga: date = None, dias_trabalhados: int = 0,
+                             semanas_sem_domingo: int = None) -> Tuple[np.ndarray, Dict[str, Any]]:
         """
-        escala = {}
-        data_atual = data_inicio
-        dias_trabalhados = 0
-        domingos_folgados = 0
-        semanas_sem_domingo = 0
-        ultimo_domingo_folga_local = ultimo_domingo_folga
+        Gera a escala 6x1 do período pela tabela de transições, sem laço por dia.
         
-        # Calcular semanas sem domingo baseado no último domingo informado
-        if ultimo_domingo_folga:
-            # Calcular quantas semanas se passaram desde o último domingo
-            dias_desde_ultimo_domingo = (data_inicio - ultimo_domingo_folga).days
-            semanas_sem_domingo = max(0, dias_desde_ultimo_domingo // 7)
+        A sequência de estados (dias trabalhados, semanas sem domingo, dia da semana)
+        é periódica; o período é montado como prefixo + repetições do ciclo, e os
+        contadores de controle saltam ciclos inteiros.
         
-        info_controle = {
-            'ultimo_domingo_folga': ultimo_domingo_folga,
-            'domingos_folgados': 0,
-            'semanas_sem_domingo': semanas_sem_domingo
-        }
-        
-        while data_atual <= data_fim:
-            # Verificar se é domingo
-            if data_atual.weekday() == 6:  # Domingo
-                # Regra: 1 domingo de folga a cada 7 semanas, no mínimo
-                if semanas_sem_domingo >= 6:  # Força folga no domingo
-                    escala[data_atual] = "FOLGA"
-                    domingos_folgados += 1
-                    ultimo_domingo_folga_local = data_atual
-                    semanas_sem_domingo = 0
-                else:
-                    # Verificar se já trabalhou 6 dias seguidos
-                    if dias_trabalhados >= 6:
-                        escala[data_atual] = "FOLGA"
-                        domingos_folgados += 1
-                        ultimo_domingo_folga_local = data_atual
-                        dias_trabalhados = 0
-                        semanas_sem_domingo = 0
-                    else:
-                        escala[data_atual] = "TRABALHO_MANHA"
-                        dias_trabalhados += 1
-                        semanas_sem_domingo += 1
-            else:
-                # Regra 6x1: 6 dias trabalho, 1 dia folga
-                if dias_trabalhados < 6:
-                    escala[data_atual] = "TRABALHO_MANHA"
-                    dias_trabalhados += 1
-                else:
-                    escala[data_atual] = "FOLGA"
-                    dias_trabalhados = 0
+        Args:
+            calendario: Calendário do período
+            status_trabalho: Status dos dias de trabalho (TRABALHO_MANHA, etc.)
+            ultimo_domingo_folga: Último domingo de folga antes do período
+            dias_trabalhados: Dias trabalhados em sequência antes do período
+            semanas_sem_domingo: Semanas sem folga no domingo antes do período
+                (None calcula a partir de ultimo_domingo_folga)
             
-            data_atual += timedelta(days=1)
-        
-        info_controle['ultimo_domingo_folga'] = ultimo_domingo_folga_local
-        info_controle['domingos_folgados'] = domingos_folgados
-        info_controle['semanas_sem_domingo'] = semanas_sem_domingo
-        
-        return escala, info_controle
-    
-    def _regra_6x1_tarde(self, data_inicio: date, data_fim: date, feriados: List[date], ultimo_domingo_folga: date = None) -> Tuple[Dict[date, str], Dict[str, Any]]:
-        """
-        Regra para escala 6X1 - Tarde: Trabalha 6 dias e folga 1, turno tarde.
-        Deve folgar pelo menos um domingo a cada 7 semanas.
+        Returns:
+            Tupla (array uint8 de códigos de status, info de controle 6x1)
         """
-        escala = {}
-        data_atual = data_inicio
-        dias_trabalhados = 0
-        domingos_folgados = 0
-        semanas_sem_domingo = 0
-        ultimo_domingo_folga_local = ultimo_domingo_folga
-        
-        # Calcular semanas sem domingo baseado no último domingo informado
-        if ultimo_domingo_folga:
-            # Calcular quantas semanas se passaram desde o último domingo
-            dias_desde_ultimo_domingo = (data_inicio - ultimo_domingo_folga).days
-            semanas_sem_domingo = max(0, dias_desde_ultimo_domingo // 7)
+        if semanas_sem_domingo is None:
+            semanas_sem_domingo = self._semanas_sem_domingo(calendario, ultimo_domingo_folga)
         
         info_controle = {
             'ultimo_domingo_folga': ultimo_domingo_folga,
@@ -286,149 +464,125 @@ class RegrasCLT:
             'semanas_sem_domingo': semanas_sem_domingo
         }
         
-        while data_atual <= data_fim:
-            # Verificar se é domingo
-            if data_atual.weekday() == 6:  # Domingo
-                # Regra: 1 domingo de folga a cada 7 semanas, no mínimo
-                if semanas_sem_domingo >= 6:  # Força folga no domingo
-                    escala[data_atual] = "FOLGA"
-                    domingos_folgados += 1
-                    ultimo_domingo_folga_local = data_atual
-                    semanas_sem_domingo = 0
-                else:
-                    # Verificar se já trabalhou 6 dias seguidos
-                    if dias_trabalhados >= 6:
-                        escala[data_atual] = "FOLGA"
-                        domingos_folgados += 1
-                        ultimo_domingo_folga_local = data_atual
-                        dias_trabalhados = 0
-                        semanas_sem_domingo = 0
-                    else:
-                        escala[data_atual] = "TRABALHO_TARDE"
-                        dias_trabalhados += 1
-                        semanas_sem_domingo += 1
-            else:
-                # Regra 6x1: 6 dias trabalho, 1 dia folga
-                if dias_trabalhados < 6:
-                    escala[data_atual] = "TRABALHO_TARDE"
-                    dias_trabalhados += 1
-                else:
-                    escala[data_atual] = "FOLGA"
-                    dias_trabalhados = 0
-            
-            data_atual += timedelta(days=1)
+        total_dias = len(calendario)
+        if total_dias == 0:
+            return np.array([], dtype=np.uint8), info_controle
+        
+        estado_inicial = _estado_6x1(dias_trabalhados, semanas_sem_domingo, int(calendario.dia_semana[0]))
+        estados, domingos_folgados, estado_final = _percorrer_6x1(estado_inicial, total_dias)
+        
+        status = np.where(_TRABALHA_6X1[estados], CODIGOS_STATUS[status_trabalho], StatusEscala.FOLGA).astype(np.uint8)
         
-        info_controle['ultimo_domingo_folga'] = ultimo_domingo_folga_local
+        if domingos_folgados:
+            indice_domingo = np.flatnonzero(_FOLGA_DOMINGO_6X1[estados])[-1]
+            info_controle['ultimo_domingo_folga'] = calendario.datas_python[indice_domingo]
         info_controle['domingos_folgados'] = domingos_folgados
-        info_controle['semanas_sem_domingo'] = semanas_sem_domingo
+        if (calendario.dia_semana == 6).any():
+            info_controle['semanas_sem_domingo'] = _decodificar_estado_6x1(estado_final)[1]
         
-        return escala, info_controle
+        return status, info_controle
     
-    def _regra_6x1_noite(self, data_inicio: date, data_fim: date, feriados: List[date], ultimo_domingo_folga: date = None) -> Tuple[Dict[date, str], Dict[str, Any]]:
-        """
-        Regra para escala 6X1 - Noite: Trabalha 6 dias e folga 1, turno noite.
-        Deve folgar pelo menos um domingo a cada 7 semanas.
+    def _semanas_sem_domingo(self, calendario: Calendario, ultimo_domingo_folga: date = None) -> int:
+        """Semanas sem folga no domingo no início do período, a partir do último domingo de folga."""
+        if not ultimo_domingo_folga:
+            return 0
+        # Calcular quantas semanas se passaram desde o último domingo
+        dias_desde_ultimo_domingo = (calendario.data_inicio - ultimo_domingo_folga).days
+        return max(0, dias_desde_ultimo_domingo // 7)
+    
+    def estado_final_6x1(self, calendario: Calendario, ultimo_domingo_folga: date = None,
+                         dias_trabalhados: int = 0, semanas_sem_domingo: int = None) -> Tuple[int, int]:
         """
-        escala = {}
-        data_atual = data_inicio
-        dias_trabalhados = 0
-        domingos_folgados = 0
-        semanas_sem_domingo = 0
-        ultimo_domingo_folga_local = ultimo_domingo_folga
-        
-        # Calcular semanas sem domingo baseado no último domingo informado
-        if ultimo_domingo_folga:
-            # Calcular quantas semanas se passaram desde o último domingo
-            dias_desde_ultimo_domingo = (data_inicio - ultimo_domingo_folga).days
-            semanas_sem_domingo = max(0, dias_desde_ultimo_domingo // 7)
+        Calcula os contadores 6x1 ao fim do período, para iniciar o período seguinte.
         
-        info_controle = {
-            'ultimo_domingo_folga': ultimo_domingo_folga,
-            'domingos_folgados': 0,
-            'semanas_sem_domingo': semanas_sem_domingo
-        }
-        
-        while data_atual <= data_fim:
-            # Verificar se é domingo
-            if data_atual.weekday() == 6:  # Domingo
-                # Regra: 1 domingo de folga a cada 7 semanas, no mínimo
-                if semanas_sem_domingo >= 6:  # Força folga no domingo
-                    escala[data_atual] = "FOLGA"
-                    domingos_folgados += 1
-                    ultimo_domingo_folga_local = data_atual
-                    semanas_sem_domingo = 0
-                else:
-                    # Verificar se já trabalhou 6 dias seguidos
-                    if dias_trabalhados >= 6:
-                        escala[data_atual] = "FOLGA"
-                        domingos_folgados += 1
-                        ultimo_domingo_folga_local = data_atual
-                        dias_trabalhados = 0
-                        semanas_sem_domingo = 0
-                    else:
-                        escala[data_atual] = "TRABALHO_NOITE"
-                        dias_trabalhados += 1
-                        semanas_sem_domingo += 1
-            else:
-                # Regra 6x1: 6 dias trabalho, 1 dia folga
-                if dias_trabalhados < 6:
-                    escala[data_atual] = "TRABALHO_NOITE"
-                    dias_trabalhados += 1
-                else:
-                    escala[data_atual] = "FOLGA"
-                    dias_trabalhados = 0
+        Args:
+            calendario: Calendário do período
+            ultimo_domingo_folga: Último domingo de folga antes do período
+            dias_trabalhados: Dias trabalhados em sequência antes do período
+            semanas_sem_domingo: Semanas sem folga no domingo antes do período
+                (None calcula a partir de ultimo_domingo_folga)
             
-            data_atual += timedelta(days=1)
+        Returns:
+            Tupla (dias trabalhados em sequência, semanas sem domingo) após o último dia
+        """
+        if semanas_sem_domingo is None:
+            semanas_sem_domingo = self._semanas_sem_domingo(calendario, ultimo_domingo_folga)
+        if len(calendario) == 0:
+            return dias_trabalhados, semanas_sem_domingo
+        
+        estado_inicial = _estado_6x1(dias_trabalhados, semanas_sem_domingo, int(calendario.dia_semana[0]))
+        dias_finais, semanas_finais, _ = _decodificar_estado_6x1(_estado_final_6x1(estado_inicial, len(calendario)))
+        return dias_finais, semanas_finais
+    
+    def gerar_6x1_lote(self, calendario: Calendario, status_trabalho: List[str],
+                       ultimos_domingos_folga: List[date] = None,
+                       dias_trabalhados: np.ndarray = None) -> Tuple[np.ndarray, Dict[str, np.ndarray]]:
+        """
+        Gera de uma só vez a escala de vários colaboradores 6x1.
         
-        info_controle['ultimo_domingo_folga'] = ultimo_domingo_folga_local
-        info_controle['domingos_folgados'] = domingos_folgados
-        info_controle['semanas_sem_domingo'] = semanas_sem_domingo
+        Os contadores iniciais de todos os colaboradores são tratados como arrays;
+        cada estado inicial distinto é percorrido uma única vez.
         
-        return escala, info_controle
-    
-    def _regra_plantao_par_dia(self, data_inicio: date, data_fim: date, feriados: List[date], ultimo_plantao_mes_anterior: date = None, status_ultimo_dia_anterior: str = None) -> Dict[date, str]:
-        escala = {}
-        data_atual = data_inicio
-        while data_atual <= data_fim:
-            if data_atual.day % 2 == 0:
-                escala[data_atual] = "TRABALHO_DIA"
-            else:
-                escala[data_atual] = "FOLGA"
-            data_atual += timedelta(days=1)
-        return escala
-
-    def _regra_plantao_par_noite(self, data_inicio: date, data_fim: date, feriados: List[date], ultimo_plantao_mes_anterior: date = None, status_ultimo_dia_anterior: str = None) -> Dict[date, str]:
-        escala = {}
-        data_atual = data_inicio
-        while data_atual <= data_fim:
-            if data_atual.day % 2 == 0:
-                escala[data_atual] = "TRABALHO_NOITE"
-            else:
-                escala[data_atual] = "FOLGA"
-            data_atual += timedelta(days=1)
-        return escala
-
-    def _regra_plantao_impar_dia(self, data_inicio: date, data_fim: date, feriados: List[date], ultimo_plantao_mes_anterior: date = None, status_ultimo_dia_anterior: str = None) -> Dict[date, str]:
-        escala = {}
-        data_atual = data_inicio
-        while data_atual <= data_fim:
-            if data_atual.day % 2 == 1:
-                escala[data_atual] = "TRABALHO_DIA"
-            else:
-                escala[data_atual] = "FOLGA"
-            data_atual += timedelta(days=1)
-        return escala
-
-    def _regra_plantao_impar_noite(self, data_inicio: date, data_fim: date, feriados: List[date], ultimo_plantao_mes_anterior: date = None, status_ultimo_dia_anterior: str = None) -> Dict[date, str]:
-        escala = {}
-        data_atual = data_inicio
-        while data_atual <= data_fim:
-            if data_atual.day % 2 == 1:
-                escala[data_atual] = "TRABALHO_NOITE"
-            else:
-                escala[data_atual] = "FOLGA"
-            data_atual += timedelta(days=1)
-        return escala
+        Args:
+            calendario: Calendário do período
+            status_trabalho: Status de trabalho de cada colaborador
+            ultimos_domingos_folga: Último domingo de folga de cada colaborador (opcional)
+            dias_trabalhados: Dias trabalhados em sequência de cada colaborador (opcional)
+            
+        Returns:
+            Tupla (matriz uint8 de códigos de status colaboradores × dias, dict com os arrays de controle
+            'ultimo_domingo_folga', 'domingos_folgados' e 'semanas_sem_domingo')
+        """
+        quantidade = len(status_trabalho)
+        total_dias = len(calendario)
+        
+        # Semanas sem domingo calculadas a partir do último domingo de cada colaborador
+        semanas_iniciais = np.zeros(quantidade, dtype=np.int64)
+        ultimos_domingos = np.full(quantidade, None, dtype=object)
+        if ultimos_domingos_folga is not None:
+            ultimos_domingos[:] = ultimos_domingos_folga
+            datas_domingos = np.array(list(ultimos_domingos_folga), dtype='datetime64[D]')
+            informados = ~np.isnat(datas_domingos)
+            dias_desde_domingo = (np.datetime64(calendario.data_inicio, 'D') - datas_domingos[informados]).astype(np.int64)
+            semanas_iniciais[informados] = np.maximum(0, dias_desde_domingo // 7)
+        
+        if dias_trabalhados is None:
+            dias_trabalhados = np.zeros(quantidade, dtype=np.int64)
+        dias_trabalhados = np.asarray(dias_trabalhados, dtype=np.int64)
+        
+        controle = {
+            'ultimo_domingo_folga': ultimos_domingos,
+            'domingos_folgados': np.zeros(quantidade, dtype=np.int64),
+            'semanas_sem_domingo': semanas_iniciais.copy()
+        }
+        if quantidade == 0 or total_dias == 0:
+            return np.empty((quantidade, total_dias), dtype=np.uint8), controle
+        
+        estados_iniciais = (np.minimum(dias_trabalhados, 6) * 7 + np.minimum(semanas_iniciais, 6)) * 7 + int(calendario.dia_semana[0])
+        distintos, posicoes = np.unique(estados_iniciais, return_inverse=True)
+        
+        # Percorrer cada estado inicial distinto uma única vez
+        trabalha = np.empty((len(distintos), total_dias), dtype=bool)
+        domingos_folgados = np.zeros(len(distintos), dtype=np.int64)
+        semanas_finais = np.zeros(len(distintos), dtype=np.int64)
+        indice_ultimo_domingo = np.full(len(distintos), -1, dtype=np.int64)
+        for linha, estado_inicial in enumerate(distintos.tolist()):
+            estados, domingos_folgados[linha], estado_final = _percorrer_6x1(estado_inicial, total_dias)
+            trabalha[linha] = _TRABALHA_6X1[estados]
+            semanas_finais[linha] = _decodificar_estado_6x1(estado_final)[1]
+            if domingos_folgados[linha]:
+                indice_ultimo_domingo[linha] = np.flatnonzero(_FOLGA_DOMINGO_6X1[estados])[-1]
+        
+        matriz = np.where(trabalha[posicoes], codificar_status(status_trabalho)[:, None], StatusEscala.FOLGA).astype(np.uint8)
+        
+        controle['domingos_folgados'] = domingos_folgados[posicoes]
+        if (calendario.dia_semana == 6).any():
+            controle['semanas_sem_domingo'] = semanas_finais[posicoes]
+        folgou_domingo = indice_ultimo_domingo[posicoes] >= 0
+        datas_periodo = np.array(calendario.datas_python, dtype=object)
+        controle['ultimo_domingo_folga'][folgou_domingo] = datas_periodo[indice_ultimo_domingo[posicoes][folgou_domingo]]
+        
+        return matriz, controle
     
     def determinar_tipo_plantao_automatico(self, ultimo_plantao_mes_anterior: date, tipo_anterior: str) -> str:
         """
@@ -480,105 +634,102 @@ class RegrasCLT:
             Dict com escala final após aplicação das exceções
         """
         escala_final = escala_base.copy()
-        
-        # Aplicar atestados
-        if atestados and atestados.strip():
-            datas_atestados = self._parse_datas(atestados)
-            for data_atestado in datas_atestados:
-                if data_atestado in escala_final:
-                    escala_final[data_atestado] = "ATESTADO"
-        
-        # Aplicar férias
-        if ferias and ferias.strip():
-            periodo_ferias = self._parse_periodo_ferias(ferias)
-            for data_ferias in periodo_ferias:
-                if data_ferias in escala_final:
-                    escala_final[data_ferias] = "FÉRIAS"
-        
-        # Aplicar escalas manuais
-        if escalas_manuais and escalas_manuais.strip():
-            datas_manuais = self._parse_datas(escalas_manuais)
-            for data_manual in datas_manuais:
-                if data_manual in escala_final:
-                    escala_final[data_manual] = "ESCALA MANUAL"
+        if not escala_final:
+            return escala_final
+        
+        # Cada intervalo percorre apenas os dias que caem dentro da escala
+        primeiro, ultimo = min(escala_final), max(escala_final)
+        intervalos = self._intervalos_texto(atestados, ferias, escalas_manuais)
+        for tipo, inicio, fim in sorted(intervalos, key=lambda intervalo: intervalo.tipo):
+            data, fim = max(inicio, primeiro), min(fim, ultimo)
+            while data <= fim:
+                if data in escala_final:
+                    escala_final[data] = tipo.status.rotulo
+                data += timedelta(days=1)
         
         return escala_final
     
+    def aplicar_excecoes_vetorizado(self, status: np.ndarray, calendario: Calendario,
+                                    atestados: str, ferias: str, escalas_manuais: str,
+                                    destino: np.ndarray = None) -> np.ndarray:
+        """
+        Aplica as exceções sobre um array de códigos gerado por gerar_escala_vetorizada.
+        
+        Args:
+            status: Array uint8 de códigos de status da escala base
+            calendario: Calendário do período, alinhado ao array de status
+            atestados: String com datas de atestados (separadas por vírgula)
+            ferias: String com período de férias (formato: DD/MM/YYYY-DD/MM/YYYY)
+            escalas_manuais: String com datas de escalas manuais (separadas por vírgula)
+            destino: Array onde a escala final é escrita (opcional; ex.: linha de uma matriz pré-alocada)
+            
+        Returns:
+            Array de códigos de status após aplicação das exceções (destino, se informado)
+        """
+        intervalos = self._intervalos_texto(atestados, ferias, escalas_manuais)
+        return aplicar_intervalos(status, calendario, intervalos, destino)
+    
+    def aplicar_excecoes_normalizadas(self, status: np.ndarray, calendario: Calendario,
+                                      atestados: Sequence[Tuple[date, date]], ferias: Sequence[Tuple[date, date]],
+                                      escalas_manuais: Sequence[Tuple[date, date]],
+                                      destino: np.ndarray = None) -> np.ndarray:
+        """
+        Aplica exceções já convertidas (ver normalizar_colaboradores) sobre um array de códigos.
+        
+        Args:
+            status: Array uint8 de códigos de status da escala base
+            calendario: Calendário do período, alinhado ao array de status
+            atestados: Períodos de atestados (início, fim), inclusivos
+            ferias: Períodos de férias (início, fim), inclusivos
+            escalas_manuais: Períodos de escalas manuais (início, fim), inclusivos
+            destino: Array onde a escala final é escrita (opcional; ex.: linha de uma matriz pré-alocada)
+            
+        Returns:
+            Array de códigos de status após aplicação das exceções (destino, se informado)
+        """
+        intervalos = intervalos_excecoes(atestados, ferias, escalas_manuais)
+        return aplicar_intervalos(status, calendario, intervalos, destino)
+    
+    def _intervalos_texto(self, atestados: str, ferias: str, escalas_manuais: str) -> List[IntervaloExcecao]:
+        """
+        Converte os campos de exceção em texto em intervalos tipados.
+        
+        Args:
+            atestados: String com datas e períodos de atestados (separados por vírgula)
+            ferias: String com períodos de férias (formato: DD/MM/YYYY-DD/MM/YYYY, separados por vírgula)
+            escalas_manuais: String com datas e períodos de escalas manuais (separados por vírgula)
+            
+        Returns:
+            Intervalos de exceção (ver excecoes_escala), em ordem de precedência
+        """
+        return intervalos_excecoes(*(
+            converter_campo_excecao(valor)[0] if isinstance(valor, str) else ()
+            for valor in (atestados, ferias, escalas_manuais)
+        ))
+    
     def _parse_datas(self, datas_str: str) -> List[date]:
         """
         Converte string de datas em lista de objetos date.
         
         Args:
-            datas_str: String com datas separadas por vírgula (formato: DD/MM/YYYY)
+            datas_str: String com datas e períodos separados por vírgula (formato: DD/MM/YYYY)
             
         Returns:
-            Lista de objetos date
-        """
-        datas = []
-        if not datas_str.strip():
-            return datas
-        
-        for data_str in datas_str.split(','):
-            data_str = data_str.strip()
-            if data_str:
-                try:
-                    # Tentar diferentes formatos
-                    for formato in ['%d/%m/%Y', '%d-%m-%Y', '%Y-%m-%d']:
-                        try:
-                            data = datetime.strptime(data_str, formato).date()
-                            datas.append(data)
-                            break
-                        except ValueError:
-                            continue
-                except:
-                    continue
-        
-        return datas
+            Lista de objetos date (itens não reconhecidos são ignorados)
+        """
+        return dias_periodos(converter_campo_excecao(datas_str)[0])
     
     def _parse_periodo_ferias(self, periodo_str: str) -> List[date]:
         """
-        Converte string de período de férias em lista de datas.
+        Converte string de períodos de férias em lista de datas.
         
         Args:
-            periodo_str: String com período (formato: DD/MM/YYYY-DD/MM/YYYY)
+            periodo_str: String com períodos separados por vírgula (formato: DD/MM/YYYY-DD/MM/YYYY)
             
         Returns:
-            Lista de objetos date do período
-        """
-        datas = []
-        if not periodo_str.strip():
-            return datas
-        
-        try:
-            # Separar início e fim
-            if '-' in periodo_str:
-                inicio_str, fim_str = periodo_str.split('-', 1)
-                inicio_str = inicio_str.strip()
-                fim_str = fim_str.strip()
-                
-                # Converter datas
-                data_inicio = None
-                data_fim = None
-                
-                for formato in ['%d/%m/%Y', '%d-%m-%Y', '%Y-%m-%d']:
-                    try:
-                        data_inicio = datetime.strptime(inicio_str, formato).date()
-                        data_fim = datetime.strptime(fim_str, formato).date()
-                        break
-                    except ValueError:
-                        continue
-                
-                if data_inicio and data_fim:
-                    # Gerar todas as datas do período
-                    data_atual = data_inicio
-                    while data_atual <= data_fim:
-                        datas.append(data_atual)
-                        data_atual += timedelta(days=1)
-        
-        except:
-            pass
-        
-        return datas
+            Lista de objetos date dos períodos
+        """
+        return dias_periodos(converter_campo_excecao(periodo_str)[0])
     
     def validar_escala(self, escala: Dict[date, str], tipo_escala: str) -> Dict[str, Any]:
         """
@@ -0,0 +1,75 @@
+"""
+Status da Escala
+================
+
+Códigos compactos (uint8) dos status de cada dia da escala. As regras, as
+exceções e o gerador trabalham apenas com os códigos; os rótulos (e as cores)
+são obtidos na exibição e na exportação.
+
+Os códigos seguem a ordem alfabética dos rótulos, de modo que ordenar pelos
+códigos equivale a ordenar pelos rótulos.
+"""
+
+from enum import IntEnum
+from typing import Dict, Iterable
+
+import numpy as np
+
+class StatusEscala(IntEnum):
+    """Status de um dia da escala."""
+
+    ATESTADO = 0
+    ESCALA_MANUAL = 1
+    FERIADO = 2
+    FOLGA = 3
+    FERIAS = 4
+    TRABALHO_DIA = 5
+    TRABALHO_MANHA = 6
+    TRABALHO_NOITE = 7
+    TRABALHO_TARDE = 8
+
+    @property
+    def rotulo(self) -> str:
+        """Rótulo do status, como exibido nas escalas."""
+        return ROTULOS_STATUS[self]
+
+# Rótulos na ordem dos códigos
+ROTULOS_STATUS = (
+    'ATESTADO',
+    'ESCALA MANUAL',
+    'FERIADO',
+    'FOLGA',
+    'FÉRIAS',
+    'TRABALHO_DIA',
+    'TRABALHO_MANHA',
+    'TRABALHO_NOITE',
+    'TRABALHO_TARDE'
+)
+
+CODIGOS_STATUS: Dict[str, StatusEscala] = {rotulo: StatusEscala(codigo) for codigo, rotulo in enumerate(ROTULOS_STATUS)}
+
+_ROTULOS = np.array(ROTULOS_STATUS, dtype=object)
+
+def codificar_status(rotulos: Iterable[str]) -> np.ndarray:
+    """
+    Converte rótulos de status em códigos.
+
+    Args:
+        rotulos: Rótulos de status (ex.: 'FOLGA', 'TRABALHO_MANHA')
+
+    Returns:
+        Array uint8 com os códigos
+    """
+    return np.array([CODIGOS_STATUS[rotulo] for rotulo in rotulos], dtype=np.uint8)
+
+def decodificar_status(codigos: np.ndarray) -> np.ndarray:
+    """
+    Converte códigos de status em rótulos.
+
+    Args:
+        codigos: Array de códigos (qualquer formato)
+
+    Returns:
+        Array de rótulos (object) com o mesmo formato
+    """
+    return _ROTULOS[np.asarray(codigos, dtype=np.intp)]
@@ -0,0 +1,107 @@
+"""
+Teste do Motor 6x1 por Ciclos
+=============================
+
+Compara o motor 6x1 (tabela de transições com salto de ciclos) com a
+máquina de estados dia a dia original, para vários inícios de período,
+durações e últimos domingos de folga, e testa a geração em lote.
+"""
+
+import random
+from datetime import date, timedelta
+from calendario import Calendario
+from regras_clt import RegrasCLT
+
+def regra_6x1_referencia(data_inicio, data_fim, ultimo_domingo_folga=None):
+    """Máquina de estados 6x1 original, percorrendo dia a dia."""
+    escala = {}
+    data_atual = data_inicio
+    dias_trabalhados = 0
+    domingos_folgados = 0
+    semanas_sem_domingo = 0
+    ultimo_domingo_folga_local = ultimo_domingo_folga
+
+    if ultimo_domingo_folga:
+        semanas_sem_domingo = max(0, (data_inicio - ultimo_domingo_folga).days // 7)
+
+    while data_atual <= data_fim:
+        if data_atual.weekday() == 6:
+            if semanas_sem_domingo >= 6:
+                escala[data_atual] = "FOLGA"
+                domingos_folgados += 1
+                ultimo_domingo_folga_local = data_atual
+                semanas_sem_domingo = 0
+            elif dias_trabalhados >= 6:
+                escala[data_atual] = "FOLGA"
+                domingos_folgados += 1
+                ultimo_domingo_folga_local = data_atual
+                dias_trabalhados = 0
+                semanas_sem_domingo = 0
+            else:
+                escala[data_atual] = "TRABALHO_MANHA"
+                dias_trabalhados += 1
+                semanas_sem_domingo += 1
+        elif dias_trabalhados < 6:
+            escala[data_atual] = "TRABALHO_MANHA"
+            dias_trabalhados += 1
+        else:
+            escala[data_atual] = "FOLGA"
+            dias_trabalhados = 0
+        data_atual += timedelta(days=1)
+
+    return escala, {
+        'ultimo_domingo_folga': ultimo_domingo_folga_local,
+        'domingos_folgados': domingos_folgados,
+        'semanas_sem_domingo': semanas_sem_domingo
+    }
+
+def testar_equivalencia_6x1():
+    """Compara o motor por ciclos com a referência dia a dia."""
+    print("🧪 Testando motor 6x1 por ciclos:")
+
+    regras = RegrasCLT()
+    random.seed(42)
+    divergencias = 0
+    casos = 500
+    for _ in range(casos):
+        data_inicio = date(2024, 1, 1) + timedelta(days=random.randint(0, 700))
+        data_fim = data_inicio + timedelta(days=random.randint(0, 800))
+        ultimo_domingo = random.choice([None, data_inicio - timedelta(days=random.randint(0, 120))])
+
+        esperado = regra_6x1_referencia(data_inicio, data_fim, ultimo_domingo)
+        obtido = regras.gerar_escala_base('M6X1', data_inicio, data_fim, [], None, ultimo_domingo)
+        if esperado != obtido:
+            divergencias += 1
+            print(f"   ❌ {data_inicio} a {data_fim}, último domingo {ultimo_domingo}")
+
+    print(f"   {'✅' if divergencias == 0 else '❌'} {casos} casos, {divergencias} divergências")
+    return divergencias == 0
+
+def testar_lote_6x1():
+    """Gera vários colaboradores 6x1 de uma só vez."""
+    print("\n🧪 Testando lote 6x1:")
+
+    regras = RegrasCLT()
+    calendario = Calendario(date(2025, 6, 1), date(2026, 5, 31))
+    status_trabalho = ['TRABALHO_MANHA', 'TRABALHO_TARDE', 'TRABALHO_NOITE'] * 1000
+    ultimos_domingos = [date(2025, 5, 25), None, date(2025, 4, 13)] * 1000
+
+    matriz, controle = regras.gerar_6x1_lote(calendario, status_trabalho, ultimos_domingos)
+    status, info = regras.gerar_6x1_vetorizado(calendario, 'TRABALHO_NOITE', date(2025, 4, 13))
+    info_lote = {chave: valores[2] for chave, valores in controle.items()}
+
+    ok = matriz.shape == (3000, len(calendario)) and list(matriz[2]) == list(status) and info_lote == info
+    print(f"   {'✅' if ok else '❌'} Matriz {matriz.shape[0]} × {matriz.shape[1]}")
+    print(f"   Controle do 3º colaborador: {info}")
+    return ok
+
+if __name__ == "__main__":
+    print("INICIANDO TESTE DO MOTOR 6X1")
+    print("=" * 80)
+
+    resultado = testar_equivalencia_6x1()
+    resultado = testar_lote_6x1() and resultado
+
+    print("\n" + "=" * 80)
+    print("✅ TESTE CONCLUÍDO" if resultado else "❌ TESTE FALHOU")
+    print("=" * 80)
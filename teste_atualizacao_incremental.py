@@ -0,0 +1,95 @@
+"""
+Teste da Atualização Incremental
+================================
+
+Verifica se atualizar recalcula apenas os colaboradores novos ou alterados
+e se o resultado (escala, controle 6x1 e diagnósticos) é idêntico ao de uma
+geração completa do zero.
+"""
+
+import time
+from datetime import date
+import pandas as pd
+from dados_teste import colaboradores_teste
+from escala_generator import GeradorEscala
+
+def _iguais(gerador, referencia, escala, escala_referencia):
+    return (escala.equals(escala_referencia)
+            and gerador.controle_6x1.equals(referencia.controle_6x1)
+            and [d.para_dict() for d in gerador.diagnosticos] == [d.para_dict() for d in referencia.diagnosticos])
+
+def testar_atualizacao():
+    """Altera, remove e inclui colaboradores entre duas atualizações."""
+    print("🧪 Testando atualização incremental:")
+
+    df_feriados = pd.DataFrame([{'Data': '19/06/2025', 'Descricao': 'Corpus Christi'}])
+    df_colaboradores = colaboradores_teste(
+        3000, ['M44', 'T40', 'M6X1', 'P_D', 'I_N', 'D12X36', 'TIPO_INVALIDO'],
+        Atestados='', Ferias='', Escalas_Manuais='', Ultimo_Plantao_Mes_Anterior='',
+        Ultimo_Domingo_Folga=['data ruim', '18/05/2025', '18/05/2025', '2025-05-18'])
+    gerador = GeradorEscala(date(2025, 6, 1), date(2025, 12, 31), df_feriados)
+
+    inicio = time.perf_counter()
+    gerador.atualizar(df_colaboradores)
+    tempo_inicial = time.perf_counter() - inicio
+    ok = gerador.estatisticas_execucao['recalculados'] == 3000
+    resultado = ok
+    print(f"   {'✅' if ok else '❌'} Primeira chamada gera todos ({tempo_inicial:.2f}s)")
+
+    # Férias de um colaborador, troca de tipo de outro, uma remoção e uma inclusão
+    df_editado = df_colaboradores.copy()
+    df_editado.loc[10, 'Ferias'] = '01/07/2025-15/07/2025'
+    df_editado.loc[11, 'Tipo_Escala'] = 'N6X1'
+    df_editado = df_editado.drop(index=20)
+    novo = {campo: '' for campo in df_editado.columns}
+    novo.update({'Nome': 'Colaborador Novo', 'Cargo': 'Analista', 'Tipo_Escala': 'T44', 'Turno': 'Tarde'})
+    df_editado = pd.concat([df_editado, pd.DataFrame([novo])], ignore_index=True)
+
+    inicio = time.perf_counter()
+    escala = gerador.atualizar(df_editado)
+    tempo_incremental = time.perf_counter() - inicio
+    ok = gerador.estatisticas_execucao['recalculados'] == 3
+    resultado = resultado and ok
+    print(f"   {'✅' if ok else '❌'} Recalculados: {gerador.estatisticas_execucao['recalculados']} "
+          f"de {len(df_editado)} ({tempo_incremental:.3f}s)")
+
+    referencia = GeradorEscala(date(2025, 6, 1), date(2025, 12, 31), df_feriados)
+    escala_referencia = referencia.gerar_escala_completa(df_editado)
+    ok = (_iguais(gerador, referencia, escala, escala_referencia)
+          and len(gerador.diagnosticos.filtrar(categoria='data_fora_do_formato')) == 1)
+    resultado = resultado and ok
+    print(f"   {'✅' if ok else '❌'} Escala, controle 6x1 e diagnósticos (inclusive datas fora do formato) "
+          f"iguais à geração completa")
+
+    # Reordenar colaboradores não exige recálculo
+    escala = gerador.atualizar(df_editado.iloc[::-1])
+    escala_referencia = referencia.gerar_escala_completa(df_editado.iloc[::-1])
+    ok = gerador.estatisticas_execucao['recalculados'] == 0 and escala.equals(escala_referencia)
+    resultado = resultado and ok
+    print(f"   {'✅' if ok else '❌'} Reordenação reaproveita todas as linhas")
+
+    # Cadastro reduzido: escalas base dos colaboradores removidos são descartadas
+    distintas = gerador.estatisticas_execucao['escalas_base_distintas']
+    escala = gerador.atualizar(df_editado.head(7))
+    escala_referencia = referencia.gerar_escala_completa(df_editado.head(7))
+    ok = (gerador.estatisticas_execucao['escalas_base_distintas'] <= 7 < distintas
+          and len(gerador._linhas_geradas) == 7 and escala.equals(escala_referencia))
+    resultado = resultado and ok
+    print(f"   {'✅' if ok else '❌'} Escalas base limitadas ao último cadastro "
+          f"({distintas} -> {gerador.estatisticas_execucao['escalas_base_distintas']})")
+
+    # Sem geração, não há dados completos
+    ok = not hasattr(GeradorEscala(date(2025, 6, 1), date(2025, 6, 30), df_feriados), '_dados_completos')
+    resultado = resultado and ok
+    print(f"   {'✅' if ok else '❌'} Dados completos indisponíveis antes da primeira geração")
+    return resultado
+
+if __name__ == "__main__":
+    print("INICIANDO TESTE DA ATUALIZAÇÃO INCREMENTAL")
+    print("=" * 80)
+
+    resultado = testar_atualizacao()
+
+    print("\n" + "=" * 80)
+    print("✅ TESTE CONCLUÍDO" if resultado else "❌ TESTE FALHOU")
+    print("=" * 80)
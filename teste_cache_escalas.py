@@ -0,0 +1,84 @@
+"""
+Teste do Cache de Escalas Base
+==============================
+
+Verifica se escalas base repetidas (mesmo tipo, período, feriados e âncoras)
+são servidas pelo cache compartilhado, inclusive entre geradores diferentes
+(como acontece a cada nova execução do Streamlit), e se são imutáveis.
+"""
+
+from datetime import date
+import pandas as pd
+from escala_generator import GeradorEscala
+from regras_clt import RegrasCLT, CacheEscalas
+
+def testar_cache_regras():
+    """Testa acertos, falhas, chave com feriados e imutabilidade."""
+    print("🧪 Testando cache de escalas base:")
+
+    regras = RegrasCLT(cache=CacheEscalas(tamanho_maximo=2))
+    inicio, fim = date(2025, 6, 1), date(2025, 6, 30)
+
+    escala_1 = regras.gerar_escala_base('M44', inicio, fim, [date(2025, 6, 19)])
+    escala_2 = regras.gerar_escala_base('M44', inicio, fim, {date(2025, 6, 19)})
+    escala_3 = regras.gerar_escala_base('M44', inicio, fim, [])
+    print(f"   Estatísticas: {regras.cache_info()}")
+
+    resultado = escala_1 is escala_2 and escala_1 != escala_3
+    print(f"   {'✅' if resultado else '❌'} Mesmos feriados reaproveitam a escala, feriados diferentes não")
+
+    # A âncora de plantão não influencia escalas 44H
+    regras.gerar_escala_base('M44', inicio, fim, [], ultimo_plantao_mes_anterior=date(2025, 5, 31))
+    ok = regras.cache_info()['acertos'] == 2
+    resultado = resultado and ok
+    print(f"   {'✅' if ok else '❌'} Âncoras irrelevantes não criam novas entradas")
+
+    try:
+        escala_1[date(2025, 6, 2)] = 'FOLGA'
+        ok = False
+    except TypeError:
+        ok = True
+    resultado = resultado and ok
+    print(f"   {'✅' if ok else '❌'} Escala em cache é somente leitura")
+
+    # Com tamanho máximo 2, a entrada menos usada é descartada
+    regras.gerar_escala_base('T44', inicio, fim, [])
+    regras.gerar_escala_base('M44', inicio, fim, [date(2025, 6, 19)])
+    ok = regras.cache_info()['itens'] == 2 and regras.cache_info()['falhas'] == 4
+    resultado = resultado and ok
+    print(f"   {'✅' if ok else '❌'} Descarte LRU: {regras.cache_info()}")
+    return resultado
+
+def testar_cache_entre_execucoes():
+    """Gera a mesma escala duas vezes com geradores diferentes."""
+    print("\n🧪 Testando cache entre execuções:")
+
+    RegrasCLT.cache_escalas.limpar()
+    df_feriados = pd.DataFrame([{'Data': '19/06/2025', 'Descricao': 'Corpus Christi'}])
+    df_colaboradores = pd.DataFrame([
+        {'Nome': 'João Silva', 'Cargo': 'Analista', 'Tipo_Escala': 'M44', 'Turno': 'Manhã'},
+        {'Nome': 'Maria Santos', 'Cargo': 'Técnica', 'Tipo_Escala': 'P_D', 'Turno': 'Dia'},
+        {'Nome': 'Pedro Costa', 'Cargo': 'Vigilante', 'Tipo_Escala': 'N6X1', 'Turno': 'Noite'}
+    ])
+
+    escalas = []
+    for execucao in range(2):
+        gerador = GeradorEscala(date(2025, 6, 1), date(2025, 7, 31), df_feriados)
+        escalas.append(gerador.gerar_escala_completa(df_colaboradores))
+        print(f"   Execução {execucao + 1}: {gerador.estatisticas_execucao['cache']}")
+
+    cache = RegrasCLT.cache_escalas.estatisticas()
+    resultado = escalas[0].equals(escalas[1]) and cache['acertos'] == 3 and cache['falhas'] == 3
+    print(f"   {'✅' if resultado else '❌'} Segunda execução servida inteiramente pelo cache")
+    return resultado
+
+if __name__ == "__main__":
+    print("INICIANDO TESTE DO CACHE DE ESCALAS")
+    print("=" * 80)
+
+    resultado = testar_cache_regras()
+    resultado = testar_cache_entre_execucoes() and resultado
+
+    print("\n" + "=" * 80)
+    print("✅ TESTE CONCLUÍDO" if resultado else "❌ TESTE FALHOU")
+    print("=" * 80)
@@ -0,0 +1,68 @@
+"""
+Teste do Calendário do Período
+==============================
+
+Confere as colunas da tabela de calendário (dia da semana, paridade,
+feriado, mês, último dia do mês e dias no mês) contra o cálculo dia a dia.
+"""
+
+import calendar
+from datetime import date, timedelta
+from calendario import Calendario
+
+def testar_colunas_calendario():
+    """Compara cada coluna do calendário com o cálculo feito com datetime."""
+    print("🧪 Testando colunas do calendário:")
+
+    data_inicio = date(2024, 1, 20)
+    data_fim = date(2025, 3, 10)
+    feriados = [date(2024, 2, 13), date(2024, 12, 25), date(2023, 12, 25)]
+    cal = Calendario(data_inicio, data_fim, feriados)
+
+    erros = 0
+    data_atual = data_inicio
+    indice = 0
+    while data_atual <= data_fim:
+        dias_no_mes = calendar.monthrange(data_atual.year, data_atual.month)[1]
+        esperado = (
+            data_atual.weekday(),
+            data_atual.day % 2,
+            data_atual in feriados,
+            dias_no_mes,
+            data_atual.day == dias_no_mes,
+            data_atual
+        )
+        obtido = (
+            int(cal.dia_semana[indice]),
+            int(cal.paridade[indice]),
+            bool(cal.feriado[indice]),
+            int(cal.dias_no_mes[indice]),
+            bool(cal.ultimo_dia_mes[indice]),
+            cal.datas_python[indice]
+        )
+        if esperado != obtido:
+            erros += 1
+            print(f"   ❌ {data_atual:%d/%m/%Y}: esperado {esperado}, obtido {obtido}")
+        data_atual += timedelta(days=1)
+        indice += 1
+
+    print(f"   {'✅' if erros == 0 else '❌'} {len(cal)} dias conferidos, {erros} divergências")
+
+    # Trechos de mês e índice de datas
+    meses = cal.meses()
+    print(f"   Meses no período: {len(meses)} (primeiro: {meses[0]}, último: {meses[-1]})")
+    print(f"   Índice de 01/02/2024: {cal.indice(date(2024, 2, 1))}")
+    print(f"   Índice fora do período: {cal.indice(date(2023, 1, 1))}")
+    print(f"   Dias do mês anterior ao início: {cal.dias_mes_anterior}")
+
+    return erros == 0
+
+if __name__ == "__main__":
+    print("INICIANDO TESTE DO CALENDÁRIO")
+    print("=" * 80)
+
+    resultado = testar_colunas_calendario()
+
+    print("\n" + "=" * 80)
+    print("✅ TESTE CONCLUÍDO" if resultado else "❌ TESTE FALHOU")
+    print("=" * 80)
@@ -0,0 +1,107 @@
+"""
+Teste da Conversão de Datas
+===========================
+
+Verifica a conversão de datas isoladas (com cache) e de colunas inteiras, em
+um único formato por coluna, e a equivalência entre a conversão isolada e a
+vetorizada.
+"""
+
+import random
+import time
+from datetime import date, datetime
+from collections import Counter
+import pandas as pd
+from conversao_datas import (FORMATO_CELULA_DATA, FORMATOS_EXCECAO, _interpretar, converter_data, converter_datas,
+                             formato_data)
+from diagnosticos import ColetorDiagnosticos
+
+def testar_data_isolada():
+    """Converte textos nos formatos aceitos e rejeita datas inexistentes."""
+    print("🧪 Testando conversão de datas isoladas:")
+
+    casos = [
+        ('19/06/2025', date(2025, 6, 19)), (' 1/6/2025 ', date(2025, 6, 1)), ('19-06-2025', date(2025, 6, 19)),
+        ('2025-06-19', date(2025, 6, 19)), ('2025-06-19 00:00:00', date(2025, 6, 19)),
+        ('31/02/2025', None), ('19/06/25', None), ('lixo', None), ('', None), (None, None),
+        (date(2025, 6, 19), date(2025, 6, 19)), (datetime(2025, 6, 19, 8), date(2025, 6, 19)),
+        (pd.Timestamp('2025-06-19'), date(2025, 6, 19)), (pd.NaT, None),
+    ]
+    resultado = True
+    for valor, esperado in casos:
+        ok = converter_data(valor) == esperado
+        resultado = resultado and ok
+        if not ok:
+            print(f"   ❌ {valor!r} → {converter_data(valor)} (esperado {esperado})")
+    print(f"   {'✅' if resultado else '❌'} {len(casos)} valores convertidos")
+
+    ok = converter_data('2025-06-19 00:00:00', FORMATOS_EXCECAO) is None and formato_data('19-06-2025') == '%d-%m-%Y'
+    resultado = resultado and ok
+    print(f"   {'✅' if ok else '❌'} Apenas os formatos informados são aceitos")
+    return resultado
+
+def testar_cache():
+    """Textos repetidos são convertidos uma única vez."""
+    print("\n🧪 Testando cache de textos repetidos:")
+
+    _interpretar.cache_clear()
+    textos = [f'{dia:02d}/06/2025' for dia in range(1, 31)] * 10000
+    inicio = time.perf_counter()
+    datas = [converter_data(texto) for texto in textos]
+    tempo = time.perf_counter() - inicio
+    informacoes = _interpretar.cache_info()
+
+    ok = informacoes.misses == 30 and datas[-1] == date(2025, 6, 30)
+    print(f"   {'✅' if ok else '❌'} {len(textos)} conversões em {tempo:.3f}s, "
+          f"{informacoes.misses} textos distintos convertidos")
+    return ok
+
+def testar_coluna():
+    """A conversão da coluna inteira equivale à conversão valor a valor, no formato da coluna."""
+    print("\n🧪 Testando conversão vetorizada de colunas:")
+
+    random.seed(5)
+    amostras = ['19/06/2025', '1/6/2025', '19-06-2025', '2025-06-19', '2025-6-9', '2025-06-19 10:30:00',
+                '31/02/2025', '29/02/2024', '19/06/25', '19.06.2025', 'lixo', '']
+    textos = pd.Series([random.choice(amostras) for _ in range(100000)], index=range(5, 100005))
+
+    diagnosticos = ColetorDiagnosticos()
+    inicio = time.perf_counter()
+    datas = converter_datas(textos, diagnosticos=diagnosticos, campo='Data')
+    tempo = time.perf_counter() - inicio
+
+    # Referência: o formato que reconhece mais valores; células de data do Excel valem em qualquer coluna
+    formatos = [formato_data(texto) for texto in textos]
+    formato_coluna = Counter(formato for formato in formatos if formato not in (None, FORMATO_CELULA_DATA)).most_common(1)[0][0]
+    esperado = [converter_data(texto) if formato in (formato_coluna, FORMATO_CELULA_DATA) else None
+                for texto, formato in zip(textos, formatos)]
+    obtido = [None if pd.isna(data) else data.date() for data in datas]
+    ok = obtido == esperado and datas.index.equals(textos.index) and formato_coluna == '%d/%m/%Y'
+    print(f"   {'✅' if ok else '❌'} {len(textos)} textos convertidos em {tempo:.3f}s no formato {formato_coluna}, "
+          f"iguais à conversão isolada")
+
+    fora = {texto for texto, formato in zip(textos, formatos) if formato not in (None, formato_coluna, FORMATO_CELULA_DATA)}
+    avisos = diagnosticos.filtrar(categoria='data_fora_do_formato')
+    resultado = ok and len(avisos) == 1 and set(avisos[0].dados['valores']) == fora
+    print(f"   {'✅' if resultado else '❌'} Valores fora do formato avisados: {sorted(fora)}")
+
+    # Empate: vale o primeiro formato aceito; valores que não são datas ficam para quem chama
+    empate = converter_datas(pd.Series(['2025-06-19', '19/06/2025', '']))
+    sem_datas = ColetorDiagnosticos()
+    converter_datas(pd.Series(['lixo', '31/02/2025', '']), diagnosticos=sem_datas)
+    ok = empate.isna().tolist() == [True, False, True] and len(sem_datas) == 0
+    resultado = resultado and ok
+    print(f"   {'✅' if ok else '❌'} Empate resolvido pela ordem dos formatos")
+    return resultado
+
+if __name__ == "__main__":
+    print("INICIANDO TESTE DA CONVERSÃO DE DATAS")
+    print("=" * 80)
+
+    resultado = testar_data_isolada()
+    resultado = testar_cache() and resultado
+    resultado = testar_coluna() and resultado
+
+    print("\n" + "=" * 80)
+    print("✅ TESTE CONCLUÍDO" if resultado else "❌ TESTE FALHOU")
+    print("=" * 80)
@@ -22,7 +22,7 @@ def testar_escala_6x1():
     
     # Teste 1: Sem último domingo informado
     print("\n1. Teste sem último domingo informado:")
-    escala1, info1 = regras._regra_6x1_manha(data_inicio, data_fim, feriados)
+    escala1, info1 = regras.gerar_escala_base('M6X1', data_inicio, data_fim, feriados)
     print(f"   Último domingo folga: {info1['ultimo_domingo_folga']}")
     print(f"   Domingos folgados: {info1['domingos_folgados']}")
     print(f"   Semanas sem domingo: {info1['semanas_sem_domingo']}")
@@ -30,7 +30,7 @@ def testar_escala_6x1():
     # Teste 2: Com último domingo informado (25/05/2025)
     print("\n2. Teste com último domingo informado (25/05/2025):")
     ultimo_domingo = date(2025, 5, 25)
-    escala2, info2 = regras._regra_6x1_manha(data_inicio, data_fim, feriados, ultimo_domingo)
+    escala2, info2 = regras.gerar_escala_base('M6X1', data_inicio, data_fim, feriados, ultimo_domingo_folga=ultimo_domingo)
     print(f"   Último domingo folga informado: {ultimo_domingo}")
     print(f"   Último domingo folga calculado: {info2['ultimo_domingo_folga']}")
     print(f"   Domingos folgados: {info2['domingos_folgados']}")
@@ -101,7 +101,7 @@ def testar_plantao_escala():
     # Teste 1: Plantão par com último plantão em dia par
     print("\n1. Teste plantão par com último plantão em dia par:")
     ultimo_plantao = date(2025, 5, 30)  # Dia par
-    escala_par = regras._regra_plantao_par_dia(data_inicio, data_fim, feriados, ultimo_plantao)
+    escala_par = regras.gerar_escala_base('P_D', data_inicio, data_fim, feriados, ultimo_plantao)
     
     # Verificar primeiros dias de junho
     print("   Primeiros dias de junho:")
@@ -113,7 +113,7 @@ def testar_plantao_escala():
     # Teste 2: Plantão ímpar com último plantão em dia ímpar
     print("\n2. Teste plantão ímpar com último plantão em dia ímpar:")
     ultimo_plantao = date(2025, 5, 29)  # Dia ímpar
-    escala_impar = regras._regra_plantao_impar_dia(data_inicio, data_fim, feriados, ultimo_plantao)
+    escala_impar = regras.gerar_escala_base('I_D', data_inicio, data_fim, feriados, ultimo_plantao)
     
     # Verificar primeiros dias de junho
     print("   Primeiros dias de junho:")
@@ -122,7 +122,7 @@ def testar_escala_plantao():
     # Teste plantão par
     print("\n1. Teste Plantão Par (P_D):")
     ultimo_plantao = date(2025, 5, 30)  # Dia par
-    escala_par = regras._regra_plantao_par_dia(data_inicio, data_fim, feriados, ultimo_plantao)
+    escala_par = regras.gerar_escala_base('P_D', data_inicio, data_fim, feriados, ultimo_plantao)
     
     # Contar status
     trabalhos = sum(1 for status in escala_par.values() if status in ['TRABALHO_DIA', 'TRABALHO_NOITE'])
@@ -136,7 +136,7 @@ def testar_escala_plantao():
     # Teste plantão ímpar
     print("\n2. Teste Plantão Ímpar (I_N):")
     ultimo_plantao = date(2025, 5, 29)  # Dia ímpar
-    escala_impar = regras._regra_plantao_impar_noite(data_inicio, data_fim, feriados, ultimo_plantao)
+    escala_impar = regras.gerar_escala_base('I_N', data_inicio, data_fim, feriados, ultimo_plantao)
     
     # Contar status
     trabalhos = sum(1 for status in escala_impar.values() if status in ['TRABALHO_DIA', 'TRABALHO_NOITE'])
@@ -0,0 +1,58 @@
+"""
+Teste da Deduplicação de Escalas Base
+=====================================
+
+Verifica se colaboradores com o mesmo perfil de regra (Tipo_Escala,
+Ultimo_Plantao_Mes_Anterior e Ultimo_Domingo_Folga) compartilham a mesma
+escala base e se a razão de deduplicação aparece nas estatísticas.
+"""
+
+from datetime import date
+import pandas as pd
+from escala_generator import GeradorEscala
+
+def testar_deduplicacao():
+    """Gera uma escala com muitos colaboradores de perfis repetidos."""
+    print("🧪 Testando deduplicação de escalas base:")
+
+    perfis = [
+        {'Tipo_Escala': 'M44', 'Turno': 'Manhã', 'Ultimo_Plantao_Mes_Anterior': '', 'Ultimo_Domingo_Folga': ''},
+        {'Tipo_Escala': 'N6X1', 'Turno': 'Noite', 'Ultimo_Plantao_Mes_Anterior': '', 'Ultimo_Domingo_Folga': '25/05/2025'},
+        {'Tipo_Escala': 'P_D', 'Turno': 'Dia', 'Ultimo_Plantao_Mes_Anterior': '30/05/2025', 'Ultimo_Domingo_Folga': ''},
+    ]
+    colaboradores = []
+    for i in range(300):
+        perfil = perfis[i % len(perfis)]
+        colaboradores.append({
+            'Nome': f'Colaborador {i:03d}',
+            'Cargo': 'Técnico',
+            'Atestados': '10/06/2025' if i % 10 == 0 else '',
+            'Ferias': '',
+            'Escalas_Manuais': '',
+            **perfil
+        })
+    df_colaboradores = pd.DataFrame(colaboradores)
+
+    gerador = GeradorEscala(date(2025, 6, 1), date(2025, 6, 30), pd.DataFrame())
+    escala = gerador.gerar_escala_completa(df_colaboradores)
+    estatisticas = gerador.estatisticas_execucao
+
+    print(f"   Estatísticas: {estatisticas}")
+
+    # As exceções continuam individuais
+    atestados = escala[(escala['Data'] == date(2025, 6, 10)) & (escala['Status'] == 'ATESTADO')]
+    print(f"   Colaboradores com atestado em 10/06: {len(atestados)}")
+
+    resultado = estatisticas['escalas_base_distintas'] == 3 and len(atestados) == 30
+    print(f"   {'✅' if resultado else '❌'} 300 colaboradores, 3 escalas base geradas")
+    return resultado
+
+if __name__ == "__main__":
+    print("INICIANDO TESTE DE DEDUPLICAÇÃO")
+    print("=" * 80)
+
+    resultado = testar_deduplicacao()
+
+    print("\n" + "=" * 80)
+    print("✅ TESTE CONCLUÍDO" if resultado else "❌ TESTE FALHOU")
+    print("=" * 80)
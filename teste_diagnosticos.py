@@ -0,0 +1,88 @@
+"""
+Teste dos Diagnósticos do Motor
+===============================
+
+Verifica que o motor de escalas roda sem Streamlit e registra os avisos
+(ajuste de tipo de plantão, mudança de tipo, data inválida, tipo de escala
+inválido) no coletor de diagnósticos, para a interface exibir.
+"""
+
+import sys
+from datetime import date
+import pandas as pd
+from escala_generator import GeradorEscala
+from excel_utils import ler_planilha_colaboradores
+from diagnosticos import ColetorDiagnosticos
+
+def testar_motor_sem_streamlit():
+    """Verifica que os módulos do motor não importam Streamlit."""
+    print("🧪 Testando motor sem Streamlit:")
+
+    resultado = 'streamlit' not in sys.modules
+    print(f"   {'✅' if resultado else '❌'} escala_generator e excel_utils importados sem Streamlit")
+    return resultado
+
+def testar_diagnosticos_geracao():
+    """Gera uma escala com situações que produzem avisos."""
+    print("\n🧪 Testando diagnósticos da geração:")
+
+    df_colaboradores = pd.DataFrame([
+        {'Nome': 'Maria Santos', 'Cargo': 'Enfermeira', 'Tipo_Escala': 'P_D', 'Turno': 'Dia',
+         'Ultimo_Plantao_Mes_Anterior': '', 'Ultimo_Domingo_Folga': ''},
+        {'Nome': 'Pedro Costa', 'Cargo': 'Vigilante', 'Tipo_Escala': 'N6X1', 'Turno': 'Noite',
+         'Ultimo_Plantao_Mes_Anterior': '', 'Ultimo_Domingo_Folga': 'domingo passado'},
+        {'Nome': 'Ana Lima', 'Cargo': 'Técnica', 'Tipo_Escala': 'X99', 'Turno': 'Manhã',
+         'Ultimo_Plantao_Mes_Anterior': '', 'Ultimo_Domingo_Folga': ''},
+    ])
+
+    # Junho começa após maio (31 dias) e o período atravessa julho (31 dias)
+    gerador = GeradorEscala(date(2025, 6, 1), date(2025, 8, 31), pd.DataFrame())
+    escala = gerador.gerar_escala_completa(df_colaboradores)
+
+    for diagnostico in gerador.diagnosticos:
+        print(f"   [{diagnostico.nivel}] {diagnostico.categoria}: {diagnostico.mensagem}")
+
+    categorias = {diagnostico.categoria for diagnostico in gerador.diagnosticos}
+    resultado = (
+        categorias == {'ajuste_tipo', 'mudanca_tipo', 'data_invalida', 'tipo_invalido'}
+        and 'Ana Lima' not in set(escala['Nome'])
+        and len(gerador.diagnosticos.filtrar(nivel='erro')) == 1
+    )
+    print(f"   {'✅' if resultado else '❌'} {len(gerador.diagnosticos)} diagnósticos registrados")
+    print(gerador.diagnosticos.para_dataframe()[['Nivel', 'Categoria', 'Colaborador']].to_string(index=False))
+    return resultado
+
+def testar_diagnosticos_leitura():
+    """Lê uma planilha com tipo de escala e turno inválidos."""
+    print("\n🧪 Testando diagnósticos da leitura da planilha:")
+
+    arquivo = '/tmp/teste_diagnosticos_colaboradores.xlsx'
+    pd.DataFrame([
+        {'Nome': 'João Silva', 'Cargo': 'Analista', 'Tipo_Escala': 'M44', 'Turno': 'Manhã'},
+        {'Nome': 'Ana Lima', 'Cargo': 'Técnica', 'Tipo_Escala': 'X99', 'Turno': 'Madrugada'},
+    ]).to_excel(arquivo, index=False)
+
+    diagnosticos = ColetorDiagnosticos()
+    df = ler_planilha_colaboradores(arquivo, diagnosticos)
+
+    for diagnostico in diagnosticos:
+        print(f"   [{diagnostico.nivel}] {diagnostico.mensagem}")
+
+    resultado = len(df) == 2 and [d.categoria for d in diagnosticos] == ['tipo_invalido', 'turno_invalido']
+    print(f"   {'✅' if resultado else '❌'} Avisos de validação registrados")
+
+    sem_coletor = len(ler_planilha_colaboradores(arquivo)) == 2
+    print(f"   {'✅' if sem_coletor else '❌'} Leitura sem coletor de diagnósticos")
+    return resultado and sem_coletor
+
+if __name__ == "__main__":
+    print("INICIANDO TESTE DOS DIAGNÓSTICOS")
+    print("=" * 80)
+
+    resultado = testar_motor_sem_streamlit()
+    resultado = testar_diagnosticos_geracao() and resultado
+    resultado = testar_diagnosticos_leitura() and resultado
+
+    print("\n" + "=" * 80)
+    print("✅ TESTE CONCLUÍDO" if resultado else "❌ TESTE FALHOU")
+    print("=" * 80)
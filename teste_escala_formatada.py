@@ -0,0 +1,89 @@
+"""
+Teste da Escala Formatada sem Pivot
+===================================
+
+Compara a grade larga montada por remodelagem com o pivot_table original,
+inclusive tipos das colunas, para escalas densas, colaboradores repetidos,
+colunas de texto comuns e dados fora de ordem (que usam o pivot).
+"""
+
+import time
+from datetime import date
+import pandas as pd
+from escala_generator import GeradorEscala
+
+def _identicos(df_a, df_b):
+    return (df_a.equals(df_b) and list(df_a.columns) == list(df_b.columns)
+            and df_a.columns.name == df_b.columns.name
+            and [str(tipo) for tipo in df_a.dtypes] == [str(tipo) for tipo in df_b.dtypes])
+
+def testar_equivalencia():
+    """Compara com o pivot_table em vários formatos de entrada."""
+    print("🧪 Testando equivalência com o pivot_table:")
+
+    df_feriados = pd.DataFrame([{'Data': '19/06/2025', 'Descricao': 'Corpus Christi'}])
+    df_colaboradores = pd.DataFrame([
+        {'Nome': 'Maria Santos', 'Cargo': 'Técnica', 'Tipo_Escala': 'P_D', 'Turno': 'Dia'},
+        {'Nome': 'João Silva', 'Cargo': 'Analista', 'Tipo_Escala': 'M44', 'Turno': 'Manhã'},
+        {'Nome': 'João Silva', 'Cargo': 'Analista', 'Tipo_Escala': 'M44', 'Turno': 'Manhã',
+         'Ferias': '02/06/2025-06/06/2025'},
+        {'Nome': 'Ana Costa', 'Cargo': 'Técnica', 'Tipo_Escala': 'T6X1', 'Turno': 'Tarde'},
+    ]).fillna('')
+    gerador = GeradorEscala(date(2025, 6, 1), date(2025, 7, 31), df_feriados)
+    escala_completa = gerador.gerar_escala_completa(df_colaboradores)
+
+    casos = {
+        'Escala densa (categóricos, colaborador repetido)': escala_completa,
+        'Colunas de texto comuns': escala_completa.astype({coluna: object for coluna in
+                                                           ['Nome', 'Cargo', 'Tipo_Escala', 'Turno', 'Status_Colorido']}),
+        'Período filtrado': gerador.filtrar_escala(escala_completa, {'data_inicio': date(2025, 7, 1)}),
+        'Linhas embaralhadas (pivot)': escala_completa.sample(frac=1, random_state=3),
+        'Dia ausente de um colaborador (pivot)': escala_completa.drop(index=5),
+    }
+    resultado = True
+    for nome, escala in casos.items():
+        ok = _identicos(gerador.exportar_escala_formatada(escala), gerador._pivotar_largo(escala))
+        resultado = resultado and ok
+        print(f"   {'✅' if ok else '❌'} {nome}")
+
+    ok = _identicos(gerador.exportar_escala_formatada(gerador.matriz_escala),
+                    gerador._pivotar_largo(escala_completa))
+    resultado = resultado and ok
+    print(f"   {'✅' if ok else '❌'} A partir da matriz")
+    return resultado
+
+def testar_desempenho():
+    """Compara o tempo com o pivot_table em uma escala anual."""
+    print("\n🧪 Testando desempenho:")
+
+    tipos = ['M44', 'T40', 'M6X1', 'P_D', 'I_N']
+    df_colaboradores = pd.DataFrame([
+        {'Nome': f'Colaborador {i}', 'Cargo': 'Técnico', 'Tipo_Escala': tipos[i % len(tipos)], 'Turno': 'Manhã'}
+        for i in range(2000)
+    ])
+    gerador = GeradorEscala(date(2025, 1, 1), date(2025, 12, 31), pd.DataFrame())
+    escala_completa = gerador.gerar_escala_completa(df_colaboradores)
+
+    inicio = time.perf_counter()
+    referencia = gerador._pivotar_largo(escala_completa)
+    tempo_pivot = time.perf_counter() - inicio
+
+    inicio = time.perf_counter()
+    formatada = gerador.exportar_escala_formatada(escala_completa)
+    tempo_remodelagem = time.perf_counter() - inicio
+
+    ok = _identicos(formatada, referencia)
+    print(f"   {'✅' if ok else '❌'} {formatada.shape[0]} × {formatada.shape[1]}: "
+          f"pivot {tempo_pivot:.2f}s, remodelagem {tempo_remodelagem:.2f}s")
+    return ok
+
+if __name__ == "__main__":
+    print("INICIANDO TESTE DA ESCALA FORMATADA")
+    print("=" * 80)
+
+    resultado = testar_equivalencia()
+    resultado = testar_desempenho() and resultado
+
+    print("\n" + "=" * 80)
+    print("✅ TESTE CONCLUÍDO" if resultado else "❌ TESTE FALHOU")
+    print("=" * 80)
@@ -0,0 +1,68 @@
+"""
+Teste da Geração Vetorizada
+===========================
+
+Compara a escala gerada pelo modo vetorizado (arrays NumPy de códigos de
+status) com a escala gerada dia a dia por gerar_escala_base, para todos os
+tipos de escala.
+"""
+
+from datetime import date
+from regras_clt import RegrasCLT
+from status_escala import decodificar_status
+
+def testar_equivalencia_vetorizada():
+    """Verifica se o modo vetorizado reproduz a escala base dia a dia."""
+    print("🧪 Testando geração vetorizada:")
+
+    regras = RegrasCLT()
+    data_inicio = date(2025, 5, 15)
+    data_fim = date(2025, 8, 10)
+    feriados = [date(2025, 6, 19), date(2025, 7, 9)]
+    ultimo_domingo = date(2025, 4, 6)
+
+    calendario = regras.montar_periodo(data_inicio, data_fim, feriados)
+    print(f"   Período: {len(calendario)} dias, {calendario.feriado.sum()} feriados")
+
+    todos_iguais = True
+    for tipo_escala in regras.tipos_escala:
+        escala_base = regras.gerar_escala_base(
+            tipo_escala, data_inicio, data_fim, feriados, None, ultimo_domingo
+        )
+        if isinstance(escala_base, tuple):
+            escala_base, info_base = escala_base
+        else:
+            info_base = {}
+
+        status, info_controle = regras.gerar_escala_vetorizada(
+            tipo_escala, data_inicio, data_fim, feriados, None, ultimo_domingo, calendario
+        )
+
+        iguais = list(escala_base.values()) == list(decodificar_status(status)) and info_base == info_controle
+        todos_iguais = todos_iguais and iguais
+        print(f"   {'✅' if iguais else '❌'} {tipo_escala}")
+
+    # Exceções aplicadas sobre o array
+    status, _ = regras.gerar_escala_vetorizada('M44', data_inicio, data_fim, feriados, calendario=calendario)
+    status_final = regras.aplicar_excecoes_vetorizado(
+        status, calendario, '20/05/2025', '01/06/2025-05/06/2025', '07/06/2025'
+    )
+    escala_final = regras.aplicar_excecoes(
+        regras.gerar_escala_base('M44', data_inicio, data_fim, feriados),
+        '20/05/2025', '01/06/2025-05/06/2025', '07/06/2025'
+    )
+    iguais = list(escala_final.values()) == list(decodificar_status(status_final))
+    todos_iguais = todos_iguais and iguais
+    print(f"   {'✅' if iguais else '❌'} Exceções (atestado, férias, escala manual)")
+
+    return todos_iguais
+
+if __name__ == "__main__":
+    print("INICIANDO TESTE DA GERAÇÃO VETORIZADA")
+    print("=" * 80)
+
+    resultado = testar_equivalencia_vetorizada()
+
+    print("\n" + "=" * 80)
+    print("✅ TESTE CONCLUÍDO" if resultado else "❌ TESTE FALHOU")
+    print("=" * 80)
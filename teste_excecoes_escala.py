@@ -0,0 +1,203 @@
+"""
+Teste das Exceções da Escala
+============================
+
+Verifica a conversão dos campos de exceção (várias datas e períodos por
+campo, em todos os formatos) e a aplicação das exceções como intervalos
+tipados: precedência entre atestado, férias e escala manual, recorte ao
+período, equivalência da forma em lote com a aplicação colaborador a
+colaborador e a geração da escala com as exceções aplicadas em lote.
+"""
+
+import random
+import time
+from datetime import date, timedelta
+import numpy as np
+import pandas as pd
+from calendario import Calendario
+from diagnosticos import ColetorDiagnosticos
+from escala_generator import GeradorEscala
+from excecoes_escala import (IntervaloExcecao, TipoExcecao, aplicar_intervalos, aplicar_intervalos_lote,
+                             converter_campo_excecao, converter_coluna_excecoes, intervalos_excecoes,
+                             tabela_intervalos)
+from normalizacao_colaboradores import normalizar_colaboradores
+from regras_clt import RegrasCLT
+from status_escala import StatusEscala
+
+def testar_campos():
+    """Converte campos com várias datas e períodos, em todos os formatos."""
+    print("🧪 Testando conversão dos campos de exceção:")
+
+    casos = [
+        ('10/06/2025-20/06/2025', ((date(2025, 6, 10), date(2025, 6, 20)),), ()),
+        ('10-06-2025-20-06-2025', ((date(2025, 6, 10), date(2025, 6, 20)),), ()),
+        ('2025-06-10 - 2025-06-20', ((date(2025, 6, 10), date(2025, 6, 20)),), ()),
+        ('01/06/2025 a 05/06/2025; 2025-07-01 até 2025-07-03, 15-08-2025',
+         ((date(2025, 6, 1), date(2025, 6, 5)), (date(2025, 7, 1), date(2025, 7, 3)),
+          (date(2025, 8, 15), date(2025, 8, 15))), ()),
+        ('15/06/2025, lixo, 31/02/2025, 10/06/2025-', ((date(2025, 6, 15), date(2025, 6, 15)),),
+         ('lixo', '31/02/2025', '10/06/2025-')),
+        ('', (), ()),
+    ]
+    resultado = True
+    for texto, periodos, rejeitados in casos:
+        ok = converter_campo_excecao(texto) == (periodos, rejeitados)
+        resultado = resultado and ok
+        if not ok:
+            print(f"   ❌ {texto!r} → {converter_campo_excecao(texto)}")
+    print(f"   {'✅' if resultado else '❌'} {len(casos)} campos convertidos (vários períodos, todos os formatos)")
+
+    regras = RegrasCLT()
+    ok = len(regras._parse_periodo_ferias('01-06-2025-10-06-2025, 2025-06-20-2025-06-21')) == 12
+    resultado = resultado and ok
+    print(f"   {'✅' if ok else '❌'} Férias em DD-MM-AAAA e AAAA-MM-DD não são mais quebradas no primeiro '-'")
+
+    # Conversão da coluna inteira (um formato de data) igual à conversão campo a campo
+    random.seed(7)
+    itens = ['10/06/2025-20/06/2025', '01/07/2025-03/07/2025', '01/08/2025 a 10/08/2025', '15/06/2025',
+             '18/06/2025', '31/02/2025', 'lixo', '1/6/2025 - 2/6/2025']
+    textos = pd.Series(['; '.join(random.sample(itens, random.randint(0, 4))) for _ in range(20000)])
+    inicio = time.perf_counter()
+    periodos, rejeitados = converter_coluna_excecoes(textos)
+    tempo = time.perf_counter() - inicio
+
+    esperado = [converter_campo_excecao(texto) for texto in textos]
+    obtido_periodos = [[] for _ in textos]
+    for linha, inicio_periodo, fim_periodo in zip(periodos['Linha'], periodos['Inicio'].dt.date, periodos['Fim'].dt.date):
+        obtido_periodos[linha].append((inicio_periodo, fim_periodo))
+    obtido_rejeitados = [[] for _ in textos]
+    for linha, item in rejeitados.items():
+        obtido_rejeitados[linha].append(item)
+    ok = ([tuple(linha) for linha in obtido_periodos] == [periodos_linha for periodos_linha, _ in esperado]
+          and [tuple(linha) for linha in obtido_rejeitados] == [rejeitados_linha for _, rejeitados_linha in esperado])
+    resultado = resultado and ok
+    print(f"   {'✅' if ok else '❌'} {len(periodos)} períodos de {len(textos)} campos convertidos em {tempo:.3f}s, "
+          f"iguais à conversão campo a campo")
+
+    # Itens em outro formato que o da coluna são rejeitados e avisados
+    diagnosticos = ColetorDiagnosticos()
+    periodos, rejeitados = converter_coluna_excecoes(
+        pd.Series(['10/06/2025-20/06/2025; 2025-06-18', '01-07-2025-03-07-2025', '15/06/2025']),
+        diagnosticos, 'Ferias')
+    avisos = [(aviso.dados['campo'], aviso.dados['valores']) for aviso in diagnosticos]
+    ok = (periodos['Linha'].tolist() == [0, 2] and rejeitados.to_dict() == {0: '2025-06-18', 1: '01-07-2025-03-07-2025'}
+          and avisos == [('Ferias', ['2025-06-18', '01-07-2025', '03-07-2025'])])
+    resultado = resultado and ok
+    print(f"   {'✅' if ok else '❌'} Itens fora do formato da coluna rejeitados e avisados: {avisos}")
+    return resultado
+
+def testar_precedencia():
+    """Escala manual prevalece sobre férias, que prevalecem sobre atestado."""
+    print("\n🧪 Testando precedência e recorte dos intervalos:")
+
+    calendario = Calendario(date(2025, 6, 1), date(2025, 6, 30))
+    base = np.full(len(calendario), StatusEscala.TRABALHO_MANHA, dtype=np.uint8)
+    intervalos = [
+        IntervaloExcecao(TipoExcecao.ESCALA_MANUAL, date(2025, 6, 12), date(2025, 6, 12)),
+        IntervaloExcecao(TipoExcecao.FERIAS, date(2025, 6, 10), date(2025, 6, 14)),
+        IntervaloExcecao(TipoExcecao.ATESTADO, date(2025, 6, 9), date(2025, 6, 10)),
+        IntervaloExcecao(TipoExcecao.FERIAS, date(2025, 5, 20), date(2025, 6, 2)),
+        IntervaloExcecao(TipoExcecao.ATESTADO, date(2025, 7, 1), date(2025, 7, 1)),
+    ]
+    status = aplicar_intervalos(base, calendario, intervalos)
+
+    esperado = base.copy()
+    esperado[0:2] = StatusEscala.FERIAS
+    esperado[8] = StatusEscala.ATESTADO
+    esperado[9:14] = StatusEscala.FERIAS
+    esperado[11] = StatusEscala.ESCALA_MANUAL
+    ok = np.array_equal(status, esperado) and base[11] == StatusEscala.TRABALHO_MANHA
+    print(f"   {'✅' if ok else '❌'} Atestado < férias < escala manual, intervalos recortados ao período")
+    return ok
+
+def testar_lote():
+    """A forma em lote equivale à aplicação colaborador a colaborador."""
+    print("\n🧪 Testando aplicação das exceções em lote:")
+
+    random.seed(11)
+    calendario = Calendario(date(2025, 6, 1), date(2025, 7, 31))
+    dias = [date(2025, 5, 1) + timedelta(days=d) for d in range(120)]
+    colaboradores = pd.DataFrame({
+        'Atestados': [tuple((dia, dia) for dia in random.sample(dias, random.randint(0, 3))) for _ in range(3000)],
+        'Ferias': [tuple(tuple(sorted(random.sample(dias, 2), reverse=random.random() < 0.1))
+                         for _ in range(random.randint(0, 2))) for _ in range(3000)],
+        'Escalas_Manuais': [tuple((dia, dia) for dia in random.sample(dias, random.randint(0, 2))) for _ in range(3000)],
+    })
+    base = np.random.default_rng(2).integers(0, len(StatusEscala), (3000, len(calendario))).astype(np.uint8)
+
+    esperado = np.array([
+        aplicar_intervalos(linha, calendario, intervalos_excecoes(*excecoes))
+        for linha, excecoes in zip(base, colaboradores.itertuples(index=False))
+    ])
+    inicio = time.perf_counter()
+    tabela = tabela_intervalos(colaboradores)
+    obtido = aplicar_intervalos_lote(base.copy(), calendario, tabela)
+    tempo = time.perf_counter() - inicio
+
+    ok = np.array_equal(obtido, esperado)
+    print(f"   {'✅' if ok else '❌'} {len(tabela)} intervalos de {len(colaboradores)} colaboradores "
+          f"aplicados em {tempo:.3f}s")
+
+    # Colaboradores fora da matriz (linha negativa) são descartados
+    linhas = np.where(np.arange(3000) % 2 == 0, np.arange(3000) // 2, -1)
+    obtido = aplicar_intervalos_lote(base[::2].copy(), calendario, tabela_intervalos(colaboradores, linhas))
+    ok_linhas = np.array_equal(obtido, esperado[::2])
+    print(f"   {'✅' if ok_linhas else '❌'} Linhas da matriz informadas por colaborador")
+    return ok and ok_linhas
+
+def testar_escala_dict():
+    """A escala em dicionário percorre apenas os dias da escala."""
+    print("\n🧪 Testando exceções sobre a escala em dicionário:")
+
+    regras = RegrasCLT()
+    calendario = Calendario(date(2025, 6, 1), date(2025, 6, 30))
+    escala = {data: 'TRABALHO_MANHA' for data in calendario.datas_python}
+    base = np.full(len(calendario), StatusEscala.TRABALHO_MANHA, dtype=np.uint8)
+
+    excecoes = ('15/06/2025, 16/06/2025', '01/01/2020-31/12/2030', '16/06/2025')
+    inicio = time.perf_counter()
+    final = regras.aplicar_excecoes(escala, *excecoes)
+    tempo = time.perf_counter() - inicio
+    vetorizado = regras.aplicar_excecoes_vetorizado(base, calendario, *excecoes)
+
+    ok = [final[data] for data in calendario.datas_python] == [StatusEscala(codigo).rotulo for codigo in vetorizado]
+    ok = ok and final[date(2025, 6, 16)] == 'ESCALA MANUAL' and final[date(2025, 6, 15)] == 'FÉRIAS'
+    print(f"   {'✅' if ok else '❌'} Férias de 11 anos aplicadas em {tempo * 1000:.2f}ms, iguais à forma vetorizada")
+    return ok
+
+def testar_geracao():
+    """A geração com exceções em lote equivale à geração colaborador a colaborador."""
+    print("\n🧪 Testando geração da escala com exceções em lote:")
+
+    tipos = ['M44', 'TIPO_INVALIDO', 'M6X1', 'P_D', 'D12X36', 'T40']
+    df_colaboradores = pd.DataFrame([
+        {'Nome': f'Colaborador {i}', 'Cargo': 'Técnico', 'Tipo_Escala': tipos[i % len(tipos)], 'Turno': 'Manhã',
+         'Atestados': f'{1 + i % 28:02d}/06/2025', 'Ferias': '10/06/2025-20/06/2025' if i % 3 == 0 else '',
+         'Escalas_Manuais': '12/06/2025' if i % 4 == 0 else '', 'Ultimo_Plantao_Mes_Anterior': '',
+         'Ultimo_Domingo_Folga': ''}
+        for i in range(60)
+    ])
+    gerador = GeradorEscala(date(2025, 6, 1), date(2025, 6, 30), pd.DataFrame())
+    matriz = gerador.gerar_matriz_escala(df_colaboradores)
+
+    normalizados = normalizar_colaboradores(df_colaboradores)
+    linhas = [gerador._gerar_linha(colaborador)['status'] for colaborador in normalizados.to_dict('records')]
+    esperado = np.array([linha for linha in linhas if linha is not None])
+
+    ok = np.array_equal(matriz.status, esperado)
+    print(f"   {'✅' if ok else '❌'} {len(matriz.status)} colaboradores incluídos, escala igual à aplicação individual")
+    return ok
+
+if __name__ == "__main__":
+    print("INICIANDO TESTE DAS EXCEÇÕES DA ESCALA")
+    print("=" * 80)
+
+    resultado = testar_campos()
+    resultado = testar_precedencia() and resultado
+    resultado = testar_lote() and resultado
+    resultado = testar_escala_dict() and resultado
+    resultado = testar_geracao() and resultado
+
+    print("\n" + "=" * 80)
+    print("✅ TESTE CONCLUÍDO" if resultado else "❌ TESTE FALHOU")
+    print("=" * 80)
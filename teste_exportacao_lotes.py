@@ -0,0 +1,109 @@
+"""
+Teste da Geração e Exportação em Lotes
+======================================
+
+Verifica se iter_escala entrega, lote a lote, a mesma escala de
+gerar_escala_completa (como DataFrames e como lotes Arrow) e se os
+gravadores Excel, CSV e Parquet consomem os lotes.
+"""
+
+import io
+from datetime import date
+import pandas as pd
+from dados_teste import colaboradores_teste, iguais
+from escala_generator import GeradorEscala
+from exportacao_escala import escrever_escala_csv, escrever_escala_excel, escrever_escala_parquet
+
+def _gerar():
+    df_feriados = pd.DataFrame([{'Data': '19/06/2025', 'Descricao': 'Corpus Christi'}])
+    gerador = GeradorEscala(date(2025, 6, 1), date(2025, 7, 31), df_feriados)
+    df_colaboradores = colaboradores_teste(40, ['M44', 'T40', 'M6X1', 'P_D', 'I_N', 'TIPO_INVALIDO'])
+    escala_completa = gerador.gerar_escala_completa(df_colaboradores)
+    return gerador, df_colaboradores, escala_completa
+
+def testar_iter_escala():
+    """Compara os lotes com a escala completa."""
+    print("🧪 Testando iter_escala:")
+
+    gerador, df_colaboradores, escala_completa = _gerar()
+    controle_completo = gerador.controle_6x1
+
+    lotes = list(gerador.iter_escala(df_colaboradores, tamanho_lote=9))
+    ok = len(lotes) == 5 and max(len(lote) for lote in lotes) <= 9 * len(gerador.calendario)
+    resultado = ok
+    print(f"   {'✅' if ok else '❌'} {len(lotes)} lotes de até 9 colaboradores")
+
+    ok = iguais(pd.concat(lotes, ignore_index=True), escala_completa)
+    resultado = resultado and ok
+    print(f"   {'✅' if ok else '❌'} Lotes DataFrame iguais à escala completa")
+
+    ok = iguais(gerador.controle_6x1, controle_completo)
+    resultado = resultado and ok
+    print(f"   {'✅' if ok else '❌'} Controle 6x1 disponível ao final dos lotes")
+
+    lotes_arrow = list(gerador.iter_escala(df_colaboradores, tamanho_lote=9, formato='arrow'))
+    df_arrow = pd.concat([lote.to_pandas() for lote in lotes_arrow], ignore_index=True)
+    ok = iguais(df_arrow, escala_completa)
+    resultado = resultado and ok
+    print(f"   {'✅' if ok else '❌'} Lotes Arrow iguais à escala completa")
+
+    # Formato de data detectado no cadastro inteiro: o primeiro lote (só AAAA-MM-DD) segue o da coluna
+    df_datas = colaboradores_teste(30, ['M6X1'], Ultimo_Domingo_Folga=lambda i: '2025-05-18' if i < 9 else '25/05/2025')
+    completo = GeradorEscala(date(2025, 6, 1), date(2025, 6, 30), pd.DataFrame())
+    em_lotes = GeradorEscala(date(2025, 6, 1), date(2025, 6, 30), pd.DataFrame())
+    escala_datas = completo.gerar_escala_completa(df_datas)
+    lotes = list(em_lotes.iter_escala(df_datas, tamanho_lote=9))
+    avisos = [aviso.dados['valores'] for aviso in em_lotes.diagnosticos.filtrar(categoria='data_fora_do_formato')]
+    ok = iguais(pd.concat(lotes, ignore_index=True), escala_datas) and avisos == [['2025-05-18']]
+    resultado = resultado and ok
+    print(f"   {'✅' if ok else '❌'} Um formato de data para o cadastro inteiro, não por lote: {avisos}")
+    return resultado
+
+def testar_gravadores():
+    """Grava os lotes em Excel, CSV e Parquet."""
+    print("\n🧪 Testando gravadores em lotes:")
+
+    gerador, df_colaboradores, escala_completa = _gerar()
+    resultado = True
+
+    saida = io.BytesIO()
+    linhas = escrever_escala_excel(gerador.iter_escala(df_colaboradores, tamanho_lote=9), saida)
+    saida.seek(0)
+    df_excel = pd.read_excel(saida)
+    ok = linhas == len(escala_completa) and list(df_excel.columns) == list(escala_completa.columns)
+    resultado = resultado and ok
+    print(f"   {'✅' if ok else '❌'} Excel: {linhas} linhas")
+
+    saida = io.StringIO()
+    linhas = escrever_escala_csv(gerador.iter_escala(df_colaboradores, tamanho_lote=9), saida)
+    saida.seek(0)
+    df_csv = pd.read_csv(saida)
+    ok = linhas == len(escala_completa) and (df_csv['Status'].to_numpy() == escala_completa['Status'].astype(str).to_numpy()).all()
+    resultado = resultado and ok
+    print(f"   {'✅' if ok else '❌'} CSV: {linhas} linhas, cabeçalho único")
+
+    try:
+        import pyarrow.parquet as pq
+    except ImportError:
+        print("   ⚠️ pyarrow não instalado - Parquet não testado")
+        return resultado
+
+    saida = io.BytesIO()
+    linhas = escrever_escala_parquet(gerador.iter_escala(df_colaboradores, tamanho_lote=9, formato='arrow'), saida)
+    saida.seek(0)
+    tabela = pq.read_table(saida)
+    ok = linhas == len(escala_completa) and iguais(tabela.to_pandas(), escala_completa)
+    resultado = resultado and ok
+    print(f"   {'✅' if ok else '❌'} Parquet: {linhas} linhas em {pq.ParquetFile(saida).num_row_groups} grupos")
+    return resultado
+
+if __name__ == "__main__":
+    print("INICIANDO TESTE DA EXPORTAÇÃO EM LOTES")
+    print("=" * 80)
+
+    resultado = testar_iter_escala()
+    resultado = testar_gravadores() and resultado
+
+    print("\n" + "=" * 80)
+    print("✅ TESTE CONCLUÍDO" if resultado else "❌ TESTE FALHOU")
+    print("=" * 80)
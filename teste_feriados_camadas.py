@@ -0,0 +1,145 @@
+"""
+Teste do Calendário de Feriados em Camadas
+==========================================
+
+Testa o calendário de feriados indexado com camadas nacional, estadual,
+municipal e por unidade, a leitura da tabela de feriados de uma só vez e o uso
+de feriados próprios por unidade no gerador.
+"""
+
+import io
+import random
+import time
+from datetime import date, timedelta
+import pandas as pd
+from calendario import CalendarioFeriados, tabela_feriados
+from conversao_datas import converter_data
+from escala_generator import GeradorEscala
+from excel_utils import ler_planilha_feriados
+
+def testar_camadas_feriados():
+    """Testa a consulta de feriados por unidade."""
+    print("🧪 Testando camadas de feriados:")
+
+    feriados = CalendarioFeriados([date(2025, 6, 19)])  # Corpus Christi (nacional)
+    feriados.adicionar([date(2025, 7, 9)], 'estadual')  # Revolução Constitucionalista (SP)
+    feriados.adicionar([date(2025, 6, 13)], 'municipal', unidade='Hospital Centro')
+    feriados.adicionar([date(2025, 6, 24)], 'unidade', unidade='Hospital Norte')
+
+    print(f"   Unidades com feriados próprios: {feriados.unidades()}")
+    for unidade in [None, 'Hospital Centro', 'Hospital Norte']:
+        datas = sorted(feriados.datas(unidade))
+        print(f"   {unidade or 'Geral'}: {[d.strftime('%d/%m') for d in datas]}")
+
+    resultado = (
+        date(2025, 6, 19) in feriados
+        and not feriados.contem(date(2025, 6, 13))
+        and feriados.contem(date(2025, 6, 13), 'Hospital Centro')
+        and not feriados.contem(date(2025, 6, 13), 'Hospital Norte')
+    )
+    print(f"   {'✅' if resultado else '❌'} Consulta por unidade")
+    return resultado
+
+def testar_tabela_feriados():
+    """A leitura da tabela inteira equivale à leitura linha a linha, com um formato de data na coluna."""
+    print("\n🧪 Testando leitura da tabela de feriados:")
+
+    random.seed(4)
+    linhas = []
+    for _ in range(20000):
+        dia = date(2020, 1, 1) + timedelta(days=random.randint(0, 3650))
+        linhas.append({
+            'Data': random.choice([f'{dia:%d/%m/%Y}', pd.Timestamp(dia), dia, 'lixo', '', None]),
+            'Descricao': 'Feriado municipal',
+            'Camada': random.choice(['', ' Municipal ', 'estadual', None, 'unidade']),
+            'Unidade': random.choice(['', 'Hospital Centro', ' Hospital Norte', None]),
+        })
+    df_feriados = pd.DataFrame(linhas)
+
+    # Leitura linha a linha, como feita antes da tabela de feriados
+    esperado = CalendarioFeriados()
+    for linha in linhas:
+        data_feriado = converter_data(linha['Data'])
+        if data_feriado is not None:
+            camada = linha['Camada'].strip().lower() if linha['Camada'] and linha['Camada'].strip() else 'nacional'
+            unidade = linha['Unidade'].strip() if linha['Unidade'] and linha['Unidade'].strip() else None
+            esperado.adicionar([data_feriado], 'unidade' if unidade and camada == 'nacional' else camada, unidade)
+
+    inicio = time.perf_counter()
+    tabela, invalidas = tabela_feriados(df_feriados)
+    feriados = CalendarioFeriados.de_tabela(tabela)
+    tempo = time.perf_counter() - inicio
+
+    resultado = True
+    ok = all(feriados.datas(unidade) == esperado.datas(unidade)
+             for unidade in [None, 'Hospital Centro', 'Hospital Norte'])
+    ok = ok and invalidas.sum() == sum(linha['Data'] == 'lixo' for linha in linhas)
+    ok = ok and not tabela.duplicated(['Data', 'Camada', 'Unidade']).any()
+    resultado = resultado and ok
+    print(f"   {'✅' if ok else '❌'} {len(df_feriados)} linhas lidas em {tempo:.3f}s "
+          f"({len(tabela)} feriados distintos), iguais à leitura linha a linha")
+
+    # O gerador recebe apenas os feriados do período
+    gerador = GeradorEscala(date(2025, 6, 1), date(2025, 6, 30), df_feriados, unidade='Hospital Centro')
+    ok = gerador.feriados == {data for data in esperado.datas('Hospital Centro')
+                              if date(2025, 6, 1) <= data <= date(2025, 6, 30)}
+    ok = ok and all(len(datas) <= 30 for datas in gerador.calendario_feriados._camadas.values())
+    resultado = resultado and ok
+    print(f"   {'✅' if ok else '❌'} Feriados recortados ao período ({len(gerador.feriados)} em junho)")
+
+    # A planilha lida já vem normalizada e é aceita pelo gerador sem nova conversão
+    arquivo = io.BytesIO()
+    df_feriados.dropna(subset=['Data']).query("Data != 'lixo'").to_excel(arquivo, index=False)
+    arquivo.seek(0)
+    lidos = ler_planilha_feriados(arquivo)
+    ok = (pd.api.types.is_datetime64_any_dtype(lidos['Data'])
+          and list(lidos.columns) == ['Data', 'Descricao', 'Camada', 'Unidade']
+          and GeradorEscala(date(2025, 6, 1), date(2025, 6, 30), lidos, unidade='Hospital Centro').feriados == gerador.feriados)
+    resultado = resultado and ok
+    print(f"   {'✅' if ok else '❌'} Planilha de feriados lida ({len(lidos)} feriados) e usada pelo gerador")
+
+    # Datas digitadas em outro formato que o da coluna são desconsideradas e avisadas
+    gerador = GeradorEscala(date(2025, 6, 1), date(2025, 6, 30), pd.DataFrame({
+        'Data': ['19/06/2025', '2025-06-20', '21/06/2025', pd.Timestamp('2025-06-22')]
+    }))
+    avisos = [aviso.dados['valores'] for aviso in gerador.diagnosticos.filtrar(categoria='data_fora_do_formato')]
+    ok = (sorted(gerador.feriados) == [date(2025, 6, 19), date(2025, 6, 21), date(2025, 6, 22)]
+          and avisos == [['2025-06-20']])
+    resultado = resultado and ok
+    print(f"   {'✅' if ok else '❌'} Feriado fora do formato da coluna avisado: {avisos}")
+    return resultado
+
+def testar_gerador_por_unidade():
+    """Gera a mesma escala para duas unidades com feriados diferentes."""
+    print("\n🧪 Testando gerador por unidade:")
+
+    df_feriados = pd.DataFrame([
+        {'Data': '19/06/2025', 'Descricao': 'Corpus Christi'},
+        {'Data': '13/06/2025', 'Descricao': 'Santo Antônio', 'Camada': 'municipal', 'Unidade': 'Hospital Centro'}
+    ])
+    df_colaboradores = pd.DataFrame([
+        {'Nome': 'João Silva', 'Cargo': 'Analista', 'Tipo_Escala': 'M44', 'Turno': 'Manhã'}
+    ])
+
+    resultado = True
+    for unidade, esperado in [('Hospital Centro', 'FERIADO'), ('Hospital Norte', 'TRABALHO_MANHA')]:
+        gerador = GeradorEscala(date(2025, 6, 1), date(2025, 6, 30), df_feriados, unidade=unidade)
+        escala = gerador.gerar_escala_completa(df_colaboradores)
+        status = escala[escala['Data'] == date(2025, 6, 13)]['Status'].iloc[0]
+        ok = status == esperado
+        resultado = resultado and ok
+        print(f"   {'✅' if ok else '❌'} {unidade}: 13/06 = {status}")
+
+    return resultado
+
+if __name__ == "__main__":
+    print("INICIANDO TESTE DE FERIADOS EM CAMADAS")
+    print("=" * 80)
+
+    resultado = testar_camadas_feriados()
+    resultado = testar_tabela_feriados() and resultado
+    resultado = testar_gerador_por_unidade() and resultado
+
+    print("\n" + "=" * 80)
+    print("✅ TESTE CONCLUÍDO" if resultado else "❌ TESTE FALHOU")
+    print("=" * 80)
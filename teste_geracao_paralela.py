@@ -0,0 +1,89 @@
+"""
+Teste da Geração Paralela
+=========================
+
+Verifica se a geração em lotes distribuídos entre processos produz a mesma
+escala, o mesmo controle 6x1 e os mesmos diagnósticos da geração serial, e
+se entradas pequenas continuam sendo geradas no modo serial.
+"""
+
+import random
+import time
+from datetime import date
+import pandas as pd
+from dados_teste import colaboradores_teste
+from escala_generator import GeradorEscala
+
+def _colaboradores(quantidade):
+    random.seed(7)
+    tipos = ['M44', 'T40', 'M6X1', 'N6X1', 'P_D', 'I_N', 'D12X36', 'M5X2', 'TIPO_INVALIDO']
+    return colaboradores_teste(
+        quantidade, lambda i: random.choice(tipos),
+        Ultimo_Domingo_Folga=lambda i: random.choice(['', '18/05/2025', 'data ruim']),
+        Ultimo_Plantao_Mes_Anterior=lambda i: random.choice(['', '30/04/2025', '29/04/2025']),
+        Ferias=lambda i: random.choice(['', '10/06/2025-20/06/2025']), Atestados='', Escalas_Manuais='')
+
+def testar_paralelo_igual_serial():
+    """Compara o modo paralelo com o serial."""
+    print("🧪 Testando geração paralela:")
+
+    df_feriados = pd.DataFrame([{'Data': '19/06/2025', 'Descricao': 'Corpus Christi'}])
+    df_colaboradores = _colaboradores(3000)
+
+    serial = GeradorEscala(date(2025, 5, 1), date(2025, 8, 31), df_feriados)
+    inicio = time.perf_counter()
+    escala_serial = serial.gerar_escala_completa(df_colaboradores)
+    tempo_serial = time.perf_counter() - inicio
+
+    paralelo = GeradorEscala(date(2025, 5, 1), date(2025, 8, 31), df_feriados)
+    inicio = time.perf_counter()
+    escala_paralela = paralelo.gerar_escala_completa(df_colaboradores, processos=2, tamanho_lote=400)
+    tempo_paralelo = time.perf_counter() - inicio
+
+    ok = paralelo.estatisticas_execucao['modo'] == 'paralelo'
+    resultado = ok
+    print(f"   {'✅' if ok else '❌'} Modo: {paralelo.estatisticas_execucao['modo']} "
+          f"({paralelo.estatisticas_execucao['processos']} processos)")
+
+    ok = escala_serial.equals(escala_paralela)
+    resultado = resultado and ok
+    print(f"   {'✅' if ok else '❌'} Escala idêntica ({len(escala_paralela):,} linhas; "
+          f"serial {tempo_serial:.2f}s, paralelo {tempo_paralelo:.2f}s)")
+
+    ok = serial.controle_6x1.equals(paralelo.controle_6x1)
+    resultado = resultado and ok
+    print(f"   {'✅' if ok else '❌'} Controle 6x1 idêntico")
+
+    diagnosticos_serial = [d.para_dict() for d in serial.diagnosticos]
+    diagnosticos_paralelo = [d.para_dict() for d in paralelo.diagnosticos]
+    ok = diagnosticos_serial == diagnosticos_paralelo
+    resultado = resultado and ok
+    print(f"   {'✅' if ok else '❌'} Diagnósticos idênticos e na mesma ordem ({len(diagnosticos_paralelo)})")
+
+    ok = serial.estatisticas_execucao['escalas_base_distintas'] == paralelo.estatisticas_execucao['escalas_base_distintas']
+    resultado = resultado and ok
+    print(f"   {'✅' if ok else '❌'} Escalas base distintas: {paralelo.estatisticas_execucao['escalas_base_distintas']}")
+    return resultado
+
+def testar_fallback_serial():
+    """Entradas pequenas não abrem processos."""
+    print("\n🧪 Testando fallback serial:")
+
+    gerador = GeradorEscala(date(2025, 6, 1), date(2025, 6, 30), pd.DataFrame())
+    gerador.gerar_escala_completa(_colaboradores(50), processos=4, tamanho_lote=10)
+
+    ok = gerador.estatisticas_execucao['modo'] == 'serial' and gerador.estatisticas_execucao['processos'] == 1
+    print(f"   {'✅' if ok else '❌'} 50 colaboradores gerados no modo {gerador.estatisticas_execucao['modo']}")
+    return ok
+
+if __name__ == "__main__":
+    print("INICIANDO TESTE DA GERAÇÃO PARALELA")
+    print("=" * 80)
+
+    GeradorEscala.MINIMO_COLABORADORES_PARALELO = 1000
+    resultado = testar_paralelo_igual_serial()
+    resultado = testar_fallback_serial() and resultado
+
+    print("\n" + "=" * 80)
+    print("✅ TESTE CONCLUÍDO" if resultado else "❌ TESTE FALHOU")
+    print("=" * 80)
@@ -0,0 +1,113 @@
+"""
+Teste da Geração de Várias Unidades
+===================================
+
+Verifica se GeradorEscala.gerar_unidades produz, para cada unidade, a mesma
+escala de uma geração independente, respeitando os feriados próprios de cada
+unidade e gerando uma única vez as escalas base que não dependem de feriados.
+"""
+
+import time
+from datetime import date
+import pandas as pd
+import escala_generator
+from dados_teste import colaboradores_teste
+from escala_generator import GeradorEscala
+from normalizacao_colaboradores import normalizado
+from regras_clt import RegrasCLT
+from status_escala import StatusEscala
+
+def _colaboradores(unidade, quantidade):
+    return colaboradores_teste(
+        quantidade, ['M44', 'T40', 'M6X1', 'N6X1', 'P_D', 'I_N', 'D12X36', 'M5X2', 'TIPO_INVALIDO'],
+        Nome=lambda i: f'{unidade} {i}', Atestados=['15/06/2025', '', '', '', ''], Ferias='', Escalas_Manuais='',
+        Ultimo_Plantao_Mes_Anterior=['', '31/05/2025'],
+        Ultimo_Domingo_Folga=['', '18/05/2025', '25/05/2025', 'data ruim'])
+
+def _unidades(quantidade):
+    return [
+        (f'Unidade {u}', _colaboradores(f'U{u}', 200),
+         pd.DataFrame([{'Data': '19/06/2025', 'Descricao': 'Corpus Christi'},
+                       {'Data': f'{2 + u % 20:02d}/06/2025', 'Descricao': 'Aniversário da unidade'}]))
+        for u in range(quantidade)
+    ]
+
+def testar_unidades():
+    """Compara a geração em lote com gerações independentes."""
+    print("🧪 Testando geração em lote de várias unidades:")
+
+    unidades = _unidades(20)
+    inicio_periodo, fim_periodo = date(2025, 6, 1), date(2025, 6, 30)
+
+    RegrasCLT.cache_escalas.limpar()
+    inicio = time.perf_counter()
+    independentes = {}
+    for unidade, df_colaboradores, feriados in unidades:
+        gerador = GeradorEscala(inicio_periodo, fim_periodo, feriados, unidade)
+        gerador.gerar_matriz_escala(df_colaboradores)
+        independentes[unidade] = gerador
+    tempo_independente = time.perf_counter() - inicio
+
+    # Conta as conversões de fato (DataFrames ainda não normalizados)
+    conversoes = []
+    normalizar_colaboradores = escala_generator.normalizar_colaboradores
+
+    def normalizar_contando(df_colaboradores, diagnosticos=None):
+        if not normalizado(df_colaboradores):
+            conversoes.append(len(df_colaboradores))
+        return normalizar_colaboradores(df_colaboradores, diagnosticos)
+
+    RegrasCLT.cache_escalas.limpar()
+    escala_generator.normalizar_colaboradores = normalizar_contando
+    try:
+        inicio = time.perf_counter()
+        geradores = GeradorEscala.gerar_unidades(inicio_periodo, fim_periodo, unidades)
+        tempo_lote = time.perf_counter() - inicio
+    finally:
+        escala_generator.normalizar_colaboradores = normalizar_colaboradores
+    falhas_lote = RegrasCLT.cache_escalas.falhas
+
+    resultado = True
+    ok = list(geradores) == [unidade for unidade, _, _ in unidades]
+    resultado = resultado and ok
+    print(f"   {'✅' if ok else '❌'} {len(geradores)} unidades geradas "
+          f"({tempo_lote:.2f}s em lote, {tempo_independente:.2f}s independentes)")
+
+    ok = conversoes == [sum(len(df_colaboradores) for _, df_colaboradores, _ in unidades)]
+    resultado = resultado and ok
+    print(f"   {'✅' if ok else '❌'} Colaboradores de todas as unidades normalizados uma única vez {conversoes}")
+
+    ok = all(
+        (geradores[unidade].matriz_escala.status == gerador.matriz_escala.status).all()
+        and geradores[unidade].controle_6x1.equals(gerador.controle_6x1)
+        and [d.para_dict() for d in geradores[unidade].diagnosticos] == [d.para_dict() for d in gerador.diagnosticos]
+        for unidade, gerador in independentes.items()
+    )
+    resultado = resultado and ok
+    print(f"   {'✅' if ok else '❌'} Escala, controle 6x1 e diagnósticos iguais aos da geração independente")
+
+    # Feriado próprio de cada unidade: 44h folga por feriado apenas na sua unidade
+    matriz_0, matriz_1 = geradores['Unidade 0'].matriz_escala, geradores['Unidade 1'].matriz_escala
+    ok = (matriz_0.status_em('U0 0', date(2025, 6, 2)) == StatusEscala.FERIADO
+          and matriz_1.status_em('U1 0', date(2025, 6, 2)) != StatusEscala.FERIADO)
+    resultado = resultado and ok
+    print(f"   {'✅' if ok else '❌'} Feriados próprios respeitados por unidade")
+
+    # Escalas que não dependem de feriados (6x1, plantões, rotativas sem folga em feriado):
+    # uma entrada de cache para todas as unidades; apenas 44h, 40h e 5x2 variam por unidade
+    distintas_por_unidade = geradores['Unidade 0'].estatisticas_execucao['escalas_base_distintas']
+    ok = falhas_lote < distintas_por_unidade * len(unidades) / 2
+    resultado = resultado and ok
+    print(f"   {'✅' if ok else '❌'} {falhas_lote} escalas base calculadas para {len(unidades)} unidades "
+          f"({distintas_por_unidade} perfis por unidade)")
+    return resultado
+
+if __name__ == "__main__":
+    print("INICIANDO TESTE DA GERAÇÃO DE VÁRIAS UNIDADES")
+    print("=" * 80)
+
+    resultado = testar_unidades()
+
+    print("\n" + "=" * 80)
+    print("✅ TESTE CONCLUÍDO" if resultado else "❌ TESTE FALHOU")
+    print("=" * 80)
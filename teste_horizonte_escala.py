@@ -0,0 +1,94 @@
+"""
+Teste do Horizonte de Escalas
+=============================
+
+Verifica se a geração mês a mês com transporte de estado (gerar_horizonte)
+produz a mesma escala que uma única geração contínua do horizonte inteiro,
+para escalas fixas, 6x1, plantões e rotativas.
+"""
+
+from datetime import date
+import numpy as np
+import pandas as pd
+from escala_generator import GeradorEscala
+from horizonte_escala import gerar_horizonte, periodos_mensais
+
+def _colaboradores():
+    perfis = [
+        ('M44', '', ''), ('T40', '', ''),
+        ('M6X1', '', ''), ('N6X1', '', '18/05/2025'), ('T6X1', '', '06/04/2025'),
+        ('P_D', '', ''), ('I_N', '', ''), ('P_N', '31/05/2025', ''),
+        ('D12X36', '', ''), ('N12X36', '30/05/2025', ''), ('24X72', '29/05/2025', ''),
+        ('M5X2', '', ''), ('T4X2', '28/05/2025', ''),
+    ]
+    return pd.DataFrame([
+        {'Nome': f'Colaborador {i}', 'Cargo': 'Técnico', 'Tipo_Escala': tipo, 'Turno': 'Manhã',
+         'Atestados': '', 'Ferias': '', 'Escalas_Manuais': '', 'Ultimo_Plantao_Mes_Anterior': ultimo_plantao,
+         'Ultimo_Domingo_Folga': ultimo_domingo}
+        for i, (tipo, ultimo_plantao, ultimo_domingo) in enumerate(perfis)
+    ])
+
+def testar_periodos_mensais():
+    """Divide o horizonte em meses a partir de uma data no meio do mês."""
+    print("🧪 Testando divisão do horizonte em meses:")
+
+    periodos = periodos_mensais(date(2025, 1, 15), 3)
+    esperado = [(date(2025, 1, 15), date(2025, 1, 31)), (date(2025, 2, 1), date(2025, 2, 28)),
+                (date(2025, 3, 1), date(2025, 3, 31))]
+    ok = periodos == esperado
+    print(f"   {'✅' if ok else '❌'} Períodos: {[f'{i:%d/%m}-{f:%d/%m}' for i, f in periodos]}")
+    return ok
+
+def testar_horizonte_continuo():
+    """Compara o horizonte mês a mês com a geração contínua do período inteiro."""
+    print("\n🧪 Testando horizonte mês a mês x geração contínua:")
+
+    df_feriados = pd.DataFrame([{'Data': '19/06/2025', 'Descricao': 'Corpus Christi'},
+                                {'Data': '07/09/2025', 'Descricao': 'Independência'},
+                                {'Data': '15/11/2025', 'Descricao': 'Proclamação da República'}])
+    df_colaboradores = _colaboradores()
+
+    continuo = GeradorEscala(date(2025, 6, 1), date(2025, 12, 31), df_feriados)
+    matriz_continua = continuo.gerar_matriz_escala(df_colaboradores)
+
+    resultado = True
+    periodos = gerar_horizonte(df_colaboradores, date(2025, 6, 1), 7, df_feriados)
+    for periodo in periodos:
+        inicio = continuo.calendario.indice(periodo.data_inicio)
+        esperado = matriz_continua.status[:, inicio:inicio + len(periodo.gerador.calendario)]
+        diferentes = np.flatnonzero((periodo.matriz_escala.status != esperado).any(axis=1))
+        ok = len(diferentes) == 0
+        resultado = resultado and ok
+        tipos = [df_colaboradores['Tipo_Escala'][i] for i in diferentes]
+        print(f"   {'✅' if ok else '❌'} {periodo.data_inicio:%m/%Y}: "
+              f"{'igual à geração contínua' if ok else f'diferenças em {tipos}'}")
+
+    # O estado transportado fica visível nos dados do último mês
+    ultimo = periodo.df_colaboradores.set_index('Tipo_Escala', drop=False)
+    ok = ultimo.loc['M6X1', 'Dias_Trabalhados_Seguidos'] is not None and ultimo.loc['M44', 'Semanas_Sem_Domingo'] is None
+    resultado = resultado and ok
+    print(f"   {'✅' if ok else '❌'} Contadores 6x1 transportados apenas para escalas 6x1")
+    return resultado
+
+def testar_geracao_sob_demanda():
+    """Cada mês só é gerado quando solicitado."""
+    print("\n🧪 Testando geração sob demanda:")
+
+    periodos = gerar_horizonte(_colaboradores(), date(2025, 1, 1), 120, pd.DataFrame())
+    primeiro = next(periodos)
+    segundo = next(periodos)
+    ok = (primeiro.data_fim, segundo.data_inicio) == (date(2025, 1, 31), date(2025, 2, 1))
+    print(f"   {'✅' if ok else '❌'} Dois primeiros meses gerados sem calcular o restante do horizonte")
+    return ok
+
+if __name__ == "__main__":
+    print("INICIANDO TESTE DO HORIZONTE DE ESCALAS")
+    print("=" * 80)
+
+    resultado = testar_periodos_mensais()
+    resultado = testar_horizonte_continuo() and resultado
+    resultado = testar_geracao_sob_demanda() and resultado
+
+    print("\n" + "=" * 80)
+    print("✅ TESTE CONCLUÍDO" if resultado else "❌ TESTE FALHOU")
+    print("=" * 80)
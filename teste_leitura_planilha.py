@@ -9,6 +9,7 @@ corretamente o formato das datas, especialmente o campo Ultimo_Domingo_Folga.
 import pandas as pd
 from datetime import date, datetime
 from io import BytesIO
+from diagnosticos import ColetorDiagnosticos
 from excel_utils import ler_planilha_colaboradores
 
 def testar_leitura_planilha():
@@ -81,7 +82,7 @@ def testar_leitura_planilha():
     
     # Ler planilha usando a função
     try:
-        df_lido = ler_planilha_colaboradores(arquivo_mock)
+        df_lido = ler_planilha_colaboradores(arquivo_mock, ColetorDiagnosticos())
         
         print("✅ Planilha lida com sucesso!")
         print(f"📊 Colunas: {list(df_lido.columns)}")
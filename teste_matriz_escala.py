@@ -0,0 +1,89 @@
+"""
+Teste da Matriz de Escala
+=========================
+
+Verifica o acesso O(1), as fatias e as conversões da MatrizEscala e se os
+relatórios lidos da matriz são iguais aos lidos do formato longo.
+"""
+
+from datetime import date
+import pandas as pd
+from dados_teste import iguais
+from escala_generator import GeradorEscala
+from matriz_escala import MatrizEscala
+from status_escala import StatusEscala
+
+def _gerar():
+    df_feriados = pd.DataFrame([{'Data': '19/06/2025', 'Descricao': 'Corpus Christi'}])
+    df_colaboradores = pd.DataFrame([
+        {'Nome': 'João Silva', 'Cargo': 'Analista', 'Tipo_Escala': 'M44', 'Turno': 'Manhã',
+         'Ferias': '16/06/2025-20/06/2025'},
+        {'Nome': 'Maria Santos', 'Cargo': 'Técnica', 'Tipo_Escala': 'P_D', 'Turno': 'Dia',
+         'Ultimo_Plantao_Mes_Anterior': '30/05/2025'},
+        {'Nome': 'Ana Costa', 'Cargo': 'Técnica', 'Tipo_Escala': 'I_N', 'Turno': 'Noite'},
+        {'Nome': 'Pedro Lima', 'Cargo': 'Operador', 'Tipo_Escala': 'T6X1', 'Turno': 'Tarde',
+         'Ultimo_Domingo_Folga': '18/05/2025'},
+    ]).fillna('')
+    gerador = GeradorEscala(date(2025, 6, 1), date(2025, 8, 31), df_feriados)
+    escala_completa = gerador.gerar_escala_completa(df_colaboradores)
+    return gerador, escala_completa
+
+def testar_acesso_e_fatias():
+    """Testa acesso a células, fatias e conversão para o formato longo."""
+    print("🧪 Testando acesso e fatias:")
+
+    gerador, escala_completa = _gerar()
+    matriz = gerador.matriz_escala
+
+    ok = isinstance(matriz, MatrizEscala) and matriz.shape == (4, 92)
+    resultado = ok
+    print(f"   {'✅' if ok else '❌'} {matriz}")
+
+    ok = (matriz['João Silva', date(2025, 6, 17)] == StatusEscala.FERIAS
+          and matriz[0, 2] == StatusEscala.TRABALHO_MANHA
+          and matriz.status_em('João Silva', date(2025, 6, 19)) == StatusEscala.FERIAS)
+    resultado = resultado and ok
+    print(f"   {'✅' if ok else '❌'} Acesso por índice, nome e data")
+
+    junho = matriz[:, date(2025, 6, 1):date(2025, 7, 1)]
+    ok = junho.shape == (4, 30) and junho.calendario.data_fim == date(2025, 6, 30)
+    ok = ok and matriz.periodo(date(2025, 7, 1), date(2025, 12, 31)).shape == (4, 62)
+    ok = ok and matriz[['Ana Costa', 'Pedro Lima']].shape == (2, 92)
+    resultado = resultado and ok
+    print(f"   {'✅' if ok else '❌'} Fatias de linhas e de dias")
+
+    ok = matriz.para_longo(gerador.rotulos_coloridos()).equals(escala_completa)
+    resultado = resultado and ok
+    print(f"   {'✅' if ok else '❌'} Formato longo igual à escala completa")
+
+    ok = (matriz.contagens().sum(axis=1) == 92).all()
+    resultado = resultado and ok
+    print(f"   {'✅' if ok else '❌'} Contagens por colaborador")
+    return resultado
+
+def testar_relatorios():
+    """Compara os relatórios lidos da matriz com os lidos do formato longo."""
+    print("\n🧪 Testando relatórios a partir da matriz:")
+
+    gerador, escala_completa = _gerar()
+    matriz = gerador.matriz_escala
+    resultado = True
+
+    for nome, metodo in [('Escala formatada', gerador.exportar_escala_formatada),
+                         ('Resumo estatístico', gerador.gerar_resumo_estatisticas),
+                         ('Relatório de plantões', gerador.gerar_relatorio_plantoes)]:
+        ok = iguais(metodo(matriz), metodo(escala_completa))
+        resultado = resultado and ok
+        print(f"   {'✅' if ok else '❌'} {nome}")
+    return resultado
+
+if __name__ == "__main__":
+    print("INICIANDO TESTE DA MATRIZ DE ESCALA")
+    print("=" * 80)
+
+    resultado = testar_acesso_e_fatias()
+    resultado = testar_relatorios() and resultado
+
+    print("\n" + "=" * 80)
+    print("✅ TESTE CONCLUÍDO" if resultado else "❌ TESTE FALHOU")
+    print("=" * 80)
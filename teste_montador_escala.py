@@ -0,0 +1,75 @@
+"""
+Teste do Montador de Escala
+===========================
+
+Verifica se a escala completa é montada de uma só vez a partir das colunas
+pré-alocadas e se o controle 6x1 fica em uma tabela separada, com uma linha
+por colaborador.
+"""
+
+import time
+from datetime import date
+import pandas as pd
+from dados_teste import colaboradores_teste
+from escala_generator import GeradorEscala, MontadorEscala
+
+def _colaboradores(quantidade):
+    return colaboradores_teste(quantidade, ['M44', 'T40', 'M6X1', 'P_D', 'I_N', 'N6X1'],
+                               Ultimo_Domingo_Folga=['', '18/05/2025'])
+
+def testar_montagem():
+    """Compara a montagem em lote com a geração individual."""
+    print("🧪 Testando montagem da escala:")
+
+    gerador = GeradorEscala(date(2025, 6, 1), date(2025, 6, 30), pd.DataFrame())
+    df_colaboradores = _colaboradores(12)
+    escala = gerador.gerar_escala_completa(df_colaboradores)
+
+    ok = len(escala) == 12 * 30 and list(escala.columns) == [
+        'Nome', 'Cargo', 'Tipo_Escala', 'Turno', 'Data', 'Status', 'Status_Colorido']
+    resultado = ok
+    print(f"   {'✅' if ok else '❌'} {len(escala)} linhas, colunas {list(escala.columns)}")
+
+    individuais = [gerador._gerar_escala_colaborador(colaborador) for _, colaborador in df_colaboradores.iterrows()]
+    esperado = pd.concat(individuais, ignore_index=True)
+    ok = all((escala[coluna].astype(str) == esperado[coluna].astype(str)).all()
+             for coluna in escala.columns)
+    resultado = resultado and ok
+    print(f"   {'✅' if ok else '❌'} Montagem em lote igual à geração individual")
+
+    controle = gerador.controle_6x1
+    ok = len(controle) == 12 and list(controle.columns[-3:]) == MontadorEscala.COLUNAS_CONTROLE
+    resultado = resultado and ok
+    print(f"   {'✅' if ok else '❌'} Controle 6x1 com {len(controle)} linhas (uma por colaborador)")
+
+    ok = all(gerador._dados_completos[coluna].equals(esperado[coluna])
+             for coluna in MontadorEscala.COLUNAS_CONTROLE)
+    resultado = resultado and ok
+    print(f"   {'✅' if ok else '❌'} Colunas de controle repetidas por dia quando solicitadas")
+    return resultado
+
+def testar_desempenho():
+    """Mede a montagem de um quadro grande."""
+    print("\n🧪 Testando desempenho da montagem:")
+
+    gerador = GeradorEscala(date(2025, 1, 1), date(2025, 12, 31), pd.DataFrame())
+    df_colaboradores = _colaboradores(2000)
+
+    inicio = time.perf_counter()
+    escala = gerador.gerar_escala_completa(df_colaboradores)
+    tempo = time.perf_counter() - inicio
+
+    ok = len(escala) == 2000 * 365
+    print(f"   {'✅' if ok else '❌'} {len(escala):,} linhas em {tempo:.2f}s")
+    return ok
+
+if __name__ == "__main__":
+    print("INICIANDO TESTE DO MONTADOR DE ESCALA")
+    print("=" * 80)
+
+    resultado = testar_montagem()
+    resultado = testar_desempenho() and resultado
+
+    print("\n" + "=" * 80)
+    print("✅ TESTE CONCLUÍDO" if resultado else "❌ TESTE FALHOU")
+    print("=" * 80)
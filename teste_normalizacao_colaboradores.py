@@ -0,0 +1,120 @@
+"""
+Teste da Normalização dos Colaboradores
+=======================================
+
+Verifica a conversão vetorizada dos campos de data e de exceções em colunas
+tipadas (um formato de data por coluna), o registro dos valores rejeitados e a
+equivalência com a conversão linha a linha usada anteriormente pelo gerador.
+"""
+
+import random
+import time
+from datetime import date
+import numpy as np
+import pandas as pd
+from calendario import Calendario
+from diagnosticos import ColetorDiagnosticos
+from normalizacao_colaboradores import COLUNA_REJEICOES, normalizado as ja_normalizado, normalizar_colaboradores
+from regras_clt import RegrasCLT
+
+def testar_colunas_tipadas():
+    """Converte datas em vários formatos e registra os valores inválidos."""
+    print("🧪 Testando colunas tipadas e rejeições:")
+
+    df = pd.DataFrame({
+        'Nome': ['Ana', 'Bruno', 'Carla'],
+        'Ultimo_Domingo_Folga': ['25/05/2025', 'data ruim', pd.Timestamp('2025-05-18')],
+        'Ultimo_Plantao_Mes_Anterior': ['29-02-2024', '', None],
+        'Atestados': ['15/06/2025, 2025-06-20', 'lixo', ''],
+        'Ferias': ['10/06/2025-20/06/2025', '', 'sem período'],
+        'Semanas_Sem_Domingo': ['3', 'x', ''],
+    }, index=[10, 20, 30])
+    diagnosticos = ColetorDiagnosticos()
+    normalizado = normalizar_colaboradores(df, diagnosticos)
+
+    resultado = True
+    ok = (normalizado['Ultimo_Domingo_Folga'].dt.date.tolist()[::2] == [date(2025, 5, 25), date(2025, 5, 18)]
+          and normalizado['Ultimo_Plantao_Mes_Anterior'].isna().tolist() == [False, True, True])
+    resultado = resultado and ok
+    print(f"   {'✅' if ok else '❌'} Datas convertidas em datetime64 (NaT se vazio ou inválido)")
+
+    # Atestados em DD/MM/AAAA: o texto em AAAA-MM-DD da mesma coluna é rejeitado
+    ok = (normalizado.loc[10, 'Atestados'] == ((date(2025, 6, 15), date(2025, 6, 15)),)
+          and normalizado.loc[10, 'Ferias'] == ((date(2025, 6, 10), date(2025, 6, 20)),)
+          and normalizado.loc[30, 'Escalas_Manuais'] == ())
+    resultado = resultado and ok
+    print(f"   {'✅' if ok else '❌'} Exceções convertidas em tuplas de períodos, no formato da coluna")
+
+    ok = normalizado['Semanas_Sem_Domingo'].tolist()[0] == 3 and str(normalizado['Semanas_Sem_Domingo'].dtype) == 'Int64'
+    resultado = resultado and ok
+    print(f"   {'✅' if ok else '❌'} Contadores convertidos em Int64")
+
+    esperado = [(('Atestados', '2025-06-20'),), (('Ultimo_Domingo_Folga', 'data ruim'), ('Semanas_Sem_Domingo', 'x'), ('Atestados', 'lixo')),
+                (('Ferias', 'sem período'),)]
+    ok = normalizado[COLUNA_REJEICOES].tolist() == esperado
+    resultado = resultado and ok
+    print(f"   {'✅' if ok else '❌'} Rejeições: {normalizado[COLUNA_REJEICOES].tolist()}")
+
+    avisos = [(aviso.dados['campo'], aviso.dados['formato'], aviso.dados['valores'])
+              for aviso in diagnosticos.filtrar(categoria='data_fora_do_formato')]
+    ok = avisos == [('Atestados', '%d/%m/%Y', ['2025-06-20'])]
+    resultado = resultado and ok
+    print(f"   {'✅' if ok else '❌'} Datas fora do formato da coluna avisadas: {avisos}")
+
+    ok = normalizar_colaboradores(normalizado) is normalizado and df['Atestados'][10] == '15/06/2025, 2025-06-20'
+    resultado = resultado and ok
+    print(f"   {'✅' if ok else '❌'} DataFrame original preservado e normalização idempotente")
+
+    # Uma coluna Rejeicoes vinda da planilha não marca o DataFrame como normalizado
+    com_coluna = df.assign(**{COLUNA_REJEICOES: 'observação da planilha'})
+    convertido = normalizar_colaboradores(com_coluna)
+    ok = (not ja_normalizado(com_coluna) and ja_normalizado(convertido) and ja_normalizado(convertido.iloc[1:])
+          and convertido[COLUNA_REJEICOES].tolist() == esperado
+          and convertido['Ultimo_Domingo_Folga'].dt.date.tolist()[0] == date(2025, 5, 25))
+    resultado = resultado and ok
+    print(f"   {'✅' if ok else '❌'} Normalização marcada em attrs, não pela coluna {COLUNA_REJEICOES}")
+    return resultado
+
+def testar_equivalencia_excecoes():
+    """As exceções normalizadas (em um formato por coluna) produzem a mesma escala que a conversão linha a linha."""
+    print("\n🧪 Testando equivalência com a conversão linha a linha:")
+
+    random.seed(3)
+    atestados = ['', '15/06/2025', '15/06/2025, 20/06/2025', '03/07/2025', '05/08/2025;06/08/2025', 'lixo', ' 1/6/2025 ']
+    ferias = ['', '10/06/2025-20/06/2025', '28/06/2025 - 05/07/2025', '20/06/2025-10/06/2025', 'ruim', '01/05/2025-03/06/2025']
+    df = pd.DataFrame({
+        'Nome': [f'Colaborador {i}' for i in range(3000)],
+        'Atestados': [random.choice(atestados) for _ in range(3000)],
+        'Ferias': [random.choice(ferias) for _ in range(3000)],
+        'Escalas_Manuais': [random.choice(atestados) for _ in range(3000)],
+    })
+
+    inicio = time.perf_counter()
+    normalizado = normalizar_colaboradores(df)
+    tempo = time.perf_counter() - inicio
+
+    regras = RegrasCLT()
+    calendario = Calendario(date(2025, 6, 1), date(2025, 7, 31))
+    base = np.zeros(len(calendario), dtype=np.uint8)
+    diferentes = 0
+    for original, convertido in zip(df.itertuples(), normalizado.itertuples()):
+        esperado = regras.aplicar_excecoes_vetorizado(base, calendario, original.Atestados, original.Ferias,
+                                                      original.Escalas_Manuais)
+        obtido = regras.aplicar_excecoes_normalizadas(base, calendario, convertido.Atestados, convertido.Ferias,
+                                                      convertido.Escalas_Manuais)
+        diferentes += not np.array_equal(esperado, obtido)
+
+    ok = diferentes == 0
+    print(f"   {'✅' if ok else '❌'} {len(df)} colaboradores normalizados em {tempo:.3f}s, {diferentes} divergências")
+    return ok
+
+if __name__ == "__main__":
+    print("INICIANDO TESTE DA NORMALIZAÇÃO DOS COLABORADORES")
+    print("=" * 80)
+
+    resultado = testar_colunas_tipadas()
+    resultado = testar_equivalencia_excecoes() and resultado
+
+    print("\n" + "=" * 80)
+    print("✅ TESTE CONCLUÍDO" if resultado else "❌ TESTE FALHOU")
+    print("=" * 80)
@@ -0,0 +1,152 @@
+"""
+Teste do Registro de Padrões de Escala
+======================================
+
+Verifica os padrões declarativos: o registro é a única fonte das regras dia a
+dia, os tipos originais (44H, 40H e plantões) seguem as regras de referência,
+e as escalas rotativas (12x36, 24x72, 5x2 e 4x2), definidas
+apenas por dados, respeitam o ciclo, a âncora e o tratamento de feriados.
+"""
+
+import time
+from datetime import date, timedelta
+import pandas as pd
+from calendario import Calendario
+from escala_generator import GeradorEscala
+from padroes_escala import PADROES_ESCALA, PadraoEscala
+from regras_clt import RegrasCLT
+from status_escala import decodificar_status
+
+def testar_tipos_originais():
+    """Confere os tipos originais contra as regras de referência, dia a dia."""
+    print("🧪 Testando tipos originais:")
+
+    regras = RegrasCLT()
+    data_inicio = date(2025, 5, 15)
+    data_fim = date(2025, 8, 10)
+    feriados = [date(2025, 6, 19), date(2025, 7, 5)]
+
+    resultado = list(regras.tipos_escala) == list(PADROES_ESCALA)
+    print(f"   {'✅' if resultado else '❌'} Tipos de escala vindos apenas do registro")
+
+    for tipo in ('M44', 'T44', 'N44', 'M40', 'T40', 'N40', 'P_D', 'P_N', 'I_D', 'I_N'):
+        escala = regras.gerar_escala_base(tipo, data_inicio, data_fim, feriados, date(2025, 5, 14))
+        padrao = PADROES_ESCALA[tipo]
+
+        # Referência: semana de segunda a sexta com feriados, ou plantão pela paridade do dia do mês
+        esperado = {}
+        data_atual = data_inicio
+        while data_atual <= data_fim:
+            if padrao.ancora == 'semana':
+                if data_atual.weekday() >= 5:
+                    esperado[data_atual] = 'FOLGA'
+                elif data_atual in feriados:
+                    esperado[data_atual] = 'FERIADO'
+                else:
+                    esperado[data_atual] = padrao.status_trabalho
+            else:
+                trabalha = data_atual.day % 2 == (0 if tipo.startswith('P') else 1)
+                esperado[data_atual] = padrao.status_trabalho if trabalha else 'FOLGA'
+            data_atual += timedelta(days=1)
+
+        ok = escala == esperado
+        resultado = resultado and ok
+        print(f"   {'✅' if ok else '❌'} {tipo}")
+    return resultado
+
+def testar_ciclos_rotativos():
+    """Confere o ciclo das escalas rotativas a partir do último plantão."""
+    print("\n🧪 Testando escalas rotativas:")
+
+    regras = RegrasCLT()
+    data_inicio = date(2025, 6, 1)
+    data_fim = date(2025, 6, 30)
+    feriados = [date(2025, 6, 19)]
+
+    resultado = True
+    casos = [
+        ('D12X36', date(2025, 5, 31), 2),
+        ('24X72', date(2025, 5, 30), 4),
+        ('M5X2', None, 7),
+        ('N4X2', date(2025, 5, 29), 6),
+    ]
+    for tipo, ultimo_plantao, tamanho_ciclo in casos:
+        escala = regras.gerar_escala_base(tipo, data_inicio, data_fim, feriados, ultimo_plantao)
+        padrao = PADROES_ESCALA[tipo]
+
+        # Referência dia a dia: o último plantão é o último dia de trabalho do ciclo
+        ultima_posicao_trabalho = len(padrao.ciclo) - 1 - padrao.ciclo[::-1].index(1)
+        inicio_ciclo = ultimo_plantao - timedelta(days=ultima_posicao_trabalho) if ultimo_plantao else data_inicio
+        esperado = {}
+        data_atual = data_inicio
+        while data_atual <= data_fim:
+            trabalha = padrao.ciclo[(data_atual - inicio_ciclo).days % tamanho_ciclo]
+            if trabalha and data_atual in feriados and padrao.feriado == 'feriado':
+                esperado[data_atual] = 'FERIADO'
+            else:
+                esperado[data_atual] = padrao.status_trabalho if trabalha else 'FOLGA'
+            data_atual += timedelta(days=1)
+
+        ok = escala == esperado
+        resultado = resultado and ok
+        dias_trabalho = sum(1 for status in escala.values() if status.startswith('TRABALHO'))
+        print(f"   {'✅' if ok else '❌'} {tipo}: ciclo {padrao.ciclo}, {dias_trabalho} dias de trabalho em junho")
+
+    # 12x36 com último plantão em 31/05: trabalha em 02/06, folga em 01/06
+    escala = regras.gerar_escala_base('D12X36', data_inicio, data_fim, feriados, date(2025, 5, 31))
+    ok = escala[date(2025, 6, 1)] == 'FOLGA' and escala[date(2025, 6, 2)] == 'TRABALHO_DIA'
+    resultado = resultado and ok
+    print(f"   {'✅' if ok else '❌'} 12x36 continua o ciclo do mês anterior")
+    return resultado
+
+def testar_padrao_novo():
+    """Um tipo de escala novo definido apenas por dados."""
+    print("\n🧪 Testando padrão definido por dados:")
+
+    padrao = PadraoEscala('M3X3', "3x3 - Manhã", 'TRABALHO_MANHA', (1, 1, 1, 0, 0, 0), 'ciclo')
+    calendario = Calendario(date(2025, 1, 1), date(2034, 12, 31))
+
+    inicio = time.perf_counter()
+    status = padrao.gerar(calendario)
+    duracao = time.perf_counter() - inicio
+
+    ok = list(decodificar_status(status[:7])) == ['TRABALHO_MANHA'] * 3 + ['FOLGA'] * 3 + ['TRABALHO_MANHA']
+    print(f"   {'✅' if ok else '❌'} {padrao}: {len(status)} dias gerados em {duracao * 1000:.2f}ms")
+
+    try:
+        PadraoEscala('X', "Inválido", 'TRABALHO_MANHA', (1, 0), 'semana')
+        ok = False
+    except ValueError as erro:
+        print(f"   ✅ Padrão inválido rejeitado: {erro}")
+    return ok
+
+def testar_gerador_rotativo():
+    """Gera escalas rotativas pelo gerador completo."""
+    print("\n🧪 Testando gerador com escalas rotativas:")
+
+    df_colaboradores = pd.DataFrame([
+        {'Nome': 'Ana Lima', 'Cargo': 'Enfermeira', 'Tipo_Escala': 'N12X36', 'Turno': 'Noite',
+         'Ultimo_Plantao_Mes_Anterior': '31/05/2025'},
+        {'Nome': 'Bruno Alves', 'Cargo': 'Bombeiro', 'Tipo_Escala': '24X72', 'Turno': 'Dia',
+         'Ultimo_Plantao_Mes_Anterior': '29/05/2025'},
+    ])
+    gerador = GeradorEscala(date(2025, 6, 1), date(2025, 6, 30), pd.DataFrame())
+    escala = gerador.gerar_escala_completa(df_colaboradores)
+
+    trabalho = escala[escala['Status'].str.startswith('TRABALHO')].groupby('Nome')['Data'].min()
+    ok = trabalho['Ana Lima'] == date(2025, 6, 2) and trabalho['Bruno Alves'] == date(2025, 6, 2)
+    print(f"   {'✅' if ok else '❌'} Primeiros plantões: {trabalho.to_dict()}")
+    return ok
+
+if __name__ == "__main__":
+    print("INICIANDO TESTE DOS PADRÕES DE ESCALA")
+    print("=" * 80)
+
+    resultado = testar_tipos_originais()
+    resultado = testar_ciclos_rotativos() and resultado
+    resultado = testar_padrao_novo() and resultado
+    resultado = testar_gerador_rotativo() and resultado
+
+    print("\n" + "=" * 80)
+    print("✅ TESTE CONCLUÍDO" if resultado else "❌ TESTE FALHOU")
+    print("=" * 80)
@@ -0,0 +1,199 @@
+"""
+Teste da Planilha de Exceções
+=============================
+
+Verifica a leitura da tabela longa de exceções (aba 'Excecoes' da planilha de
+colaboradores), a junção com os colaboradores por Nome ou Id e a geração da
+escala com as exceções da tabela (completa, incremental e em lotes),
+equivalente às mesmas exceções informadas nos campos de cada colaborador.
+"""
+
+import io
+import random
+import time
+from datetime import date, datetime, timedelta
+import numpy as np
+import pandas as pd
+from calendario import Calendario
+from dados_teste import colaboradores_teste
+from diagnosticos import ColetorDiagnosticos
+from escala_generator import GeradorEscala
+from excecoes_escala import TipoExcecao, aplicar_intervalos_lote, juntar_excecoes, normalizar_tabela_excecoes
+from excel_utils import ler_planilha_colaboradores, ler_planilha_excecoes
+
+def _colaboradores(quantidade, Atestados='', Ferias='', Escalas_Manuais=''):
+    return colaboradores_teste(quantidade, ['M44', 'T40', 'M6X1', 'P_D', 'D12X36', 'TIPO_INVALIDO'],
+                               Atestados=Atestados, Ferias=Ferias, Escalas_Manuais=Escalas_Manuais,
+                               Ultimo_Plantao_Mes_Anterior='', Ultimo_Domingo_Folga='')
+
+def _planilha(colaboradores, excecoes=None):
+    arquivo = io.BytesIO()
+    with pd.ExcelWriter(arquivo) as escritor:
+        colaboradores.to_excel(escritor, sheet_name='Colaboradores', index=False)
+        if excecoes is not None:
+            excecoes.to_excel(escritor, sheet_name='Excecoes', index=False)
+    arquivo.seek(0)
+    return arquivo
+
+def testar_leitura():
+    """Lê a aba de exceções e registra as linhas inválidas."""
+    print("🧪 Testando leitura da aba de exceções:")
+
+    excecoes = pd.DataFrame([
+        {'Nome': 'Colaborador 0', 'Tipo': 'Atestado', 'Inicio': '05/06/2025', 'Fim': ''},
+        {'Nome': 'Colaborador 1', 'Tipo': 'Férias', 'Inicio': '10/06/2025', 'Fim': '20/06/2025'},
+        {'Nome': 'Colaborador 2', 'Tipo': 'Escala_Manual', 'Inicio': '12/06/2025', 'Fim': '13/06/2025'},
+        {'Nome': 'Colaborador 3', 'Tipo': 'Folga', 'Inicio': '05/06/2025', 'Fim': ''},
+        {'Nome': 'Colaborador 4', 'Tipo': 'Atestado', 'Inicio': '31/02/2025', 'Fim': ''},
+        {'Nome': 'Colaborador 5', 'Tipo': 'Atestado', 'Inicio': '2025-06-07', 'Fim': ''},
+    ])
+    arquivo = _planilha(_colaboradores(6), excecoes)
+    diagnosticos = ColetorDiagnosticos()
+    tabela = ler_planilha_excecoes(arquivo, diagnosticos)
+
+    resultado = True
+    ok = (tabela['Tipo'].tolist() == [TipoExcecao.ATESTADO, TipoExcecao.FERIAS, TipoExcecao.ESCALA_MANUAL]
+          and tabela['Fim'].dt.date.tolist() == [date(2025, 6, 5), date(2025, 6, 20), date(2025, 6, 13)])
+    resultado = resultado and ok
+    print(f"   {'✅' if ok else '❌'} {len(tabela)} exceções lidas (Fim vazio = um único dia)")
+
+    # Datas do Excel (células de data) e Id lido como float por causa de células vazias
+    arquivo = _planilha(_colaboradores(6).assign(Id=range(1, 7)), pd.DataFrame({
+        'Id': [1, 2, None], 'Tipo': ['Férias', 'Atestado', 'Atestado'],
+        'Inicio': [datetime(2025, 6, 10), datetime(2025, 6, 3), datetime(2025, 6, 4)],
+        'Fim': [datetime(2025, 6, 20), None, None]}))
+    bruta = pd.read_excel(arquivo, sheet_name='Excecoes')
+    juntas, desconhecidas = juntar_excecoes(pd.DataFrame({'Id': [2, 1]}), bruta)
+    ok = (bruta['Id'].dtype == float and juntas['Linha'].tolist() == [1, 0] and not desconhecidas
+          and juntas['Tipo'].tolist() == [TipoExcecao.FERIAS, TipoExcecao.ATESTADO]
+          and juntas['Fim'].dt.date.tolist() == [date(2025, 6, 20), date(2025, 6, 3)])
+    resultado = resultado and ok
+    print(f"   {'✅' if ok else '❌'} Aba sem normalizar com datas do Excel e Id numérico ligada aos colaboradores")
+
+    # Aba padrão com Id e Nome: junção pela chave que o cadastro tem, com preferência pelo Id
+    planilha_chaves = _planilha(_colaboradores(2), pd.DataFrame({
+        'Id': [7, None, 9], 'Nome': ['Colaborador 1', 'Colaborador 0', ''], 'Tipo': 'Atestado',
+        'Inicio': ['03/06/2025', '04/06/2025', '05/06/2025'], 'Fim': ''}))
+    com_id_e_nome = ler_planilha_excecoes(planilha_chaves, ColetorDiagnosticos())
+    so_nome, desconhecidas_nome = juntar_excecoes(_colaboradores(2), com_id_e_nome)
+    com_id, desconhecidas_id = juntar_excecoes(_colaboradores(2).assign(Id=[7, 8]), com_id_e_nome)
+    gerador = GeradorEscala(date(2025, 6, 1), date(2025, 6, 30), pd.DataFrame())
+    matriz = gerador.gerar_matriz_escala(_colaboradores(2), excecoes=com_id_e_nome)
+    ok = (list(com_id_e_nome.columns[:2]) == ['Id', 'Nome'] and len(com_id_e_nome) == 3
+          and so_nome['Linha'].tolist() == [1, 0] and desconhecidas_nome == ['9']
+          and com_id['Linha'].tolist() == [0, 0] and desconhecidas_id == ['9']
+          and matriz.status_em('Colaborador 1', date(2025, 6, 3)) == TipoExcecao.ATESTADO.status)
+    resultado = resultado and ok
+    print(f"   {'✅' if ok else '❌'} Aba com Id e Nome ligada a cadastro só com Nome (ou pelo Id, se houver)")
+
+    avisos = diagnosticos.filtrar(categoria='excecao_invalida')
+    fora_do_formato = [aviso.dados['valores'] for aviso in diagnosticos.filtrar(categoria='data_fora_do_formato')]
+    ok = len(avisos) == 1 and avisos[0].dados['linhas'] == [5, 6, 7] and fora_do_formato == [['2025-06-07']]
+    resultado = resultado and ok
+    print(f"   {'✅' if ok else '❌'} Linhas inválidas avisadas com a numeração do Excel (data fora do formato da coluna: "
+          f"{fora_do_formato})")
+
+    # A leitura da aba de exceções não interfere na leitura dos colaboradores
+    ok = len(ler_planilha_colaboradores(arquivo, ColetorDiagnosticos())) == 6
+    ok = ok and ler_planilha_excecoes(_planilha(_colaboradores(6)), ColetorDiagnosticos()) is None
+    resultado = resultado and ok
+    print(f"   {'✅' if ok else '❌'} Planilha sem a aba de exceções retorna None")
+    return resultado
+
+def testar_geracao():
+    """Exceções da tabela equivalem às mesmas exceções nos campos dos colaboradores."""
+    print("\n🧪 Testando geração com a tabela de exceções:")
+
+    random.seed(3)
+    quantidade = 120
+    atestados = [f'{random.randint(1, 30):02d}/06/2025' if i % 2 else '' for i in range(quantidade)]
+    ferias = ['10/06/2025-20/06/2025' if i % 3 == 0 else '' for i in range(quantidade)]
+    manuais = ['12/06/2025' if i % 4 == 0 else '' for i in range(quantidade)]
+
+    excecoes = pd.DataFrame(
+        [{'Nome': f'Colaborador {i}', 'Tipo': 'Atestado', 'Inicio': texto, 'Fim': ''}
+         for i, texto in enumerate(atestados) if texto]
+        + [{'Nome': f'Colaborador {i}', 'Tipo': 'Ferias', 'Inicio': '10/06/2025', 'Fim': '20/06/2025'}
+           for i, texto in enumerate(ferias) if texto]
+        + [{'Nome': f'Colaborador {i}', 'Tipo': 'Escala Manual', 'Inicio': '12/06/2025', 'Fim': ''}
+           for i, texto in enumerate(manuais) if texto]
+        + [{'Nome': 'Fulano', 'Tipo': 'Atestado', 'Inicio': '12/06/2025', 'Fim': ''}]
+    )
+
+    periodo = (date(2025, 6, 1), date(2025, 6, 30))
+    nos_campos = GeradorEscala(*periodo, pd.DataFrame()).gerar_matriz_escala(
+        _colaboradores(quantidade, Atestados=atestados, Ferias=ferias, Escalas_Manuais=manuais))
+
+    resultado = True
+    for processos in (1, 2):
+        gerador = GeradorEscala(*periodo, pd.DataFrame())
+        na_tabela = gerador.gerar_matriz_escala(_colaboradores(quantidade), processos, 40, excecoes=excecoes)
+        ok = np.array_equal(na_tabela.status, nos_campos.status)
+        resultado = resultado and ok
+        print(f"   {'✅' if ok else '❌'} Escala igual à das exceções nos campos ({processos} processo(s))")
+
+    avisos = gerador.diagnosticos.filtrar(categoria='excecao_sem_colaborador')
+    ok = len(avisos) == 1 and avisos[0].dados['chaves'] == ['Fulano']
+    resultado = resultado and ok
+    print(f"   {'✅' if ok else '❌'} Exceções sem colaborador correspondente avisadas")
+
+    # Geração em lotes: tabela ligada uma vez ao cadastro inteiro
+    gerador = GeradorEscala(*periodo, pd.DataFrame())
+    lotes = list(gerador.iter_escala(_colaboradores(quantidade), tamanho_lote=25, excecoes=excecoes))
+    completa = GeradorEscala(*periodo, pd.DataFrame()).gerar_escala_completa(
+        _colaboradores(quantidade, Atestados=atestados, Ferias=ferias, Escalas_Manuais=manuais))
+    ok = (pd.concat(lotes, ignore_index=True).astype(str).equals(completa.astype(str))
+          and len(gerador.diagnosticos.filtrar(categoria='excecao_sem_colaborador')) == 1)
+    resultado = resultado and ok
+    print(f"   {'✅' if ok else '❌'} Geração em {len(lotes)} lotes igual à geração completa")
+
+    # Atualização incremental: só a tabela de exceções muda
+    gerador = GeradorEscala(*periodo, pd.DataFrame())
+    ok = gerador.atualizar(_colaboradores(quantidade), excecoes).astype(str).equals(completa.astype(str))
+    alteradas = pd.concat([excecoes, pd.DataFrame([{'Nome': 'Colaborador 7', 'Tipo': 'Ferias',
+                                                    'Inicio': '01/06/2025', 'Fim': '05/06/2025'}])])
+    atualizada = gerador.atualizar(_colaboradores(quantidade), alteradas)
+    esperada = GeradorEscala(*periodo, pd.DataFrame()).gerar_escala_completa(_colaboradores(quantidade),
+                                                                             excecoes=alteradas)
+    ok = ok and atualizada.astype(str).equals(esperada.astype(str))
+    ok = ok and gerador.estatisticas_execucao['recalculados'] == 1
+    resultado = resultado and ok
+    print(f"   {'✅' if ok else '❌'} Atualização incremental recalcula apenas o colaborador com exceção alterada")
+    return resultado
+
+def testar_lote():
+    """Junção e aplicação de dezenas de milhares de exceções de uma só vez."""
+    print("\n🧪 Testando junção e aplicação em lote:")
+
+    rng = np.random.default_rng(9)
+    calendario = Calendario(date(2025, 6, 1), date(2025, 6, 30))
+    colaboradores = pd.DataFrame({'Id': np.arange(5000)})
+    dias = [date(2025, 5, 25) + timedelta(days=int(d)) for d in rng.integers(0, 40, 50000)]
+    excecoes = pd.DataFrame({'Id': rng.integers(0, 5000, 50000), 'Tipo': 'Atestado',
+                             'Inicio': [f'{dia:%d/%m/%Y}' for dia in dias], 'Fim': ''})
+
+    inicio = time.perf_counter()
+    tabela, desconhecidas = juntar_excecoes(colaboradores, normalizar_tabela_excecoes(excecoes)[0])
+    status = aplicar_intervalos_lote(np.zeros((5000, len(calendario)), dtype=np.uint8), calendario, tabela)
+    tempo = time.perf_counter() - inicio
+
+    esperado = np.zeros_like(status)
+    for identificador, dia in zip(excecoes['Id'], dias):
+        if calendario.data_inicio <= dia <= calendario.data_fim:
+            esperado[identificador, (dia - calendario.data_inicio).days] = TipoExcecao.ATESTADO.status
+    ok = np.array_equal(status, esperado) and not desconhecidas
+    print(f"   {'✅' if ok else '❌'} {len(excecoes)} atestados de {len(colaboradores)} colaboradores "
+          f"juntados e aplicados em {tempo:.3f}s")
+    return ok
+
+if __name__ == "__main__":
+    print("INICIANDO TESTE DA PLANILHA DE EXCEÇÕES")
+    print("=" * 80)
+
+    resultado = testar_leitura()
+    resultado = testar_geracao() and resultado
+    resultado = testar_lote() and resultado
+
+    print("\n" + "=" * 80)
+    print("✅ TESTE CONCLUÍDO" if resultado else "❌ TESTE FALHOU")
+    print("=" * 80)
@@ -0,0 +1,76 @@
+"""
+Teste do Plantão em Forma Fechada
+=================================
+
+Compara a escala de plantão gerada em uma única passada (viradas de meses
+com 31 dias acumuladas) com a geração mês a mês, em um horizonte de 5 anos,
+e mede a geração em lote de muitos plantonistas.
+"""
+
+import time
+from datetime import date, timedelta
+from calendario import Calendario
+from regras_clt import RegrasCLT
+from status_escala import decodificar_status
+
+def gerar_mes_a_mes(regras, tipo_atual, data_inicio, data_fim):
+    """Geração de referência: um mês por vez, alternando após meses de 31 dias."""
+    status = []
+    tipos = [tipo_atual]
+    data_atual = data_inicio
+    while data_atual <= data_fim:
+        ultimo_dia_mes = (data_atual.replace(day=1) + timedelta(days=32)).replace(day=1) - timedelta(days=1)
+        fim_periodo = min(ultimo_dia_mes, data_fim)
+        status.extend(regras.gerar_escala_base(tipo_atual, data_atual, fim_periodo, []).values())
+        data_atual = fim_periodo + timedelta(days=1)
+        if data_atual <= data_fim and ultimo_dia_mes.day == 31:
+            tipo_atual = regras.determinar_tipo_plantao_automatico(fim_periodo, tipo_atual)
+            tipos.append(tipo_atual)
+    return status, tipos
+
+def testar_horizonte_5_anos():
+    """Verifica a equivalência com a geração mês a mês."""
+    print("🧪 Testando plantão em forma fechada (5 anos):")
+
+    regras = RegrasCLT()
+    data_inicio = date(2025, 1, 10)
+    data_fim = date(2029, 12, 31)
+    calendario = Calendario(data_inicio, data_fim)
+
+    resultado = True
+    for tipo in ['P_D', 'P_N', 'I_D', 'I_N']:
+        status, tipos, mudancas = regras.gerar_plantao_vetorizado(tipo, calendario)
+        status_ref, tipos_ref = gerar_mes_a_mes(regras, tipo, data_inicio, data_fim)
+        ok = list(decodificar_status(status)) == status_ref and list(tipos) == tipos_ref
+        resultado = resultado and ok
+        print(f"   {'✅' if ok else '❌'} {tipo}: {len(status)} dias, {len(mudancas)} mudanças de tipo")
+
+    return resultado
+
+def testar_lote_plantonistas():
+    """Gera 10 mil plantonistas de uma só vez."""
+    print("\n🧪 Testando lote de plantonistas:")
+
+    regras = RegrasCLT()
+    calendario = Calendario(date(2025, 1, 1), date(2029, 12, 31))
+    tipos = ['P_D', 'P_N', 'I_D', 'I_N'] * 2500
+
+    inicio = time.perf_counter()
+    matriz = regras.gerar_plantoes_lote(tipos, calendario)
+    duracao = time.perf_counter() - inicio
+
+    status_p_d, _, _ = regras.gerar_plantao_vetorizado('P_D', calendario)
+    ok = matriz.shape == (len(tipos), len(calendario)) and list(matriz[4]) == list(status_p_d)
+    print(f"   {'✅' if ok else '❌'} Matriz {matriz.shape[0]} × {matriz.shape[1]} gerada em {duracao:.2f}s")
+    return ok
+
+if __name__ == "__main__":
+    print("INICIANDO TESTE DO PLANTÃO EM FORMA FECHADA")
+    print("=" * 80)
+
+    resultado = testar_horizonte_5_anos()
+    resultado = testar_lote_plantonistas() and resultado
+
+    print("\n" + "=" * 80)
+    print("✅ TESTE CONCLUÍDO" if resultado else "❌ TESTE FALHOU")
+    print("=" * 80)
@@ -0,0 +1,68 @@
+"""
+Teste dos Códigos de Status
+===========================
+
+Verifica os códigos uint8 de status (ida e volta entre códigos e rótulos) e
+a escala completa com colunas categóricas, comparando a memória ocupada com
+a mesma escala em colunas de texto.
+"""
+
+from datetime import date
+import numpy as np
+import pandas as pd
+from escala_generator import GeradorEscala
+from status_escala import ROTULOS_STATUS, StatusEscala, codificar_status, decodificar_status
+
+def testar_codigos():
+    """Testa a conversão entre códigos e rótulos."""
+    print("🧪 Testando códigos de status:")
+
+    codigos = codificar_status(ROTULOS_STATUS)
+    resultado = (
+        codigos.dtype == np.uint8
+        and list(decodificar_status(codigos)) == list(ROTULOS_STATUS)
+        and StatusEscala.FERIAS.rotulo == 'FÉRIAS'
+        and list(ROTULOS_STATUS) == sorted(ROTULOS_STATUS)
+    )
+    print(f"   {'✅' if resultado else '❌'} {len(ROTULOS_STATUS)} status, códigos em ordem alfabética dos rótulos")
+    return resultado
+
+def testar_memoria_escala():
+    """Compara a memória da escala categórica com a escala em texto."""
+    print("\n🧪 Testando memória da escala completa:")
+
+    tipos = ['M44', 'N6X1', 'P_D', 'I_N']
+    df_colaboradores = pd.DataFrame([{
+        'Nome': f'Colaborador {i:03d}',
+        'Cargo': 'Técnico',
+        'Tipo_Escala': tipos[i % len(tipos)],
+        'Turno': 'Manhã',
+        'Ferias': '10/01/2025-20/01/2025' if i % 5 == 0 else ''
+    } for i in range(200)])
+
+    gerador = GeradorEscala(date(2025, 1, 1), date(2025, 6, 30), pd.DataFrame())
+    escala = gerador.gerar_escala_completa(df_colaboradores)
+    escala_texto = escala.astype({coluna: object for coluna in escala.columns})
+
+    memoria = escala.memory_usage(deep=True).sum()
+    memoria_texto = escala_texto.memory_usage(deep=True).sum()
+    categoricas = [coluna for coluna in escala.columns if isinstance(escala[coluna].dtype, pd.CategoricalDtype)]
+
+    print(f"   Colunas categóricas: {categoricas}")
+    print(f"   Memória: {memoria / 1e6:.2f} MB (texto: {memoria_texto / 1e6:.2f} MB, {memoria_texto / memoria:.1f}x)")
+
+    ferias = escala[(escala['Data'] == date(2025, 1, 15)) & (escala['Status'] == 'FÉRIAS')]
+    resultado = len(categoricas) == 6 and memoria < memoria_texto and len(ferias) == 40
+    print(f"   {'✅' if resultado else '❌'} Status decodificado na consulta: {len(ferias)} colaboradores de férias em 15/01")
+    return resultado
+
+if __name__ == "__main__":
+    print("INICIANDO TESTE DOS CÓDIGOS DE STATUS")
+    print("=" * 80)
+
+    resultado = testar_codigos()
+    resultado = testar_memoria_escala() and resultado
+
+    print("\n" + "=" * 80)
+    print("✅ TESTE CONCLUÍDO" if resultado else "❌ TESTE FALHOU")
+    print("=" * 80)
@@ -0,0 +1,70 @@
+"""
+Teste das Tabelas da Escala
+===========================
+
+Verifica a decomposição da escala em tabela de fatos diária e dimensão de
+colaboradores: relatórios a partir da tabela de fatos iguais aos do formato
+longo, remontagem da matriz e tamanho da tabela de fatos.
+"""
+
+from datetime import date
+import pandas as pd
+from dados_teste import colaboradores_teste
+from escala_generator import GeradorEscala
+from matriz_escala import COLUNA_ID, MatrizEscala
+
+def testar_tabelas():
+    """Gera fatos e dimensão e compara relatórios e tamanho com o formato longo."""
+    print("🧪 Testando tabela de fatos e dimensão de colaboradores:")
+
+    df_feriados = pd.DataFrame([{'Data': '19/06/2025', 'Descricao': 'Corpus Christi'}])
+    # Cinco nomes repetidos: a dimensão numera os colaboradores pela posição
+    df_colaboradores = colaboradores_teste(
+        500, ['M44', 'T40', 'M6X1', 'P_D', 'I_N', 'D12X36'], Nome=lambda i: f'Colaborador {i % 495}',
+        Atestados=['15/06/2025', '', '', ''], Ferias='', Escalas_Manuais='', Ultimo_Plantao_Mes_Anterior='',
+        Ultimo_Domingo_Folga='18/05/2025')
+    gerador = GeradorEscala(date(2025, 6, 1), date(2025, 8, 31), df_feriados)
+
+    escala_completa = gerador.gerar_escala_completa(df_colaboradores)
+    fatos, colaboradores = gerador.gerar_tabelas_escala(df_colaboradores)
+
+    resultado = True
+    ok = (list(fatos.columns) == [COLUNA_ID, 'Dia', 'Status'] and len(colaboradores) == 500
+          and len(fatos) == len(escala_completa) and colaboradores[COLUNA_ID].tolist() == list(range(500)))
+    resultado = resultado and ok
+    print(f"   {'✅' if ok else '❌'} {len(fatos)} fatos e {len(colaboradores)} colaboradores")
+
+    ok = gerador.gerar_resumo_estatisticas(fatos).equals(gerador.gerar_resumo_estatisticas(escala_completa))
+    resultado = resultado and ok
+    print(f"   {'✅' if ok else '❌'} Resumo estatístico pela tabela de fatos igual ao do formato longo")
+
+    ok = gerador.gerar_relatorio_plantoes(fatos).equals(gerador.gerar_relatorio_plantoes(escala_completa))
+    resultado = resultado and ok
+    print(f"   {'✅' if ok else '❌'} Relatório de plantões pela tabela de fatos igual ao do formato longo")
+
+    # Ordem das linhas da tabela de fatos não importa na remontagem
+    remontada = MatrizEscala.de_tabelas(fatos.sample(frac=1, random_state=1), colaboradores, gerador.calendario)
+    ok = (remontada.status == gerador.matriz_escala.status).all() \
+        and remontada.metadados.equals(gerador.matriz_escala.metadados)
+    resultado = resultado and ok
+    print(f"   {'✅' if ok else '❌'} Matriz remontada a partir das tabelas")
+
+    bytes_fatos = fatos.memory_usage(deep=True).sum()
+    bytes_longo = escala_completa.assign(**{
+        coluna: escala_completa[coluna].astype(object) for coluna in ['Nome', 'Cargo', 'Tipo_Escala', 'Turno']
+    }).memory_usage(deep=True).sum()
+    ok = bytes_fatos * 5 < bytes_longo
+    resultado = resultado and ok
+    print(f"   {'✅' if ok else '❌'} Tabela de fatos: {bytes_fatos / 1e6:.2f} MB "
+          f"(formato longo com textos: {bytes_longo / 1e6:.2f} MB)")
+    return resultado
+
+if __name__ == "__main__":
+    print("INICIANDO TESTE DAS TABELAS DA ESCALA")
+    print("=" * 80)
+
+    resultado = testar_tabelas()
+
+    print("\n" + "=" * 80)
+    print("✅ TESTE CONCLUÍDO" if resultado else "❌ TESTE FALHOU")
+    print("=" * 80)